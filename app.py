@@ -1,7 +1,8 @@
 # app.py
+import os
+
 import streamlit as st
-from pages.main import render_main_page
-from pages.report import render_report_by_id
+from backend.startup import first_route
 
 # 페이지 설정 (한 번만!)
 st.set_page_config(
@@ -21,12 +22,28 @@ if "id" in qp:                      # ✅ 키가 있는지 먼저 확인
     page_mode = "report_by_id"
 
 # 2) 모드에 따라 라우팅
+# 페이지 모듈은 그 경로를 처음 열 때 import 한다 (리포트 상세만 여는 pod 은 pandas 를 안 불러옴)
+# 경로별 첫 요청의 import / 첫 렌더링 시간은 backend.startup 에 기록 (디버그 패널)
 if page_mode == "main":
-    render_main_page()
+    with first_route("main") as route:
+        with route.phase("import"):
+            from pages.main import render_main_page
+        with route.phase("render"):
+            render_main_page()
 
 elif page_mode == "report_by_id":
     if not report_id:
         st.error("리포트 ID가 비어 있습니다. 예) /?id=1")
     else:
         # report_id는 문자열이므로 그대로 넘기면 됩니다.
-        render_report_by_id(report_id)
+        with first_route("report") as route:
+            with route.phase("import"):
+                from pages.report import render_report_by_id
+            with route.phase("render"):
+                render_report_by_id(report_id)
+
+# 3) 디버그 패널 (단계별 소요 시간)
+if "debug" in qp or os.environ.get("LOG_DEBUG_PANEL") == "1":
+    from backend.debug_panel import render_debug_panel
+
+    render_debug_panel()
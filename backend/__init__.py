@@ -0,0 +1,32 @@
+# backend/__init__.py
+"""
+로그 / 리포트 백엔드
+
+    from backend import get_lambda_logs, log_volume   # 로그 조회 (backend/logs.py)
+    from backend.reports import REPORT_REPOSITORY     # 리포트 저장소
+    from backend.render import report_sections        # 리포트 HTML
+
+- 로그 조회 쪽(backend/logs.py)은 pandas / pyarrow 를 쓰므로 처음 접근할 때 불러온다.
+  리포트 상세 경로처럼 로그를 안 쓰는 페이지는 pandas 없이 뜬다 (cold start 단축)
+- reports / render / styles / profiling / startup 모듈은 pandas 를 import 하지 않는다
+"""
+
+from __future__ import annotations
+
+import importlib
+from typing import Any, List
+
+
+def __getattr__(name: str) -> Any:
+    # from backend import X / backend.X → backend.logs 를 그때 import 해서 넘겨줌
+    if name.startswith("__"):
+        raise AttributeError(name)
+    logs = importlib.import_module(".logs", __name__)
+    try:
+        return getattr(logs, name)
+    except AttributeError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(dir(importlib.import_module(".logs", __name__))))
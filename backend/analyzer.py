@@ -0,0 +1,102 @@
+# backend/analyzer.py
+"""
+한글 검색 분석기 (리포트 전문 검색 / 로그 키워드 검색 공용)
+
+    normalize("ＳＥＳ  발송 실패")   # "ses 발송 실패"   NFKC(전각 → 반각, 호환 문자) + 소문자 + 공백 정리
+    compact("안전 관리")             # "안전관리"        normalize 후 공백 제거 (한글 검색어 매칭용)
+    strip_particle("안전관리를")     # "안전관리"        검색어 끝 조사 제거
+    analyze("안전관리 규정을 강화")   # 문서 토큰: 한글 음절 2-gram + 3-gram, 그 밖은 단어
+    query_tokens("안전관리")         # 검색어 토큰: 안전관, 전관리 (1음절 한글은 None)
+
+- 한글은 띄어쓰기가 제각각이고 조사가 붙으므로 공백으로 이어진 한글 구간을 붙여서 음절 n-gram 으로 자른다.
+  "안전관리" 와 "안전 관리" 가 같은 토큰을 만든다
+- 문서 토큰은 저장할 때 한 번만 만든다 (리포트: backend.reports 의 n-gram FTS 테이블).
+  검색할 때는 검색어만 분석한다
+- 조사 제거는 검색어에만 한다. 제거한 검색어는 원래 검색어의 앞부분이므로 찾는 범위가 넓어지기만 한다
+- pandas 를 import 하지 않는다
+"""
+
+from __future__ import annotations
+
+import re
+import unicodedata
+from typing import List, Optional
+
+# 공백으로 이어진 한글 음절 구간 ("안전 관리 규정")
+_HANGUL_RUN = re.compile(r"[가-힣]+(?:\s+[가-힣]+)*")
+_HANGUL = re.compile(r"[가-힣]")
+_WORD = re.compile(r"[^\W_]+")
+_SPACE = re.compile(r"\s+")
+
+# 검색어 끝에서 떼는 조사 (긴 것부터)
+PARTICLES = (
+    "으로부터", "에서부터", "로부터", "에게서", "이라는", "까지", "부터", "에서", "에게", "으로", "이나", "처럼",
+    "보다", "과", "와", "은", "는", "이", "가", "을", "를", "에", "의", "로", "도", "만",
+)
+# 조사를 떼고 남아야 하는 최소 음절 수 ("국가" 의 "가" 같은 2음절 단어 끝은 건드리지 않음)
+MIN_STEM = 2
+
+
+def normalize(text: str) -> str:
+    """NFKC + 소문자 + 연속 공백 하나로"""
+    text = unicodedata.normalize("NFKC", str(text)).lower()
+    return _SPACE.sub(" ", text).strip()
+
+
+def compact(text: str) -> str:
+    """normalize 후 공백 제거"""
+    return _SPACE.sub("", normalize(text))
+
+
+def has_hangul(text: str) -> bool:
+    return _HANGUL.search(text) is not None
+
+
+def strip_particle(term: str) -> str:
+    """한글로 끝나는 검색어 끝의 조사 하나를 뗌 (남는 음절이 MIN_STEM 미만이면 그대로)"""
+    match = re.search(r"[가-힣]+$", term)
+    if match is None:
+        return term
+    run = match.group()
+    for particle in PARTICLES:
+        if run.endswith(particle) and len(run) - len(particle) >= MIN_STEM:
+            return term[: len(term) - len(particle)]
+    return term
+
+
+def hangul_grams(run: str) -> List[str]:
+    """공백을 뺀 한글 구간의 음절 2-gram + 3-gram (1음절이면 그 음절 하나)"""
+    run = _SPACE.sub("", run)
+    if len(run) < 2:
+        return [run] if run else []
+    grams = [run[i:i + 2] for i in range(len(run) - 1)]
+    grams += [run[i:i + 3] for i in range(len(run) - 2)]
+    return grams
+
+
+def analyze(text: Optional[str]) -> List[str]:
+    """문서 토큰 (반복 포함 → 빈도가 순위 점수에 반영됨)"""
+    if not text:
+        return []
+    text = normalize(text)
+    tokens: List[str] = []
+    for run in _HANGUL_RUN.findall(text):
+        tokens.extend(hangul_grams(run))
+    tokens.extend(_WORD.findall(_HANGUL_RUN.sub(" ", text)))
+    return tokens
+
+
+def query_tokens(term: str) -> Optional[List[str]]:
+    """
+    검색어(이미 normalize 된 것) 하나의 토큰. 문서 토큰에 모두 들어 있어야 매칭 후보.
+    3음절 이상 한글 구간은 3-gram, 2음절은 2-gram. 1음절 한글 구간이 있으면 색인으로 찾을 수 없어 None
+    """
+    tokens: List[str] = []
+    for run in _HANGUL_RUN.findall(term):
+        run = _SPACE.sub("", run)
+        if len(run) < 2:
+            return None
+        n = 3 if len(run) >= 3 else 2
+        tokens.extend(run[i:i + n] for i in range(len(run) - n + 1))
+    tokens.extend(_WORD.findall(_HANGUL_RUN.sub(" ", term)))
+    return list(dict.fromkeys(tokens)) or None
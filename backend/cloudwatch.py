@@ -0,0 +1,255 @@
+# backend/cloudwatch.py
+"""
+CloudWatch Logs Insights 로그 소스
+
+날짜 범위는 startTime/endTime 으로, 레벨(status)/키워드는 Insights 쿼리의
+filter 절로 내려보내서 조건에 맞는 행만 받아온다.
+boto3 는 이 소스를 쓸 때만 필요하다 (requirements 에는 없음).
+"""
+
+from __future__ import annotations
+
+import time
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional, Sequence
+
+import pandas as pd
+
+from .dtypes import compact_frame, to_local_naive
+from .rollup import RESOLUTIONS
+from .search import match_term, parse_keyword, term_regex
+from .sources import LogQuerySpec, LogSchema, LogSource
+
+# 출력 컬럼 → Insights 필드
+# Lambda: JSON 로그 포맷(level / message / requestId), 함수명은 로그 그룹(/aws/lambda/<name>)에서 추출
+LAMBDA_FIELDS: Dict[str, str] = {
+    "timestamp": "@timestamp",
+    "function_name": "@log",
+    "level": "level",
+    "message": "message",
+    "request_id": "requestId",
+}
+
+# SES: EventBridge → CloudWatch Logs 로 보낸 SES 이벤트 (detail 아래 SES 이벤트 JSON)
+SES_FIELDS: Dict[str, str] = {
+    "timestamp": "@timestamp",
+    "mail_to": "detail.mail.destination.0",
+    "subject": "detail.mail.commonHeaders.subject",
+    "event_type": "detail.eventType",
+    "message_id": "detail.mail.messageId",
+}
+
+# SES status ↔ eventType (status 필터는 eventType 조건으로 바꿔서 내려보냄)
+SES_STATUS_BY_EVENT: Dict[str, str] = {
+    "Send": "DELIVERED",
+    "Delivery": "DELIVERED",
+    "Bounce": "BOUNCE",
+    "Complaint": "COMPLAINT",
+    "Reject": "REJECT",
+    "DeliveryDelay": "DELAYED",
+}
+
+
+# 해상도 → stats bin 크기. bin 은 UTC 기준이라 시간 / 일 버킷은 15분 단위로 받아 로컬 시각에서 다시 묶음
+# (30분 / 45분 오프셋 시간대도 버킷 경계가 맞도록)
+_VOLUME_BINS: Dict[str, str] = {"minute": "1m", "hour": "15m", "day": "15m"}
+
+
+def _quote(value: str) -> str:
+    return '"' + str(value).replace("\\", "\\\\").replace('"', '\\"') + '"'
+
+
+def _literal_regex(term: str, compact: bool = False) -> str:
+    """
+    리터럴 부분 문자열 → 대소문자 무시 Insights 정규식.
+    compact(한글 검색어)면 글자 사이 공백을 허용해서 메모리 검색처럼 띄어쓰기와 무관하게 매칭.
+    Logs Insights 는 NFKC 를 할 수 없어서 전각 / 호환 문자로 저장된 값은 찾지 못한다
+    """
+    return "/(?i)" + term_regex(term, compact).replace("/", "\\/") + "/"
+
+
+class CloudWatchLogSource(LogSource):
+    """
+    CloudWatch Logs Insights 소스.
+    start_query → get_query_results 폴링으로 결과를 받아 schema 컬럼의 DataFrame 으로 만든다.
+    """
+
+    def __init__(
+        self,
+        schema: LogSchema,
+        log_group_names: Sequence[str],
+        fields: Optional[Dict[str, str]] = None,
+        client: Any = None,
+        region_name: Optional[str] = None,
+        lookback: timedelta = timedelta(days=1),
+        limit: int = 10000,
+        poll_interval: float = 0.5,
+        timeout: float = 60.0,
+    ):
+        super().__init__(schema)
+        if client is None:
+            try:
+                import boto3
+            except ImportError as e:  # pragma: no cover - 선택 의존성
+                raise ImportError(
+                    "CloudWatchLogSource 를 사용하려면 boto3 가 필요합니다. (pip install boto3)"
+                ) from e
+            client = boto3.client("logs", region_name=region_name)
+
+        self.client = client
+        self.log_group_names = list(log_group_names)
+        self.fields = dict(fields or (LAMBDA_FIELDS if schema.kind == "lambda" else SES_FIELDS))
+        self.lookback = lookback
+        self.limit = limit
+        self.poll_interval = poll_interval
+        self.timeout = timeout
+
+    # ---------- 쿼리 생성 ----------
+    def _level_filter(self, spec: LogQuerySpec) -> Optional[str]:
+        if not spec.level_values:
+            return None
+        if self.schema.kind == "ses":
+            events = [e for e, s in SES_STATUS_BY_EVENT.items() if s in spec.level_values]
+            values = ", ".join(_quote(e) for e in events) or '""'
+            return f"filter {self.fields['event_type']} in [{values}]"
+        values = ", ".join(_quote(v) for v in spec.level_values)
+        return f"filter {self.fields[self.schema.level_col]} in [{values}]"
+
+    def _keyword_filter(self, spec: LogQuerySpec) -> Optional[str]:
+        query = parse_keyword(spec.keyword, mode=spec.keyword_mode)
+        if not query.terms:
+            return None
+        cols = [self.fields[c] for c in self.schema.search_cols if c in self.fields]
+        clauses = []
+        for term in query.terms:
+            regex = _literal_regex(*match_term(term))
+            clauses.append("(" + " or ".join(f"{f} like {regex}" for f in cols) + ")")
+        joiner = " and " if query.mode == "and" else " or "
+        return "filter " + joiner.join(clauses)
+
+    def _filters(self, spec: LogQuerySpec) -> List[str]:
+        return [c for c in (self._level_filter(spec), self._keyword_filter(spec)) if c]
+
+    def _row_limit(self, spec: LogQuerySpec) -> int:
+        """가져올 행 수 (페이지면 offset + limit 까지만)"""
+        if spec.limit is None:
+            return self.limit
+        return min(self.limit, spec.offset + spec.limit)
+
+    def build_query(self, spec: LogQuerySpec) -> str:
+        """spec → Logs Insights 쿼리 문자열"""
+        selected = ", ".join(f"{expr} as {col}" for col, expr in self.fields.items())
+        lines = [f"fields {selected}", *self._filters(spec)]
+        lines.append("sort @timestamp desc")
+        lines.append(f"limit {self._row_limit(spec)}")
+        return "\n| ".join(lines)
+
+    def build_volume_query(self, spec: LogQuerySpec, resolution: str = "minute") -> str:
+        """spec → bin × 집계 차원별 건수를 세는 Logs Insights 쿼리"""
+        dims = [self.fields[c] for c in self._volume_dims()]
+        by = ", ".join([f"bin({_VOLUME_BINS[resolution]})", *dims])
+        return "\n| ".join([*self._filters(spec), f"stats count(*) as count by {by}"])
+
+    def _volume_dims(self) -> List[str]:
+        # SES status 는 필드가 아니라 event_type 에서 만드는 값
+        return [c for c in self.schema.category_cols if c in self.fields]
+
+    def build_count_query(self, spec: LogQuerySpec) -> str:
+        """spec → 건수만 세는 Logs Insights 쿼리"""
+        lines = [*self._filters(spec), "stats count(*) as total"]
+        return "\n| ".join(lines)
+
+    def time_range(self, spec: LogQuerySpec) -> List[int]:
+        """[startTime, endTime] epoch 초 (날짜가 없으면 최근 lookback 구간)"""
+        now = datetime.now()
+        end = (
+            datetime.combine(spec.end_date + timedelta(days=1), datetime.min.time())
+            if spec.end_date
+            else now
+        )
+        start = (
+            datetime.combine(spec.start_date, datetime.min.time())
+            if spec.start_date
+            else min(end, now) - self.lookback
+        )
+        if spec.since is not None:
+            start = max(start, spec.since)
+        if spec.cursor is not None:
+            end = min(end, pd.Timestamp(spec.cursor[0]).to_pydatetime() + timedelta(seconds=1))
+        return [int(start.timestamp()), int(end.timestamp())]
+
+    # ---------- 실행 ----------
+    def _run(self, query_string: str, spec: LogQuerySpec) -> List[List[Dict[str, str]]]:
+        """start_query → 완료될 때까지 get_query_results 폴링"""
+        start, end = self.time_range(spec)
+        query_id = self.client.start_query(
+            logGroupNames=self.log_group_names,
+            startTime=start,
+            endTime=end,
+            queryString=query_string,
+            limit=self._row_limit(spec),
+        )["queryId"]
+
+        deadline = time.monotonic() + self.timeout
+        while True:
+            resp = self.client.get_query_results(queryId=query_id)
+            status = resp["status"]
+            if status == "Complete":
+                return resp.get("results", [])
+            if status in ("Failed", "Cancelled", "Timeout", "Unknown"):
+                raise RuntimeError(f"Logs Insights 쿼리 실패: {status} ({query_id})")
+            if time.monotonic() > deadline:
+                self.client.stop_query(queryId=query_id)
+                raise TimeoutError(f"Logs Insights 쿼리 시간 초과 ({query_id})")
+            time.sleep(self.poll_interval)
+
+    def query(self, spec: LogQuerySpec) -> pd.DataFrame:
+        df = self._page(self._to_frame(self._run(self.build_query(spec), spec)), spec)
+        return df[spec.output_columns(self.schema)]
+
+    def count(self, spec: LogQuerySpec) -> int:
+        spec = spec.unpaged()
+        results = self._run(self.build_count_query(spec), spec)
+        if not results:
+            return 0
+        row = {f["field"]: f["value"] for f in results[0]}
+        return int(row.get("total", 0))
+
+    def volume(self, spec: LogQuerySpec, resolution: str = "minute") -> Optional[pd.Series]:
+        """stats 로 버킷별 건수만 받음. 결과 행 수가 limit 에 닿으면 잘렸을 수 있으므로 None"""
+        spec = spec.unpaged()
+        results = self._run(self.build_volume_query(spec, resolution), spec)
+        if len(results) >= self.limit:
+            return None
+
+        dims = self._volume_dims()
+        bin_field = f"bin({_VOLUME_BINS[resolution]})"
+        records = [{f["field"]: f["value"] for f in row} for row in results]
+        df = pd.DataFrame.from_records(
+            records, columns=[bin_field, *(self.fields[c] for c in dims), "count"]
+        )
+        df.columns = ["bucket", *dims, "count"]
+        df["bucket"] = to_local_naive(pd.to_datetime(df["bucket"], utc=True)).dt.floor(RESOLUTIONS[resolution])
+        df["count"] = pd.to_numeric(df["count"]).astype("int64")
+        df = self._derive(df)
+        keys = ["bucket", *self.schema.category_cols]
+        for c in self.schema.category_cols:
+            df[c] = df[c].astype(object).fillna("")
+        return df.groupby(keys, sort=False)["count"].sum()
+
+    def _derive(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Insights 필드 값 → 스키마 값 (함수명은 로그 그룹에서, SES status 는 eventType 에서)"""
+        if self.schema.kind == "lambda":
+            # "123456789012:/aws/lambda/send-report-email" → "send-report-email"
+            df["function_name"] = df["function_name"].str.rsplit("/", n=1).str[-1]
+        else:
+            df["status"] = df["event_type"].map(SES_STATUS_BY_EVENT)
+        return df
+
+    def _to_frame(self, results: List[List[Dict[str, str]]]) -> pd.DataFrame:
+        records = [{f["field"]: f["value"] for f in row} for row in results]
+        df = pd.DataFrame.from_records(records, columns=list(self.fields))
+        # @timestamp 는 UTC ("2025-01-01 00:00:00.000") → tz 없는 로컬 시각 (time_range 의 날짜 경계와 같은 기준)
+        df["timestamp"] = to_local_naive(pd.to_datetime(df["timestamp"], utc=True))
+        df = self._derive(df)
+        return compact_frame(df[list(self.schema.columns)], self.schema)
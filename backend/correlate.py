@@ -0,0 +1,240 @@
+# backend/correlate.py
+"""
+Lambda ↔ SES 로그 연결
+
+    timeline = correlate(lambda_df, ses_df, window="5min")
+
+SES 이벤트마다 그 메일을 보낸 Lambda 호출을 찾아 붙이고, 두 로그를 시간순 타임라인 하나로 합친다.
+
+1. ID 연결 (hash join)
+   - Lambda message 안의 SES message_id (예: "Sent email messageId=0100018c...-000000")
+   - SES 프레임에 request_id 컬럼이 있으면 (메일 태그로 Lambda request_id 를 넘긴 경우) 그대로
+2. 시간 창 연결 (merge_asof)
+   - ID 로 못 찾은 SES 이벤트는 메일 발송 함수(sender_functions)의 Lambda 로그 중
+     window 안에서 가장 가까운 호출에 붙인다
+   - SES 프레임에 function_name 컬럼이 있으면 함수별로(by) 맞춘다
+
+두 단계 모두 정렬 / 해시 기반이라 (교차 곱 없음) 하루치 로그도 몇 초 안에 끝난다.
+
+반환 컬럼:
+    timestamp, source(lambda / ses), function_name, level(Lambda level / SES status),
+    event_type, detail(메시지 / 제목 → 수신자), request_id, message_id,
+    correlation_id(연결된 Lambda request_id), match(id / time), lag_seconds(SES 시각 - Lambda 시각)
+"""
+
+from __future__ import annotations
+
+from typing import Optional, Sequence, Union
+
+import numpy as np
+import pandas as pd
+
+from .dtypes import to_local_naive
+from .sources import LAMBDA_SCHEMA, SES_SCHEMA
+
+DEFAULT_SENDER_FUNCTIONS = ("send-report-email",)
+
+# SES message_id (0100018c1a2b3c4d-1a2b3c4d-1a2b-3c4d-5e6f-1a2b3c4d5e6f-000000) / 목업 id (msg-111)
+MESSAGE_ID_PATTERN = (
+    r"([0-9a-f]{16}-[0-9a-f]{8}(?:-[0-9a-f]{4}){3}-[0-9a-f]{12}-[0-9a-f]{6}|msg-[\w-]+)"
+)
+
+TIMELINE_COLUMNS = [
+    "timestamp",
+    "source",
+    "function_name",
+    "level",
+    "event_type",
+    "detail",
+    "request_id",
+    "message_id",
+    "correlation_id",
+    "match",
+    "lag_seconds",
+]
+
+
+def _prepared(df: pd.DataFrame, ts_col: str) -> pd.DataFrame:
+    """timestamp 가 있는 행만, 위치 번호(_pos)를 붙여서"""
+    df = df.reset_index(drop=True)
+    ts = pd.to_datetime(df[ts_col])
+    ts = to_local_naive(ts)
+    df = df.assign(**{ts_col: ts.astype("datetime64[ns]")})
+    df = df[df[ts_col].notna()].reset_index(drop=True)
+    df["_pos"] = np.arange(len(df))
+    return df
+
+
+def _id_links(lam: pd.DataFrame, ses: pd.DataFrame, senders: pd.DataFrame, pattern: str) -> pd.DataFrame:
+    """ID 로 찾은 (ses _pos, lambda _pos) 쌍. SES 이벤트 하나에 Lambda 호출 하나"""
+    links = []
+
+    if pattern and not senders.empty:
+        mentioned = senders[["_pos", "message"]].astype({"message": object})
+        mentioned = mentioned.assign(message_id=mentioned["message"].str.extract(pattern, expand=False))
+        mentioned = mentioned.dropna(subset=["message_id"])
+        if not mentioned.empty:
+            pairs = ses[["_pos", "message_id"]].astype({"message_id": object}).merge(
+                mentioned[["_pos", "message_id"]], on="message_id", suffixes=("_ses", "_lambda")
+            )
+            links.append(pairs[["_pos_ses", "_pos_lambda"]])
+
+    if "request_id" in ses.columns:
+        pairs = ses[["_pos", "request_id"]].dropna().astype({"request_id": object}).merge(
+            lam[["_pos", "request_id"]].astype({"request_id": object}),
+            on="request_id",
+            suffixes=("_ses", "_lambda"),
+        )
+        links.append(pairs[["_pos_ses", "_pos_lambda"]])
+
+    if not links:
+        return pd.DataFrame({"_pos_ses": [], "_pos_lambda": []}, dtype=np.int64)
+    # 같은 SES 이벤트가 여러 호출에 걸리면 가장 이른 호출 (발송한 쪽)
+    links = pd.concat(links, ignore_index=True)
+    called_at = lam[LAMBDA_SCHEMA.ts_col].to_numpy()[links["_pos_lambda"].to_numpy()]
+    return links.iloc[np.argsort(called_at, kind="stable")].drop_duplicates("_pos_ses")
+
+
+def _time_links(
+    ses: pd.DataFrame,
+    senders: pd.DataFrame,
+    window: pd.Timedelta,
+    direction: str,
+) -> pd.DataFrame:
+    """시간 창 안에서 가장 가까운 발송 함수 호출 (merge_asof, 양쪽 timestamp 정렬 후 한 번 훑기)"""
+    ts = SES_SCHEMA.ts_col
+    if ses.empty or senders.empty:
+        return pd.DataFrame({"_pos_ses": [], "_pos_lambda": []}, dtype=np.int64)
+
+    by = "function_name" if "function_name" in ses.columns else None
+    left_cols = [ts, "_pos"] + ([by] if by else [])
+    right_cols = [ts, "_pos"] + ([by] if by else [])
+    left = ses[left_cols].sort_values(ts, kind="stable")
+    right = senders[right_cols].sort_values(ts, kind="stable")
+    if by:
+        left = left.astype({by: object})
+        right = right.astype({by: object})
+
+    joined = pd.merge_asof(
+        left,
+        right,
+        on=ts,
+        by=by,
+        direction=direction,
+        tolerance=window,
+        suffixes=("_ses", "_lambda"),
+    )
+    joined = joined.dropna(subset=["_pos_lambda"])
+    return joined[["_pos_ses", "_pos_lambda"]].astype(np.int64)
+
+
+def correlate(
+    lambda_df: pd.DataFrame,
+    ses_df: pd.DataFrame,
+    window: Union[str, pd.Timedelta] = "5min",
+    sender_functions: Optional[Sequence[str]] = DEFAULT_SENDER_FUNCTIONS,
+    direction: str = "nearest",
+    message_id_pattern: Optional[str] = MESSAGE_ID_PATTERN,
+    only_linked: bool = False,
+) -> pd.DataFrame:
+    """
+    Lambda / SES 프레임 → 연결 정보가 붙은 타임라인 (최신순).
+
+    window            : 시간 창 연결 허용 간격
+    sender_functions  : 메일을 보내는 Lambda 함수 (None 이면 모든 함수가 후보)
+    direction         : merge_asof 방향. SES 이벤트(바운스 등)는 호출보다 늦게 오지만
+                        로그 시각이 어긋날 수 있어 기본은 nearest
+    only_linked       : 연결된 행만 남길지
+    """
+    ts = LAMBDA_SCHEMA.ts_col
+    window = pd.Timedelta(window)
+    lam = _prepared(lambda_df, ts)
+    ses = _prepared(ses_df, SES_SCHEMA.ts_col)
+
+    senders = lam
+    if sender_functions is not None and not lam.empty:
+        senders = lam[lam["function_name"].isin(list(sender_functions)).to_numpy()]
+
+    # 1. ID → 2. 남은 SES 이벤트만 시간 창
+    by_id = _id_links(lam, ses, senders, message_id_pattern)
+    rest = ses[~ses["_pos"].isin(by_id["_pos_ses"])]
+    by_time = _time_links(rest, senders, window, direction)
+
+    ses_link = np.full(len(ses), -1, dtype=np.int64)
+    ses_link[by_id["_pos_ses"].to_numpy()] = by_id["_pos_lambda"].to_numpy()
+    ses_link[by_time["_pos_ses"].to_numpy()] = by_time["_pos_lambda"].to_numpy()
+    ses_match = np.full(len(ses), None, dtype=object)
+    ses_match[by_id["_pos_ses"].to_numpy()] = "id"
+    ses_match[by_time["_pos_ses"].to_numpy()] = "time"
+
+    linked = ses_link >= 0
+    lam_ids = lam["request_id"].astype(object).to_numpy()
+    lam_ts = lam[ts].to_numpy()
+    ses_ts = ses[ts].to_numpy()
+
+    ses_corr = np.full(len(ses), None, dtype=object)
+    ses_corr[linked] = lam_ids[ses_link[linked]]
+    ses_lag = np.full(len(ses), np.nan)
+    ses_lag[linked] = (ses_ts[linked] - lam_ts[ses_link[linked]]) / np.timedelta64(1, "s")
+
+    # Lambda 쪽: 연결된 SES 이벤트가 하나라도 있으면 자기 request_id 가 correlation_id
+    lam_linked = np.zeros(len(lam), dtype=bool)
+    lam_linked[ses_link[linked]] = True
+    lam_match = np.full(len(lam), None, dtype=object)
+    lam_match[np.unique(ses_link[ses_match == "id"])] = "id"
+    time_only = np.zeros(len(lam), dtype=bool)
+    time_only[ses_link[ses_match == "time"]] = True
+    lam_match[time_only & pd.isna(lam_match)] = "time"
+    lam_corr = np.where(lam_linked, lam_ids, None)
+
+    lambda_part = pd.DataFrame(
+        {
+            "timestamp": lam_ts,
+            "source": "lambda",
+            "function_name": lam["function_name"].astype(object).to_numpy(),
+            "level": lam["level"].astype(object).to_numpy(),
+            "event_type": None,
+            "detail": lam["message"].astype(object).to_numpy(),
+            "request_id": lam_ids,
+            "message_id": None,
+            "correlation_id": lam_corr,
+            "match": lam_match,
+            "lag_seconds": np.nan,
+        }
+    )
+    if "function_name" in ses.columns:
+        ses_function = ses["function_name"].astype(object).to_numpy()
+    else:
+        # 연결된 호출의 함수 이름
+        ses_function = np.full(len(ses), None, dtype=object)
+        ses_function[linked] = lam["function_name"].astype(object).to_numpy()[ses_link[linked]]
+    ses_part = pd.DataFrame(
+        {
+            "timestamp": ses_ts,
+            "source": "ses",
+            "function_name": ses_function,
+            "level": ses["status"].astype(object).to_numpy(),
+            "event_type": ses["event_type"].astype(object).to_numpy(),
+            "detail": (
+                ses["subject"].astype(object).fillna("").astype(str)
+                + " → "
+                + ses["mail_to"].astype(object).fillna("").astype(str)
+            ).to_numpy(),
+            "request_id": None,
+            "message_id": ses["message_id"].astype(object).to_numpy(),
+            "correlation_id": ses_corr,
+            "match": ses_match,
+            "lag_seconds": ses_lag,
+        }
+    )
+    if only_linked:
+        lambda_part = lambda_part[lam_linked]
+        ses_part = ses_part[linked]
+
+    timeline = pd.concat(
+        [p for p in (lambda_part, ses_part) if len(p)] or [lambda_part], ignore_index=True
+    )
+    timeline = timeline.sort_values("timestamp", ascending=False, kind="stable").reset_index(drop=True)
+    return timeline.astype(
+        {"source": "category", "function_name": "category", "level": "category", "match": "category"}
+    )[TIMELINE_COLUMNS]
@@ -0,0 +1,85 @@
+# backend/db.py
+"""
+SQLite 연결 풀
+
+    pool = ConnectionPool("reports.sqlite3", size=4)
+    with pool.connection() as conn:
+        conn.execute(SQL, params)
+
+- 연결은 만들어 둔 것을 돌려 쓴다 (최대 size 개, 모자라면 반납될 때까지 대기)
+- 연결마다 prepared statement 캐시(cached_statements)가 있어서, 같은 SQL 문자열은 다시 컴파일하지 않는다
+  → SQL 은 고정 문자열 + ? 파라미터로만 만든다
+- 파일 DB 는 WAL 모드 (읽기끼리 / 읽기-쓰기가 서로 막지 않음), busy_timeout 으로 쓰기 충돌 대기
+- ":memory:" 는 연결마다 다른 DB 가 되므로 연결 하나만 쓴다 (size=1)
+- pandas 를 import 하지 않는다
+"""
+
+from __future__ import annotations
+
+import queue
+import sqlite3
+import threading
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List
+
+STATEMENT_CACHE = 256
+
+
+class ConnectionPool:
+    """SQLite 연결 풀 (스레드 안전, 연결 하나는 한 번에 한 스레드만 사용)"""
+
+    def __init__(self, path: str = ":memory:", size: int = 4, timeout: float = 30.0):
+        self.path = path
+        self.memory = path == ":memory:"
+        self.size = 1 if self.memory else max(1, size)
+        self.timeout = timeout
+        self._idle: "queue.LifoQueue[sqlite3.Connection]" = queue.LifoQueue()
+        self._all: List[sqlite3.Connection] = []
+        self._lock = threading.Lock()
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(
+            self.path,
+            timeout=self.timeout,
+            check_same_thread=False,
+            cached_statements=STATEMENT_CACHE,
+        )
+        if not self.memory:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+        return conn
+
+    def _acquire(self) -> sqlite3.Connection:
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            pass
+        with self._lock:
+            if len(self._all) < self.size:
+                conn = self._connect()
+                self._all.append(conn)
+                return conn
+        try:
+            return self._idle.get(timeout=self.timeout)
+        except queue.Empty:
+            raise TimeoutError(f"SQLite 연결을 {self.timeout:g}초 안에 얻지 못했습니다: {self.path}") from None
+
+    @contextmanager
+    def connection(self) -> Iterator[sqlite3.Connection]:
+        conn = self._acquire()
+        try:
+            yield conn
+        finally:
+            if conn.in_transaction:
+                conn.rollback()
+            self._idle.put(conn)
+
+    def close(self) -> None:
+        with self._lock:
+            for conn in self._all:
+                conn.close()
+            self._all.clear()
+        self._idle = queue.LifoQueue()
+
+    def stats(self) -> Dict[str, Any]:
+        return {"path": self.path, "size": self.size, "open": len(self._all), "idle": self._idle.qsize()}
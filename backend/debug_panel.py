@@ -0,0 +1,40 @@
+# backend/debug_panel.py
+"""
+단계별 소요 시간 / cold start 디버그 패널 (?debug=1 또는 LOG_DEBUG_PANEL=1 일 때만 app.py 가 import)
+
+pages/ 아래 파일은 Streamlit 멀티페이지가 사이드바 항목으로 자동 등록하므로 여기에 둔다.
+"""
+import pandas as pd
+import streamlit as st
+
+from backend.profiling import PROFILER
+from backend.startup import process_uptime, startup_stats
+
+
+def render_debug_panel():
+    """접을 수 있는 단계별 소요 시간 패널 (?debug=1 또는 LOG_DEBUG_PANEL=1 일 때 app.py 에서 호출)"""
+    with st.expander("⏱ 단계별 소요 시간", expanded=False):
+        # 경로별 첫 요청 (페이지 모듈 import / 첫 렌더링 / 프로세스 시작부터 첫 렌더링 끝까지)
+        startup = startup_stats()
+        if startup:
+            st.caption(f"cold start · 프로세스 시작 후 {process_uptime():,.0f}초")
+            st.dataframe(pd.DataFrame(startup), hide_index=True, width="stretch")
+
+        summary = PROFILER.summary()
+        if not summary:
+            st.caption("아직 기록이 없습니다.")
+            return
+
+        st.caption(f"샘플링 비율 {PROFILER.sample_rate:g} · 최근 {len(PROFILER.records)}건 보관")
+        st.dataframe(pd.DataFrame(summary), hide_index=True, width="stretch")
+
+        recent = pd.DataFrame(PROFILER.recent(limit=50)).iloc[::-1]
+        st.dataframe(
+            recent[["trace_id", "root", "parent", "name", "seconds", "rows_in", "rows_out", "bytes_out"]],
+            hide_index=True,
+            width="stretch",
+        )
+
+        col1, col2 = st.columns(2)
+        col1.download_button("JSON 내보내기", PROFILER.to_json(), "profile.json", "application/json")
+        col2.download_button("Prometheus 내보내기", PROFILER.to_prometheus(), "profile.prom", "text/plain")
@@ -0,0 +1,101 @@
+# backend/dtypes.py
+"""
+로그 프레임 컬럼 타입 정리
+
+- 값 종류가 적은 컬럼(level, function_name, status, event_type)은 pandas category
+  → 문자열은 카테고리에 한 번만 저장되고 행마다 int8/int16 코드만 가진다
+- 나머지 문자열 컬럼(message, subject, mail_to, id)은 Arrow 문자열 (string[pyarrow])
+  → 행마다 파이썬 str 객체 대신 연속 버퍼 하나
+- level / status 필터는 category_mask 로 코드 lookup 한 번에 끝낸다
+
+배치를 합칠 때 카테고리 구성이 다르면 pd.concat 이 object 로 되돌리므로 concat_frames 를 쓴다.
+
+시각 컬럼은 모든 소스에서 tz 없는 로컬 시각 (UI 날짜 필터 / datetime.now() / 목업·SQLite 데이터와 같은 기준).
+UTC 로 들어오는 값(SES / CloudWatch 내보내기)은 to_local_naive 로 로컬 시각으로 바꾼 뒤 tz 를 뗀다.
+로컬 타임존은 서버 타임존 (datetime.now() 와 같게 TZ 환경 변수로 바꾼다. 예: TZ=Asia/Seoul).
+"""
+
+from __future__ import annotations
+
+from typing import Iterable, List, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+from dateutil import tz
+from pandas.api.types import union_categoricals
+
+ARROW_STRING = pd.ArrowDtype(pa.string())
+
+LOCAL_TZ = tz.tzlocal()
+
+
+def to_local_naive(ts: pd.Series) -> pd.Series:
+    """tz-aware 시각 → LOCAL_TZ 벽시계 기준 tz 없는 시각 (tz 없는 값은 이미 로컬로 보고 그대로)"""
+    if ts.dt.tz is None:
+        return ts
+    return ts.dt.tz_convert(LOCAL_TZ).dt.tz_localize(None)
+
+
+def arrow_strings(ty: pa.DataType) -> Optional[pd.ArrowDtype]:
+    """to_pandas types_mapper: 문자열 컬럼은 Arrow 버퍼를 그대로 쓰는 string[pyarrow] 로 (복사 없음)"""
+    if pa.types.is_string(ty) or pa.types.is_large_string(ty):
+        return pd.ArrowDtype(ty)
+    return None
+
+
+def compact_frame(df: pd.DataFrame, schema) -> pd.DataFrame:
+    """schema.category_cols → category, schema.text_cols → Arrow 문자열 (이미 그 타입이면 그대로)"""
+    changes = {}
+    for col in schema.category_cols:
+        if col in df.columns and not isinstance(df[col].dtype, pd.CategoricalDtype):
+            changes[col] = df[col].astype("category")
+    for col in schema.text_cols:
+        if col in df.columns and not isinstance(df[col].dtype, pd.ArrowDtype):
+            values = df[col]
+            if isinstance(values.dtype, pd.CategoricalDtype):
+                values = values.astype(object)
+            changes[col] = values.astype(ARROW_STRING)
+    if not changes:
+        return df
+    return df.assign(**changes)
+
+
+def concat_frames(frames: Sequence[pd.DataFrame]) -> pd.DataFrame:
+    """category 컬럼의 카테고리를 합집합으로 맞춘 뒤 concat (결과도 category 유지)"""
+    frames = [f for f in frames if len(f.columns)]
+    if len(frames) == 1:
+        return frames[0].reset_index(drop=True)
+
+    cat_cols = [
+        col
+        for col, dtype in frames[0].dtypes.items()
+        if isinstance(dtype, pd.CategoricalDtype)
+        and all(col in f.columns and isinstance(f[col].dtype, pd.CategoricalDtype) for f in frames)
+    ]
+    if cat_cols:
+        aligned: List[pd.DataFrame] = [f.copy(deep=False) for f in frames]
+        for col in cat_cols:
+            dtypes = {f[col].dtype for f in frames}
+            if len(dtypes) == 1:
+                continue
+            categories = union_categoricals([f[col] for f in frames]).categories
+            for f in aligned:
+                f[col] = f[col].cat.set_categories(categories)
+        frames = aligned
+
+    return pd.concat(frames, ignore_index=True)
+
+
+def category_mask(values: pd.Series, wanted: Iterable) -> np.ndarray:
+    """values.isin(wanted) 와 같은 bool 배열 (category 면 코드 lookup 표 한 번으로)"""
+    wanted = list(wanted)
+    if not isinstance(values.dtype, pd.CategoricalDtype):
+        return values.isin(wanted).to_numpy()
+
+    categories = values.cat.categories
+    # 마지막 칸은 결측(-1 코드)용으로 항상 False
+    lookup = np.zeros(len(categories) + 1, dtype=bool)
+    hits = categories.get_indexer(wanted)
+    lookup[hits[hits >= 0]] = True
+    return lookup[values.cat.codes.to_numpy()]
@@ -0,0 +1,147 @@
+# backend/fetch.py
+"""
+Lambda / SES 로그 동시 조회 (통합 대시보드용)
+
+    results = gather_logs_sync(
+        {"lambda": lambda_filters, "ses": ses_filters},
+        timeout=5.0,
+        timeouts={"ses": 2.0},          # 소스별 제한 시간
+    )
+    results["lambda"].frame            # 늦은 쪽은 status="timeout" + 빈 프레임 (부분 결과)
+
+- 소스 조회(get_lambda_logs / get_ses_logs)는 동기 함수라 전용 스레드 풀에서 실행하고
+  asyncio 로 동시에 기다린다 → 화면 지연은 두 소스 시간의 합이 아니라 큰 쪽
+- 제한 시간을 넘긴 조회는 기다리지 않고 빈 결과로 돌려준다.
+  스레드는 끝까지 돌아 결과 캐시(RESULT_CACHE)에 들어가므로 다음 rerun 에서는 바로 나온다
+- Streamlit 스크립트에서는 gather_logs_sync 를 쓴다 (이벤트 루프를 따로 띄워서 실행)
+
+환경 변수
+    LOG_FETCH_TIMEOUT : 기본 제한 시간(초, 기본 10)
+    LOG_FETCH_WORKERS : 조회 스레드 수 (기본 8)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Optional
+
+import pandas as pd
+
+from .profiling import profiled
+
+DEFAULT_TIMEOUT = float(os.environ.get("LOG_FETCH_TIMEOUT", "10"))
+
+# asyncio 기본 executor 를 쓰면 asyncio.run 이 끝날 때 늦은 스레드까지 기다리므로
+# (제한 시간이 의미 없어짐) 모듈 전용 풀을 쓴다
+_EXECUTOR = ThreadPoolExecutor(
+    max_workers=int(os.environ.get("LOG_FETCH_WORKERS", "8")),
+    thread_name_prefix="log-fetch",
+)
+
+
+@dataclass
+class LogFetchResult:
+    """소스 하나의 조회 결과 (status: ok / timeout / error)"""
+
+    kind: str
+    frame: pd.DataFrame
+    status: str = "ok"
+    seconds: float = 0.0
+    error: Optional[str] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.status == "ok"
+
+
+def _fetchers() -> Dict[str, Callable[[Dict[str, Any]], pd.DataFrame]]:
+    from .logs import get_lambda_logs, get_ses_logs
+
+    return {"lambda": get_lambda_logs, "ses": get_ses_logs}
+
+
+def _empty_frame(kind: str) -> pd.DataFrame:
+    from .logs import LAMBDA_SCHEMA, SES_SCHEMA
+
+    schema = LAMBDA_SCHEMA if kind == "lambda" else SES_SCHEMA
+    return pd.DataFrame(columns=list(schema.columns))
+
+
+async def _fetch(kind: str, filters: Dict[str, Any], timeout: Optional[float]) -> LogFetchResult:
+    fn = _fetchers()[kind]
+    loop = asyncio.get_running_loop()
+    t0 = time.perf_counter()
+    try:
+        df = await asyncio.wait_for(loop.run_in_executor(_EXECUTOR, fn, filters), timeout)
+    except asyncio.TimeoutError:
+        return LogFetchResult(
+            kind, _empty_frame(kind), "timeout", time.perf_counter() - t0,
+            f"{timeout:.1f}초 안에 응답이 없습니다.",
+        )
+    except Exception as e:  # 한쪽 실패가 다른 쪽 결과를 버리지 않도록
+        return LogFetchResult(kind, _empty_frame(kind), "error", time.perf_counter() - t0, str(e))
+    return LogFetchResult(kind, df, "ok", time.perf_counter() - t0)
+
+
+async def fetch_lambda_logs(filters: Dict[str, Any], timeout: Optional[float] = DEFAULT_TIMEOUT) -> LogFetchResult:
+    """get_lambda_logs 의 비동기 버전 (제한 시간 초과 / 오류는 예외 대신 status 로)"""
+    return await _fetch("lambda", filters, timeout)
+
+
+async def fetch_ses_logs(filters: Dict[str, Any], timeout: Optional[float] = DEFAULT_TIMEOUT) -> LogFetchResult:
+    """get_ses_logs 의 비동기 버전"""
+    return await _fetch("ses", filters, timeout)
+
+
+async def gather_logs(
+    requests: Dict[str, Dict[str, Any]],
+    timeout: Optional[float] = DEFAULT_TIMEOUT,
+    timeouts: Optional[Dict[str, float]] = None,
+) -> Dict[str, LogFetchResult]:
+    """
+    {종류: filters} 를 동시에 조회. timeouts 로 소스별 제한 시간을 따로 줄 수 있다.
+    결과는 요청한 종류 순서 그대로 {종류: LogFetchResult}.
+    """
+    unknown = [k for k in requests if k not in ("lambda", "ses")]
+    if unknown:
+        raise ValueError(f"알 수 없는 로그 종류입니다: {unknown}")
+    timeouts = timeouts or {}
+    results = await asyncio.gather(
+        *(_fetch(kind, filters, timeouts.get(kind, timeout)) for kind, filters in requests.items())
+    )
+    return dict(zip(requests, results))
+
+
+@profiled("gather_logs")
+def gather_logs_sync(
+    requests: Dict[str, Dict[str, Any]],
+    timeout: Optional[float] = DEFAULT_TIMEOUT,
+    timeouts: Optional[Dict[str, float]] = None,
+) -> Dict[str, LogFetchResult]:
+    """gather_logs 의 동기 버전 (Streamlit 스크립트용)"""
+    coro = gather_logs(requests, timeout=timeout, timeouts=timeouts)
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coro)
+
+    # 이미 이벤트 루프가 돌고 있는 스레드(노트북 등)에서는 별도 스레드에서 실행
+    box: Dict[str, Any] = {}
+
+    def run() -> None:
+        try:
+            box["result"] = asyncio.run(coro)
+        except BaseException as e:
+            box["error"] = e
+
+    worker = threading.Thread(target=run, name="log-gather")
+    worker.start()
+    worker.join()
+    if "error" in box:
+        raise box["error"]
+    return box["result"]
@@ -0,0 +1,332 @@
+# backend/files.py
+"""
+여러 로그 파일(시간별 Lambda 내보내기, 일별 SES 덤프)을 병렬로 읽는 소스
+
+    source = FileLogSource(LAMBDA_SCHEMA, "exports/lambda/", workers=16, chunk_size=4)
+    set_log_source("lambda", source)
+
+- 파일 목록을 chunk_size 개씩 묶어 프로세스(또는 스레드) 풀에 보낸다
+- 워커가 파일을 읽으면서 날짜 / since / 레벨(status) / 키워드 조건을 바로 적용하고,
+  페이지 조회면 파일 묶음마다 상위 offset + limit 행만 남겨서 돌려준다 (메인으로 넘어오는 양 최소화)
+- 워커 결과는 최신순으로 정렬된 청크 → 메인에서 k-way merge
+  (페이지는 heapq.merge 로 필요한 행 수만큼만, 전체는 정렬된 구간을 합치는 stable 정렬)
+- 경로에 날짜(YYYY-MM-DD, YYYY/MM/DD, date=YYYY-MM-DD)가 있으면 범위 밖 파일은 열지 않는다
+
+지원 형식: .parquet, .jsonl / .ndjson / .json, .csv (.gz 압축 가능).
+SES JSON 이 SES 이벤트 원문이면 backend.ingest.events_to_frame 으로 바꿔서 읽는다.
+
+환경 변수 (LOG_SOURCE=files 일 때)
+    LOG_FILES_ROOT    : <root>/lambda, <root>/ses 아래 파일을 읽음 (기본 logs_files)
+    LOG_FILE_WORKERS  : 워커 수 (기본 CPU 수)
+    LOG_FILE_CHUNK    : 작업 하나에 넣을 파일 수 (기본 4)
+    LOG_FILE_EXECUTOR : process / thread (기본 process)
+"""
+
+from __future__ import annotations
+
+import glob
+import heapq
+import itertools
+import multiprocessing
+import os
+import re
+import threading
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from datetime import date, timedelta
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+import pandas as pd
+import pyarrow.parquet as pq
+
+from .dtypes import arrow_strings, category_mask, compact_frame, concat_frames, to_local_naive
+from .filters import _apply_date_filter, _apply_keyword_filter, _apply_top_k
+from .profiling import stage
+from .sources import LogQuerySpec, LogSchema, LogSource
+
+_LOG_SUFFIXES = (".parquet", ".jsonl", ".ndjson", ".json", ".csv")
+
+# 경로 안의 날짜 (date=2025-11-24 / 2025-11-24 / 2025/11/24)
+_PATH_DATE = re.compile(r"(\d{4})[-/](\d{2})[-/](\d{2})")
+
+# 시각 문자열 끝의 UTC 표시 / 오프셋 (Z, +09:00, -0500, +09)
+_TZ_SUFFIX = r"[T ]\d{2}:\d{2}.*(?:[Zz]|[+-]\d{2}(?::?\d{2})?)$"
+
+
+# ------------------------
+# 파일 목록
+# ------------------------
+def list_log_files(paths: Union[str, Sequence[str]]) -> List[str]:
+    """디렉터리(하위 전체) / glob 패턴 / 파일 경로 → 로그 파일 목록 (경로순)"""
+    if isinstance(paths, str):
+        paths = [paths]
+    files = set()
+    for path in paths:
+        if os.path.isdir(path):
+            for root, _, names in os.walk(path):
+                files.update(os.path.join(root, n) for n in names)
+        else:
+            files.update(glob.glob(path))
+    return sorted(f for f in files if f.removesuffix(".gz").endswith(_LOG_SUFFIXES))
+
+
+def path_date(path: str) -> Optional[date]:
+    """경로에 들어 있는 마지막 날짜 (없으면 None)"""
+    found = _PATH_DATE.findall(path)
+    if not found:
+        return None
+    try:
+        return date(*map(int, found[-1]))
+    except ValueError:
+        return None
+
+
+def _in_range(path: str, start: Optional[date], end: Optional[date]) -> bool:
+    day = path_date(path)
+    if day is None:
+        return True
+    # 시간별 파일 이름의 날짜가 로컬 시각 기준일 수 있어 하루 여유를 둔다
+    if start and day < start - timedelta(days=1):
+        return False
+    if end and day > end + timedelta(days=1):
+        return False
+    return True
+
+
+# ------------------------
+# 워커 (프로세스 풀에서 실행되므로 모듈 함수 + 피클 가능한 인자만)
+# ------------------------
+def read_log_file(path: str, schema: LogSchema, columns: Optional[Sequence[str]] = None) -> pd.DataFrame:
+    """파일 하나 → 스키마 컬럼 프레임 (timestamp 는 tz 없는 로컬 시각)"""
+    columns = list(columns or schema.columns)
+    name = path.removesuffix(".gz")
+
+    if name.endswith(".parquet"):
+        table = pq.read_table(path)
+        table = table.select([c for c in columns if c in table.column_names])
+        df = table.to_pandas(types_mapper=arrow_strings)
+    elif name.endswith(".csv"):
+        df = pd.read_csv(path, usecols=lambda c: c in columns)
+    else:
+        # 날짜 자동 변환은 epoch / 오프셋 구분 없이 바꾸므로 끄고 parse_timestamps 에 맡김
+        df = pd.read_json(path, lines=not name.endswith(".json"), dtype=False, convert_dates=False)
+        if schema.kind == "ses" and schema.ts_col not in df.columns:
+            # SES 이벤트 원문 (SNS / EventBridge / Firehose 내보내기)
+            from .ingest import events_to_frame
+
+            df, _ = events_to_frame(df.to_dict("records"))
+
+    df = df.reindex(columns=columns)
+
+    df[schema.ts_col] = parse_timestamps(df[schema.ts_col])
+    # 파일 형식마다 카테고리 값 타입이 달라지지 않도록 (Arrow 문자열 / object) object 로 맞춘 뒤 category 로
+    for col in schema.category_cols:
+        if col in df.columns and not isinstance(df[col].dtype, pd.CategoricalDtype):
+            df[col] = df[col].astype(object)
+    return compact_frame(df, schema)
+
+
+def parse_timestamps(ts: pd.Series) -> pd.Series:
+    """
+    파일의 timestamp 값 → tz 없는 로컬 시각 (다른 소스 / UI 날짜 필터와 같은 기준)
+
+    epoch 밀리초(CloudWatch 내보내기)와 Z / 오프셋이 붙은 값만 UTC 로 보고 로컬로 바꾸고,
+    오프셋 없는 값은 이미 로컬 시각이므로 그대로 둔다 (bench_files / ParquetLogSource 가 쓴 파일).
+    """
+    if pd.api.types.is_numeric_dtype(ts):
+        return to_local_naive(pd.to_datetime(ts, unit="ms", utc=True, errors="coerce"))
+    if pd.api.types.is_datetime64_any_dtype(ts):
+        return to_local_naive(ts)
+
+    aware = ts.astype(str).str.contains(_TZ_SUFFIX, regex=True).to_numpy()
+    out = pd.Series(pd.NaT, index=ts.index, dtype="datetime64[ns]")
+    if aware.any():
+        out[aware] = to_local_naive(pd.to_datetime(ts[aware], utc=True, errors="coerce", format="ISO8601"))
+    if not aware.all():
+        out[~aware] = pd.to_datetime(ts[~aware], errors="coerce", format="ISO8601")
+    return out
+
+
+def filter_frame(df: pd.DataFrame, schema: LogSchema, spec: LogQuerySpec) -> pd.DataFrame:
+    """spec 의 날짜 / since / 레벨 / 키워드 조건을 프레임 하나에 적용 (페이지 조건 제외)"""
+    df = _apply_date_filter(df, spec.start_date, spec.end_date, ts_col=schema.ts_col)
+    if spec.since is not None and not df.empty:
+        df = df[(df[schema.ts_col] >= pd.Timestamp(spec.since)).to_numpy()]
+    if spec.level_values and not df.empty:
+        df = df[category_mask(df[schema.level_col], spec.level_values)]
+    return _apply_keyword_filter(df, spec.keyword, cols=list(schema.search_cols), mode=spec.keyword_mode)
+
+
+def _sort_newest(df: pd.DataFrame, schema: LogSchema) -> pd.DataFrame:
+    return df.sort_values([schema.ts_col, schema.id_col], ascending=False, kind="stable")
+
+
+def load_chunk(paths: Sequence[str], schema: LogSchema, spec: LogQuerySpec) -> pd.DataFrame:
+    """
+    파일 묶음을 읽고 조건을 적용한 뒤 최신순으로 정렬해서 돌려준다.
+    페이지 조회면 이 묶음의 상위 offset + limit 행만 (cursor 는 여기서 적용).
+    """
+    # 정렬 / 페이지에 필요한 timestamp, id 와 필터 대상 컬럼까지 읽고 마지막에 출력 컬럼만 남김
+    out_cols = spec.output_columns(schema)
+    read_cols = [
+        c for c in schema.columns
+        if c in out_cols or c in (schema.ts_col, schema.id_col, schema.level_col) or c in schema.search_cols
+    ]
+    frames = [filter_frame(read_log_file(p, schema, read_cols), schema, spec) for p in paths]
+    df = concat_frames(frames) if frames else pd.DataFrame(columns=read_cols)
+
+    if spec.paged:
+        k = None if spec.limit is None else spec.offset + spec.limit
+        df = _apply_top_k(df, k, ts_col=schema.ts_col, id_col=schema.id_col, cursor=spec.cursor)
+    else:
+        df = _sort_newest(df, schema)
+
+    keep = list(dict.fromkeys(out_cols + [schema.id_col]))
+    return df[keep].reset_index(drop=True)
+
+
+def count_chunk(paths: Sequence[str], schema: LogSchema, spec: LogQuerySpec) -> int:
+    read_cols = [
+        c for c in schema.columns
+        if c in (schema.ts_col, schema.level_col) or c in schema.search_cols
+    ]
+    return sum(len(filter_frame(read_log_file(p, schema, read_cols), schema, spec)) for p in paths)
+
+
+# ------------------------
+# k-way merge
+# ------------------------
+def _newest_keys(df: pd.DataFrame, schema: LogSchema) -> Iterator[Tuple[int, str]]:
+    ts = df[schema.ts_col].to_numpy(dtype="datetime64[ns]").view("i8").tolist()
+    ids = ["" if pd.isna(v) else str(v) for v in df[schema.id_col].tolist()]
+    return zip(ts, ids)
+
+
+def merge_newest(
+    chunks: Sequence[pd.DataFrame],
+    schema: LogSchema,
+    limit: Optional[int] = None,
+    offset: int = 0,
+) -> pd.DataFrame:
+    """
+    최신순으로 정렬된 청크들을 하나로 합친다.
+
+    - limit 이 있으면 heapq.merge 로 각 청크 앞에서부터 offset + limit 행만 꺼냄
+      (청크 k 개 → O((offset + limit) log k), 나머지 행은 보지 않음)
+    - limit 이 없으면 청크를 이어 붙인 뒤 timestamp 로 stable 정렬
+      (이미 정렬된 구간(run)을 합치는 timsort 라 사실상 k-way merge)
+    """
+    chunks = [c for c in chunks if len(c)]
+    if not chunks:
+        return pd.DataFrame(columns=list(schema.columns))
+    if len(chunks) == 1:
+        return chunks[0].iloc[offset:None if limit is None else offset + limit].reset_index(drop=True)
+
+    starts = np.cumsum([0] + [len(c) for c in chunks])
+    merged = concat_frames(chunks)
+
+    if limit is not None:
+        streams = [
+            ((key, starts[i] + row) for row, key in enumerate(_newest_keys(c, schema)))
+            for i, c in enumerate(chunks)
+        ]
+        picked = itertools.islice(
+            heapq.merge(*streams, key=lambda item: item[0], reverse=True), offset + limit
+        )
+        positions = [pos for _, pos in picked][offset:]
+        return merged.iloc[positions].reset_index(drop=True)
+
+    if offset:
+        # offset 이 있으면 같은 시각의 순서도 맞아야 하므로 (timestamp, id) 정렬
+        return _sort_newest(merged, schema).iloc[offset:].reset_index(drop=True)
+
+    # 비트 반전(~)으로 내림차순을 오름차순으로 (NaT 는 맨 뒤, 부호 반전과 달리 오버플로 없음)
+    keys = ~merged[schema.ts_col].to_numpy(dtype="datetime64[ns]").view("i8")
+    order = np.argsort(keys, kind="stable")
+    return merged.iloc[order[offset:]].reset_index(drop=True)
+
+
+# ------------------------
+# 소스
+# ------------------------
+class FileLogSource(LogSource):
+    """로그 파일 묶음 소스 (읽기 전용, 풀은 처음 조회할 때 만들고 재사용)"""
+
+    def __init__(
+        self,
+        schema: LogSchema,
+        paths: Union[str, Sequence[str]],
+        workers: Optional[int] = None,
+        chunk_size: int = 4,
+        executor: str = "process",
+    ):
+        super().__init__(schema)
+        if executor not in ("process", "thread"):
+            raise ValueError(f"executor 는 'process' 또는 'thread' 입니다: {executor!r}")
+        self.paths = paths
+        self.workers = workers or os.cpu_count() or 1
+        self.chunk_size = max(1, int(chunk_size))
+        self.executor = executor
+        self._pool: Optional[Executor] = None
+        self._lock = threading.Lock()
+
+    def _get_pool(self) -> Executor:
+        with self._lock:
+            if self._pool is None:
+                if self.executor == "thread":
+                    self._pool = ThreadPoolExecutor(self.workers, thread_name_prefix="log-files")
+                else:
+                    # Streamlit 은 스레드가 많아서 fork 대신 spawn (워커는 한 번만 뜨고 재사용)
+                    ctx = multiprocessing.get_context("spawn")
+                    self._pool = ProcessPoolExecutor(self.workers, mp_context=ctx)
+            return self._pool
+
+    def close(self) -> None:
+        with self._lock:
+            if self._pool is not None:
+                self._pool.shutdown(wait=False, cancel_futures=True)
+                self._pool = None
+
+    def files(self, spec: Optional[LogQuerySpec] = None) -> List[str]:
+        """조건의 날짜 범위에 걸치는 파일 (경로에 날짜가 없는 파일은 항상 포함)"""
+        files = list_log_files(self.paths)
+        if spec is None:
+            return files
+        start, end = spec.scan_start_date(), spec.end_date
+        return [f for f in files if _in_range(f, start, end)]
+
+    def _chunks(self, files: List[str]) -> List[List[str]]:
+        return [files[i:i + self.chunk_size] for i in range(0, len(files), self.chunk_size)]
+
+    def _map(self, fn: Any, spec: LogQuerySpec) -> List[Any]:
+        chunks = self._chunks(self.files(spec))
+        if not chunks:
+            return []
+        if len(chunks) == 1 or self.workers == 1:
+            return [fn(c, self.schema, spec) for c in chunks]
+        pool = self._get_pool()
+        return list(pool.map(fn, chunks, itertools.repeat(self.schema), itertools.repeat(spec)))
+
+    def query(self, spec: LogQuerySpec) -> pd.DataFrame:
+        with stage("load") as s:
+            chunks = self._map(load_chunk, spec)
+            s.output(chunks)
+        with stage("merge", rows_in=sum(len(c) for c in chunks)) as s:
+            limit = spec.limit if spec.paged else None
+            offset = spec.offset if spec.paged else 0
+            df = merge_newest(chunks, self.schema, limit=limit, offset=offset)
+            df = df[[c for c in spec.output_columns(self.schema) if c in df.columns]]
+            s.output(df)
+        return df
+
+    def count(self, spec: LogQuerySpec) -> int:
+        return sum(self._map(count_chunk, spec.unpaged()))
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            **super().stats(),
+            "files": len(self.files()),
+            "workers": self.workers,
+            "chunk_size": self.chunk_size,
+            "executor": self.executor,
+        }
@@ -0,0 +1,166 @@
+# backend/filters.py
+"""
+get_lambda_logs / get_ses_logs / get_reports 가 공통으로 쓰는 필터 유틸
+"""
+
+from __future__ import annotations
+
+from datetime import timedelta, date
+from typing import Any, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+from pandas.api.types import is_datetime64_any_dtype
+
+from .search import search
+
+
+# ------------------------
+# 공통 유틸
+# ------------------------
+def _date_bounds(
+    start_date: Optional[date],
+    end_date: Optional[date],
+    tz: Any = None,
+) -> Tuple[Optional[np.datetime64], Optional[np.datetime64]]:
+    """날짜 범위를 [lo, hi) datetime64 경계로 한 번만 변환
+
+    end_date 는 '그 날짜 포함' 이므로 다음 날 0시를 배타적 상한으로 쓴다.
+    tz-aware 컬럼이면 해당 타임존 자정 기준으로 만든 뒤 UTC 값으로 맞춘다
+    (Series.values 는 UTC 기준 datetime64 를 돌려주기 때문).
+    """
+
+    def _to_ns(d: date) -> np.datetime64:
+        ts = pd.Timestamp(d.year, d.month, d.day)
+        if tz is not None:
+            ts = ts.tz_localize(tz).tz_convert("UTC").tz_localize(None)
+        return ts.to_datetime64()
+
+    lo = _to_ns(start_date) if start_date else None
+    hi = _to_ns(end_date + timedelta(days=1)) if end_date else None
+    return lo, hi
+
+
+def _apply_date_filter(
+    df: pd.DataFrame,
+    start_date: Optional[date],
+    end_date: Optional[date],
+    ts_col: str = "timestamp",
+) -> pd.DataFrame:
+    """날짜 필터 공통 적용 (timestamp 컬럼 기준으로 날짜 비교)
+
+    - 경계값을 datetime64 로 한 번만 바꾸고 컬럼 값과 직접 비교한다
+      (행마다 .dt.date 로 파이썬 date 객체를 만들지 않음)
+    - 이미 시간순(오름/내림차순) 정렬된 프레임이면 searchsorted 로 잘라낸다
+    - 컬럼이 이미 datetime 이면 copy / to_datetime 을 건너뛴다
+    """
+    if df.empty:
+        return df
+
+    if ts_col not in df.columns:
+        return df
+
+    # timestamp 컬럼을 datetime 으로 보장 (이미 datetime 이면 그대로 사용)
+    if not is_datetime64_any_dtype(df[ts_col]):
+        df = df.assign(**{ts_col: pd.to_datetime(df[ts_col])})
+
+    if not start_date and not end_date:
+        return df
+
+    ts = df[ts_col]
+    lo, hi = _date_bounds(start_date, end_date, getattr(ts.dt, "tz", None))
+    values = ts.values  # datetime64[ns] (tz-aware 면 UTC 기준)
+
+    # 정렬된 프레임: 이진 탐색으로 구간만 잘라냄 (NaT 가 있으면 monotonic 이 아님)
+    if ts.is_monotonic_increasing:
+        left = 0 if lo is None else values.searchsorted(lo, side="left")
+        right = len(values) if hi is None else values.searchsorted(hi, side="left")
+        return df.iloc[left:right]
+
+    if ts.is_monotonic_decreasing:
+        rev = values[::-1]
+        n = len(values)
+        left = 0 if hi is None else n - rev.searchsorted(hi, side="left")
+        right = n if lo is None else n - rev.searchsorted(lo, side="left")
+        return df.iloc[left:right]
+
+    # 정렬되지 않은 프레임: 네이티브 datetime64 비교로 한 번에 마스크 생성
+    mask = np.ones(len(values), dtype=bool)
+    if lo is not None:
+        mask &= values >= lo
+    if hi is not None:
+        mask &= values < hi
+    return df[mask]
+
+
+def _apply_keyword_filter(
+    df: pd.DataFrame,
+    keyword: str,
+    cols: Optional[List[str]] = None,
+    mode: str = "and",
+) -> pd.DataFrame:
+    """키워드가 들어간 행만 남기기 (여러 컬럼 OR 검색)
+
+    keyword 는 공백으로 여러 검색어를 줄 수 있고 ("따옴표" 는 한 구절),
+    mode 로 검색어끼리 AND / OR 조합을 고른다. 매칭은 정규화(NFKC + 소문자)한 리터럴 부분 문자열이고,
+    한글 검색어는 띄어쓰기와 끝의 조사를 무시한다 (backend/search.py, backend/analyzer.py).
+    """
+    if not keyword:
+        return df
+    if df.empty:
+        return df
+
+    if cols is None:
+        cols = [c for c in df.columns if df[c].dtype == "object"]
+
+    if not cols:
+        return df
+
+    mask = search(df, keyword, cols=cols, mode=mode)
+    if mask.all():
+        return df
+    return df[mask]
+
+
+def _apply_top_k(
+    df: pd.DataFrame,
+    limit: Optional[int],
+    offset: int = 0,
+    ts_col: str = "timestamp",
+    id_col: Optional[str] = None,
+    cursor: Optional[Tuple[Any, Any]] = None,
+) -> pd.DataFrame:
+    """최신순(ts 내림차순, 같은 시각은 id 내림차순) 한 페이지만 잘라내기
+
+    전체를 정렬하지 않고 (offset + limit) 번째로 큰 timestamp 를 np.partition 으로 구한 뒤
+    그 이상인 행만 정렬한다. cursor=(timestamp, id) 를 주면 그 행 '다음' 부터 (keyset).
+    limit 이 없으면 전체를 정렬해서 돌려준다.
+    """
+    if df.empty:
+        return df
+
+    ts = df[ts_col]
+    if not is_datetime64_any_dtype(ts):
+        df = df.assign(**{ts_col: pd.to_datetime(ts)})
+        ts = df[ts_col]
+    sort_cols = [ts_col] + ([id_col] if id_col and id_col in df.columns else [])
+
+    if cursor is not None:
+        c_ts, c_id = pd.Timestamp(cursor[0]), cursor[1]
+        older = ts < c_ts
+        if len(sort_cols) > 1 and c_id is not None:
+            older |= (ts == c_ts) & (df[id_col] < c_id)
+        df = df[older.to_numpy()]
+        ts = df[ts_col]
+
+    if limit is None:
+        return df.sort_values(sort_cols, ascending=False, kind="stable").iloc[offset:]
+
+    k = offset + limit
+    if k < len(df):
+        # NaT 는 int64 최솟값이라 자연스럽게 맨 뒤로 간다
+        values = ts.values.view("i8")
+        threshold = np.partition(values, len(values) - k)[len(values) - k]
+        df = df[values >= threshold]
+
+    return df.sort_values(sort_cols, ascending=False, kind="stable").iloc[offset:k]
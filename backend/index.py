@@ -0,0 +1,203 @@
+# backend/index.py
+"""
+로그 키워드 검색용 문자 n-gram 역색인
+
+- 토큰 = 정규화(NFKC + 소문자)하고 공백을 뺀 셀 값의 문자 n-gram (기본 2-gram)
+  한글은 띄어쓰기/조사와 상관없이 음절 2-gram 으로 부분 문자열 검색이 가능하다.
+  공백을 빼고 자르므로 검색어도 공백을 빼고 자르면 항상 후보에 들어간다 (검증은 KeywordSearcher)
+- posting list = 토큰이 등장한 행 번호(오름차순 int32 배열)
+- 새 배치가 들어오면 해당 배치만 토큰화해서 posting 뒤에 이어 붙인다 (증분 갱신).
+  (토큰, 행) 쌍은 ADD_ROWS 행 단위로 펼쳐서 빌드 중 메모리가 배치 크기에 비례해 커지지 않는다
+- 행마다 값이 다른 id 컬럼(request_id, message_id)은 n-gram 색인에 넣지 않는다 (posting 이 행 수 × 토큰 수).
+  그 컬럼은 candidates(query, scan=...) 의 scan 이 검색어를 직접 찾은 행을 후보에 더한다
+- 조회 결과는 '후보' 행이다. 2-gram 이 모두 들어있어도 원문에 연속으로 있는지는
+  KeywordSearcher 로 후보 행만 다시 확인해야 한다.
+"""
+
+from __future__ import annotations
+
+import sys
+from collections import defaultdict
+from typing import Callable, Dict, Iterable, List, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+from .search import SearchQuery, _compact_buffer, _lower_buffer
+
+# 한 번에 (토큰, 행) 쌍으로 펼치는 행 수 (빌드 중 최대 메모리 제한)
+ADD_ROWS = 65_536
+
+ROW_DTYPE = np.int32
+
+
+def ngrams(text: str, n: int) -> Iterable[str]:
+    """text 의 문자 n-gram (n 보다 짧으면 text 자체를 토큰 하나로)"""
+    if len(text) < n:
+        return (text,) if text else ()
+    return {text[i:i + n] for i in range(len(text) - n + 1)}
+
+
+class InvertedIndex:
+    """
+    여러 컬럼을 합친 행 단위 n-gram 역색인.
+    같은 값이 반복되는 로그 컬럼(function_name, message 템플릿 등)은
+    고유값 단위로만 토큰화하므로 행 수보다 고유값 수에 비례해 빌드된다.
+    """
+
+    def __init__(self, cols: Sequence[str], n: int = 2):
+        if n < 1:
+            raise ValueError("n-gram 길이는 1 이상이어야 합니다.")
+        self.cols = list(cols)
+        self.n = n
+        self._nrows = 0
+        # 토큰 → 배치별 행 번호 배열 (조회 시 한 번 합쳐서 다시 저장)
+        self._postings: Dict[str, List[np.ndarray]] = defaultdict(list)
+
+    def __len__(self) -> int:
+        return self._nrows
+
+    # ---------- 빌드 ----------
+    def add(self, batch: pd.DataFrame) -> None:
+        """새 로그 배치를 색인 (행 번호는 지금까지 색인된 행 수 뒤로 이어짐)"""
+        m = len(batch)
+        if m == 0:
+            return
+        if self._nrows + m > np.iinfo(ROW_DTYPE).max:
+            raise OverflowError(f"색인 행 수가 {np.iinfo(ROW_DTYPE).max:,} 를 넘습니다.")
+
+        # 행 구간마다 따로 색인 → 토큰별 posting 조각은 구간 순서대로 쌓여서 이어 붙이면 정렬 유지
+        for lo in range(0, m, ADD_ROWS):
+            self._add_rows(batch.iloc[lo:lo + ADD_ROWS], self._nrows + lo)
+        self._nrows += m
+
+    def _add_rows(self, batch: pd.DataFrame, offset: int) -> None:
+        # (토큰, 행 번호) 쌍을 배열로 모은 뒤 한 번에 정렬해서 토큰별로 자른다
+        # (고유값 × 토큰마다 작은 배열을 append 하지 않음)
+        tokens: List[str] = []
+        token_rows: List[np.ndarray] = []
+
+        for col in self.cols:
+            if col not in batch.columns:
+                continue
+            values = batch[col]
+            if isinstance(values.dtype, pd.CategoricalDtype):
+                # category 는 이미 코드가 있으므로 카테고리 문자열만 정규화 (결측 코드 -1 은 제외)
+                codes = values.cat.codes.to_numpy()
+                uniques = values.cat.categories.astype(str)
+            else:
+                codes, uniques = pd.factorize(values.astype(str), sort=False)
+            uniques = _compact_buffer(_lower_buffer(pd.Series(uniques, dtype=object))).to_pylist()
+
+            # 고유값별 행 번호 묶음 (codes 로 정렬 후 경계에서 자르기)
+            order = np.argsort(codes, kind="stable").astype(ROW_DTYPE)
+            bounds = np.searchsorted(codes[order], np.arange(len(uniques) + 1))
+
+            pair_codes: List[int] = []
+            for code, value in enumerate(uniques):
+                toks = ngrams(value, self.n)
+                tokens.extend(toks)
+                pair_codes.extend([code] * len(toks))
+            if not pair_codes:
+                continue
+
+            # 쌍마다 그 고유값의 행들로 펼침
+            pair_codes_arr = np.asarray(pair_codes, dtype=np.int64)
+            starts = bounds[pair_codes_arr]
+            counts = bounds[pair_codes_arr + 1] - starts
+            ends = np.cumsum(counts)
+            within = np.arange(ends[-1]) - np.repeat(ends - counts, counts)
+            token_rows.append((counts, order[np.repeat(starts, counts) + within] + ROW_DTYPE(offset)))
+
+        if tokens:
+            token_ids, vocab = pd.factorize(pd.Index(tokens, dtype=object), sort=False)
+            counts = np.concatenate([c for c, _ in token_rows])
+            rows = np.concatenate([r for _, r in token_rows]).astype(ROW_DTYPE, copy=False)
+            ids = np.repeat(token_ids.astype(ROW_DTYPE), counts)
+
+            # 토큰 → 행 순으로 정렬, 여러 컬럼에서 같은 (토큰, 행) 이 나오면 하나만
+            order = np.lexsort((rows, ids))
+            ids, rows = ids[order], rows[order]
+            keep = np.ones(len(ids), dtype=bool)
+            keep[1:] = (ids[1:] != ids[:-1]) | (rows[1:] != rows[:-1])
+            ids, rows = ids[keep], rows[keep]
+
+            cuts = np.flatnonzero(np.diff(ids)) + 1
+            for tok_id, chunk in zip(ids[np.r_[0, cuts]], np.split(rows, cuts)):
+                # split 조각은 정렬용 큰 배열의 view → 복사해서 원본 배열을 놓아줌
+                self._postings[vocab[tok_id]].append(chunk.copy())
+
+    # ---------- 조회 ----------
+    def postings(self, token: str) -> np.ndarray:
+        """토큰의 행 번호 배열 (오름차순)"""
+        chunks = self._postings.get(token)
+        if not chunks:
+            return np.empty(0, dtype=ROW_DTYPE)
+        if len(chunks) > 1:
+            # 배치마다 행 번호 구간이 겹치지 않으므로 이어 붙이기만 해도 정렬 유지
+            chunks[:] = [np.concatenate(chunks)]
+        return chunks[0]
+
+    def term_candidates(
+        self, term: str, scan: Optional[Callable[[str], np.ndarray]] = None
+    ) -> Optional[np.ndarray]:
+        """
+        term 을 포함할 수 있는 후보 행. 색인으로 판단할 수 없으면(너무 짧음) None.
+        scan 을 주면 색인하지 않은 컬럼에서 term 을 찾은 행(오름차순)을 후보에 더한다
+        """
+        compact = term.replace(" ", "")  # 색인 토큰과 같이 공백을 뺀 값으로 자름
+        if len(compact) < self.n:
+            return None
+        lists = sorted((self.postings(tok) for tok in ngrams(compact, self.n)), key=len)
+        result = lists[0]
+        for other in lists[1:]:
+            if len(result) == 0:
+                break
+            result = np.intersect1d(result, other, assume_unique=True)
+        if scan is not None:
+            result = np.union1d(result, scan(term))
+        return result
+
+    def candidates(
+        self, query: SearchQuery, scan: Optional[Callable[[str], np.ndarray]] = None
+    ) -> Optional[np.ndarray]:
+        """검색 조건의 후보 행 (AND 는 교집합, OR 는 합집합). 색인 사용 불가면 None"""
+        if query.regex or not query.terms:
+            return None
+
+        per_term = []
+        for term in query.terms:
+            rows = self.term_candidates(term, scan)
+            if rows is None:
+                if query.mode == "or":
+                    return None
+                continue  # AND: 짧은 검색어는 후보 검증 단계에서 확인
+            per_term.append(rows)
+
+        if not per_term:
+            return None
+
+        if query.mode == "and":
+            per_term.sort(key=len)
+            result = per_term[0]
+            for other in per_term[1:]:
+                result = np.intersect1d(result, other, assume_unique=True)
+            return result
+        return np.unique(np.concatenate(per_term))
+
+    # ---------- 크기 ----------
+    def memory_bytes(self) -> int:
+        """색인이 차지하는 대략적인 메모리 (토큰 문자열 + posting 배열 + dict 오버헤드)"""
+        total = sys.getsizeof(self._postings)
+        for tok, chunks in self._postings.items():
+            total += sys.getsizeof(tok) + sys.getsizeof(chunks)
+            total += sum(c.nbytes for c in chunks)
+        return total
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "rows": self._nrows,
+            "tokens": len(self._postings),
+            "postings": sum(len(c) for chunks in self._postings.values() for c in chunks),
+            "memory_bytes": self.memory_bytes(),
+        }
@@ -0,0 +1,338 @@
+# backend/ingest.py
+"""
+SES 이벤트 수집 파이프라인
+
+SES 이벤트 JSON(SNS 알림 / EventBridge / Firehose → S3 내보내기)을 읽어
+SES_SCHEMA 컬럼(timestamp, mail_to, subject, status, event_type, message_id)으로 바꾼 뒤
+큰 컬럼 단위 청크로 ingest_ses_logs 에 넘긴다.
+
+    with SesIngestPipeline(batch_size=20_000, flush_interval=1.0) as pipe:
+        for line in read_s3_export_dir("exports/ses/"):
+            pipe.submit(line)            # 큐가 가득 차면 여기서 기다림 (backpressure)
+    pipe.metrics()                       # events/s, lag, 큐 길이 ...
+
+- 큐는 크기 제한(max_queue)이 있어서 소비가 밀리면 생산 쪽이 막힌다
+- 소비 스레드는 batch_size 개가 모이거나 flush_interval 초가 지나면 한 번에 파싱 / 추가
+- 행 단위 append 없이 배치마다 컬럼 리스트 → DataFrame 한 번
+- sink 가 실패하면 소비 스레드가 멈추고, 큐에서 기다리던 submit / stop 은 그 오류(RuntimeError)로 끝난다
+"""
+
+from __future__ import annotations
+
+import gzip
+import json
+import os
+import queue
+import threading
+import time
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+import pandas as pd
+
+from .cloudwatch import SES_STATUS_BY_EVENT
+from .dtypes import compact_frame, to_local_naive
+from .sources import SES_SCHEMA
+
+RawEvent = Union[str, bytes, Dict[str, Any]]
+
+# 이벤트 종류별 상세 객체 키 (SES eventType → 이벤트 JSON 안의 키)
+_DETAIL_KEYS: Dict[str, str] = {
+    "Send": "send",
+    "Delivery": "delivery",
+    "Bounce": "bounce",
+    "Complaint": "complaint",
+    "Reject": "reject",
+    "DeliveryDelay": "deliveryDelay",
+    "Open": "open",
+    "Click": "click",
+}
+
+# 상세 객체 안의 수신자 목록 키 (메일 전체 destination 대신 실제 해당 수신자)
+_RECIPIENT_KEYS = ("bouncedRecipients", "complainedRecipients", "delayedRecipients")
+
+_STOP = object()
+
+# 큐가 가득 찼을 때 소비 스레드 상태를 다시 확인하는 간격 (초)
+_PUT_POLL = 0.1
+
+
+def _unwrap(event: Dict[str, Any]) -> Dict[str, Any]:
+    """EventBridge({"detail": ...}) / SNS({"Message": "..."}) 포장을 벗긴 SES 이벤트 (겹쳐 있어도)"""
+    while True:
+        if isinstance(event.get("detail"), dict):
+            event = event["detail"]
+        elif isinstance(event.get("Message"), str):
+            event = json.loads(event["Message"])
+        else:
+            return event
+
+
+def parse_ses_event(raw: RawEvent) -> Optional[Dict[str, Any]]:
+    """SES 이벤트 하나 → SES_SCHEMA 레코드 (SES 이벤트가 아니면 None)"""
+    event = json.loads(raw) if isinstance(raw, (str, bytes)) else raw
+    event = _unwrap(event)
+
+    # 이벤트 발행(eventType) / 구형 알림(notificationType) 둘 다 지원
+    event_type = event.get("eventType") or event.get("notificationType")
+    mail = event.get("mail")
+    if not event_type or not isinstance(mail, dict):
+        return None
+
+    detail = event.get(_DETAIL_KEYS.get(event_type, ""), {}) or {}
+    recipients = next((detail[k] for k in _RECIPIENT_KEYS if detail.get(k)), None)
+    if recipients:
+        mail_to = recipients[0].get("emailAddress")
+    else:
+        destination = mail.get("destination") or [None]
+        mail_to = destination[0]
+
+    headers = mail.get("commonHeaders") or {}
+    return {
+        "timestamp": detail.get("timestamp") or mail.get("timestamp"),
+        "mail_to": mail_to,
+        "subject": headers.get("subject"),
+        "status": SES_STATUS_BY_EVENT.get(event_type),
+        "event_type": event_type,
+        "message_id": mail.get("messageId"),
+    }
+
+
+def events_to_frame(raws: Iterable[RawEvent]) -> Tuple[pd.DataFrame, int]:
+    """
+    이벤트 묶음 → (SES_SCHEMA 프레임, 파싱 실패 수). 컬럼 리스트에 모은 뒤 프레임은 한 번만 만든다.
+    시각이 없거나 읽을 수 없는 이벤트는 버리고 파싱 실패 수에 넣는다
+    """
+    columns: Dict[str, List[Any]] = {c: [] for c in SES_SCHEMA.columns}
+    errors = 0
+    for raw in raws:
+        try:
+            record = parse_ses_event(raw)
+        except (ValueError, TypeError, AttributeError, KeyError, IndexError):
+            record = None
+        if record is None:
+            errors += 1
+            continue
+        for col, values in columns.items():
+            values.append(record[col])
+
+    df = pd.DataFrame(columns)
+    # SES 시각은 UTC ISO 문자열 → tz 없는 로컬 시각 (다른 소스 / UI 날짜 필터와 같은 기준)
+    ts = pd.to_datetime(df["timestamp"], utc=True, errors="coerce", format="ISO8601")
+    df["timestamp"] = to_local_naive(ts)
+    valid = df["timestamp"].notna()
+    errors += int((~valid).sum())
+    df = df[valid]
+    return compact_frame(df, SES_SCHEMA), errors
+
+
+# ------------------------
+# 입력
+# ------------------------
+def read_s3_export_dir(path: str) -> Iterator[str]:
+    """
+    S3 로 내보낸 SES 이벤트 파일 디렉터리 (Firehose 형식: 한 줄에 JSON 하나, .gz 가능).
+    파일 이름 순서대로 읽는다.
+    """
+    for root, _, names in sorted(os.walk(path)):
+        for name in sorted(names):
+            full = os.path.join(root, name)
+            opener = gzip.open if name.endswith(".gz") else open
+            with opener(full, "rt", encoding="utf-8") as f:
+                for line in f:
+                    line = line.strip()
+                    if line:
+                        yield line
+
+
+def read_queue(source: "queue.Queue[Any]", stop: Optional[threading.Event] = None, poll: float = 0.5) -> Iterator[Any]:
+    """로컬 큐(SQS 대용)에서 이벤트를 꺼냄. None 을 받거나 stop 이 설정되면 끝"""
+    while stop is None or not stop.is_set():
+        try:
+            item = source.get(timeout=poll)
+        except queue.Empty:
+            continue
+        if item is None:
+            return
+        yield item
+
+
+# ------------------------
+# 파이프라인
+# ------------------------
+class SesIngestPipeline:
+    """크기 제한 큐 + 배치 소비 스레드"""
+
+    def __init__(
+        self,
+        sink: Optional[Callable[[pd.DataFrame], None]] = None,
+        batch_size: int = 10_000,
+        flush_interval: float = 1.0,
+        max_queue: int = 100_000,
+    ):
+        if sink is None:
+            from .logs import ingest_ses_logs as sink
+
+        self.sink = sink
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._queue: "queue.Queue[Any]" = queue.Queue(maxsize=max_queue)
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+        self.received = 0
+        self.appended = 0
+        self.parse_errors = 0
+        self.batches = 0
+        self.last_batch_rows = 0
+        self.last_flush_seconds = 0.0
+        self.newest_event: Optional[pd.Timestamp] = None
+        self.started_at: Optional[float] = None
+        self.error: Optional[BaseException] = None
+
+    # ---------- 생산 ----------
+    def submit(self, raw: RawEvent, timeout: Optional[float] = None) -> None:
+        """이벤트 하나를 큐에 넣음 (가득 차면 timeout 까지 대기, 넘으면 queue.Full)"""
+        self._put(raw, timeout)
+        with self._lock:
+            self.received += 1
+
+    def _check_consumer(self) -> None:
+        if self.error is not None:
+            raise RuntimeError("SES 수집 스레드가 중단되었습니다.") from self.error
+        if self._thread is not None and not self._thread.is_alive():
+            raise RuntimeError("SES 수집 스레드가 종료되었습니다.")
+
+    def _put(self, item: Any, timeout: Optional[float]) -> None:
+        # 한 번에 오래 막히지 않고 _PUT_POLL 마다 소비 스레드가 살아 있는지 확인 (죽었으면 아무도 큐를 비우지 않음)
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            self._check_consumer()
+            wait = _PUT_POLL if deadline is None else min(_PUT_POLL, deadline - time.monotonic())
+            try:
+                self._queue.put(item, timeout=max(wait, 0.0))
+                return
+            except queue.Full:
+                if deadline is not None and time.monotonic() >= deadline:
+                    raise
+
+    def submit_many(self, raws: Iterable[RawEvent]) -> int:
+        n = 0
+        for raw in raws:
+            self.submit(raw)
+            n += 1
+        return n
+
+    # ---------- 소비 ----------
+    def start(self) -> "SesIngestPipeline":
+        if self._thread is None:
+            self.started_at = time.monotonic()
+            self._thread = threading.Thread(target=self._run, name="ses-ingest", daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """큐에 남은 이벤트까지 처리한 뒤 종료 (소비 스레드가 sink 오류로 멈췄으면 그 오류를 RuntimeError 로)"""
+        if self._thread is None:
+            return
+        thread = self._thread
+        if thread.is_alive():
+            try:
+                self._put(_STOP, None)
+            except RuntimeError:  # 기다리는 사이 소비 스레드가 멈춤 → 넣을 필요 없음
+                pass
+            thread.join(timeout)
+        if not thread.is_alive():
+            self._thread = None
+        if self.error is not None:
+            raise RuntimeError("SES 수집 스레드가 중단되었습니다.") from self.error
+
+    def __enter__(self) -> "SesIngestPipeline":
+        return self.start()
+
+    def __exit__(self, exc_type: Any, *exc: Any) -> None:
+        try:
+            self.stop()
+        except RuntimeError:
+            if exc_type is None:  # with 블록 안의 예외(대개 같은 sink 오류)를 가리지 않음
+                raise
+
+    def _run(self) -> None:
+        done = False
+        while not done:
+            batch: List[RawEvent] = []
+            deadline = time.monotonic() + self.flush_interval
+            while len(batch) < self.batch_size:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    item = self._queue.get(timeout=remaining)
+                except queue.Empty:
+                    break
+                if item is _STOP:
+                    done = True
+                    break
+                batch.append(item)
+            if batch:
+                try:
+                    self._flush(batch)
+                except BaseException as e:  # sink 실패 시 생산 쪽에 알리고 멈춤
+                    self.error = e
+                    return
+
+    def _flush(self, batch: List[RawEvent]) -> None:
+        t0 = time.perf_counter()
+        df, errors = events_to_frame(batch)
+        if not df.empty:
+            self.sink(df)
+        elapsed = time.perf_counter() - t0
+
+        with self._lock:
+            self.batches += 1
+            self.appended += len(df)
+            self.parse_errors += errors
+            self.last_batch_rows = len(df)
+            self.last_flush_seconds = elapsed
+            if not df.empty:
+                newest = df["timestamp"].max()
+                if self.newest_event is None or newest > self.newest_event:
+                    self.newest_event = newest
+
+    def flush(self, timeout: float = 30.0) -> None:
+        """지금까지 넣은 이벤트가 모두 처리될 때까지 대기"""
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            with self._lock:
+                done = self.appended + self.parse_errors >= self.received
+            if done or self.error is not None:
+                return
+            time.sleep(0.01)
+        raise TimeoutError("SES 이벤트 처리 대기 시간 초과")
+
+    # ---------- 지표 ----------
+    def metrics(self) -> Dict[str, Any]:
+        """처리량(events/s), 지연(가장 최근 이벤트 시각 대비 지금), 큐 길이 등"""
+        with self._lock:
+            elapsed = time.monotonic() - self.started_at if self.started_at else 0.0
+            lag = None
+            if self.newest_event is not None:
+                lag = (pd.Timestamp.now() - self.newest_event).total_seconds()
+            return {
+                "received": self.received,
+                "appended": self.appended,
+                "parse_errors": self.parse_errors,
+                "batches": self.batches,
+                "queue_depth": self._queue.qsize(),
+                "queue_max": self._queue.maxsize,
+                "events_per_second": self.appended / elapsed if elapsed else 0.0,
+                "last_batch_rows": self.last_batch_rows,
+                "last_flush_seconds": self.last_flush_seconds,
+                "lag_seconds": lag,
+            }
+
+
+def ingest_ses_directory(path: str, **kwargs: Any) -> Dict[str, Any]:
+    """S3 내보내기 디렉터리 전체를 수집하고 지표를 돌려준다"""
+    with SesIngestPipeline(**kwargs) as pipe:
+        pipe.submit_many(read_s3_export_dir(path))
+    return pipe.metrics()
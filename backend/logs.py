@@ -0,0 +1,472 @@
+# backend/logs.py
+
+from __future__ import annotations
+
+import os
+import threading
+import time
+from datetime import datetime, timedelta, date
+from typing import Dict, Any, List, Optional, Sequence, Tuple
+
+import pandas as pd
+
+from .correlate import correlate
+from .fetch import LogFetchResult, fetch_lambda_logs, fetch_ses_logs, gather_logs, gather_logs_sync
+from .filters import _apply_date_filter, _apply_keyword_filter, _apply_top_k
+from .profiling import PROFILER, profiled, stage
+from .query import LogQuery
+from .reports import LOG_REPORTS
+from .result_cache import RESULT_CACHE, batch_days, cached_result
+from .rollup import RESOLUTIONS, RollupTable
+from .tail import LogTail, tail_logs
+from .sources import (
+    LAMBDA_SCHEMA,
+    SES_SCHEMA,
+    LogQuerySpec,
+    LogSchema,
+    LogSource,
+    SQLiteLogSource,
+    TableLogSource,
+    ses_statuses_for_levels,
+)
+
+
+# ------------------------
+# 0. 로그 소스
+# ------------------------
+# 종류별 소스. 기본은 목업 데이터를 담은 메모리 테이블이고,
+# LOG_SOURCE=sqlite (LOG_SQLITE_PATH) / parquet (LOG_PARQUET_ROOT) / files (LOG_FILES_ROOT)
+# / cloudwatch (LAMBDA_LOG_GROUPS, SES_LOG_GROUPS) 환경변수나 set_log_source() 로 바꿀 수 있다.
+# LOG_SHARED_CACHE_DIR (LOG_SHARED_CACHE_HOURS) 를 주면 그 앞에 세션 공유 Arrow IPC 창 캐시를 둔다.
+_SOURCES: Dict[str, LogSource] = {}
+_SOURCES_LOCK = threading.Lock()
+
+_SCHEMAS: Dict[str, LogSchema] = {"lambda": LAMBDA_SCHEMA, "ses": SES_SCHEMA}
+
+# 종류별 시간 버킷 집계 (schema.category_cols 차원). 조회한 날짜만 소스의 volume() 집계로 하루씩 채우고
+# 그 뒤로는 ingest_* 배치로 증분 갱신한다. _ROLLUP_DAYS 는 날짜별 (채운 시각, 소스가 전부 셌는지).
+# 하루가 끝나고 _ROLLUP_SETTLE 이 지나기 전에 채운 날이나 다 세지 못한 날은 _ROLLUP_TTL 초가 지나면
+# 다시 채운다 (ingest_* 를 거치지 않고 소스에 직접 쓰이거나 늦게 도착한 행도 반영되도록).
+_ROLLUPS: Dict[str, RollupTable] = {}
+_ROLLUP_DAYS: Dict[str, Dict[date, Tuple[float, bool]]] = {}
+_ROLLUPS_LOCK = threading.Lock()
+_ROLLUP_TTL = 60.0
+_ROLLUP_SETTLE = timedelta(hours=1)
+# 시작 날짜 없이 조회하면 끝 날짜부터 이만큼만 채움
+_ROLLUP_DEFAULT_DAYS = 30
+
+
+def _default_source(kind: str) -> LogSource:
+    source = _base_source(kind)
+
+    # LOG_SHARED_CACHE_DIR 가 있으면 최근 창을 Arrow IPC 파일로 세션 간 공유
+    cache_dir = os.environ.get("LOG_SHARED_CACHE_DIR")
+    if cache_dir:
+        from .shared_cache import SharedWindowCache
+
+        hours = int(os.environ.get("LOG_SHARED_CACHE_HOURS", "24"))
+        source = SharedWindowCache(source, cache_dir, hours=hours)
+    return source
+
+
+def _base_source(kind: str) -> LogSource:
+    schema = _SCHEMAS[kind]
+    backend = os.environ.get("LOG_SOURCE", "memory").lower()
+
+    if backend == "sqlite":
+        return SQLiteLogSource(schema, os.environ.get("LOG_SQLITE_PATH", "logs.sqlite3"))
+
+    if backend == "parquet":
+        from .parquet import ParquetLogSource
+
+        root = os.environ.get("LOG_PARQUET_ROOT", "logs_parquet")
+        return ParquetLogSource(schema, os.path.join(root, kind))
+
+    if backend == "files":
+        from .files import FileLogSource
+
+        root = os.environ.get("LOG_FILES_ROOT", "logs_files")
+        return FileLogSource(
+            schema,
+            os.path.join(root, kind),
+            workers=int(os.environ.get("LOG_FILE_WORKERS", "0")) or None,
+            chunk_size=int(os.environ.get("LOG_FILE_CHUNK", "4")),
+            executor=os.environ.get("LOG_FILE_EXECUTOR", "process"),
+        )
+
+    if backend == "cloudwatch":
+        from .cloudwatch import CloudWatchLogSource
+
+        env = "LAMBDA_LOG_GROUPS" if kind == "lambda" else "SES_LOG_GROUPS"
+        groups = [g for g in os.environ.get(env, "").split(",") if g]
+        return CloudWatchLogSource(schema, groups)
+
+    source = TableLogSource(schema)
+    source.append(_mock_lambda_logs() if kind == "lambda" else _mock_ses_logs())
+    return source
+
+
+def get_log_source(kind: str) -> LogSource:
+    """'lambda' / 'ses' 소스 (처음 접근할 때 생성)"""
+    with _SOURCES_LOCK:
+        source = _SOURCES.get(kind)
+        if source is None:
+            source = _default_source(kind)
+            _SOURCES[kind] = source
+        return source
+
+
+def set_log_source(kind: str, source: LogSource) -> None:
+    """소스 교체 (테스트 / 부하 테스트 / 설정용)"""
+    if kind not in _SCHEMAS:
+        raise ValueError(f"알 수 없는 로그 종류입니다: {kind!r}")
+    with _SOURCES_LOCK:
+        _SOURCES[kind] = source
+    with _ROLLUPS_LOCK:
+        _ROLLUPS.pop(kind, None)
+        _ROLLUP_DAYS.pop(kind, None)
+    RESULT_CACHE.invalidate(kind)
+
+
+def _ingest(kind: str, batch: pd.DataFrame) -> None:
+    # 집계를 만드는 중에 들어온 배치가 두 번 세어지지 않도록 소스 추가와 집계 갱신을 같이 잠금
+    with _ROLLUPS_LOCK:
+        get_log_source(kind).append(batch)
+        rollup = _ROLLUPS.get(kind)
+        if rollup is not None:
+            rollup.add(batch)
+    RESULT_CACHE.invalidate(kind, days=batch_days(batch))
+
+
+def ingest_lambda_logs(batch: pd.DataFrame) -> None:
+    """새 Lambda 로그 배치를 소스에 추가 (메모리 소스는 역색인, 시간 버킷 집계도 증분 갱신)"""
+    _ingest("lambda", batch)
+
+
+def ingest_ses_logs(batch: pd.DataFrame) -> None:
+    """새 SES 로그 배치를 소스에 추가 (메모리 소스는 역색인, 시간 버킷 집계도 증분 갱신)"""
+    _ingest("ses", batch)
+
+
+def _rollup_stale(day: date, state: Optional[Tuple[float, bool]], now: float) -> bool:
+    if state is None:
+        return True
+    filled_at, complete = state
+    settled = datetime.combine(day + timedelta(days=1), datetime.min.time()) + _ROLLUP_SETTLE
+    # 하루가 끝나고 충분히 지난 뒤에 다 센 날은 그대로, 아니면 TTL 마다 다시
+    return (not complete or filled_at < settled.timestamp()) and now - filled_at > _ROLLUP_TTL
+
+
+def _fill_day(source: LogSource, rollup: RollupTable, day: date, today: date) -> bool:
+    """day 하루를 소스 집계로 다시 채움. 어떤 해상도로도 다 세지 못하면 비우고 False"""
+    spec = LogQuerySpec(start_date=day, end_date=day)
+    # 보관 기간이 지난 해상도는 건너뛰고, 소스가 다 세지 못하면(행 수 제한) 더 거친 해상도로
+    for res in RESOLUTIONS:
+        keep = rollup.retention.get(res)
+        if keep is not None and day < today - keep:
+            continue
+        counts = source.volume(spec, res)
+        if counts is not None:
+            rollup.replace(day, day + timedelta(days=1), counts, res)
+            return True
+    rollup.replace(day, day + timedelta(days=1), pd.Series(dtype="int64"))
+    return False
+
+
+def get_rollup(
+    kind: str, start_date: Optional[date] = None, end_date: Optional[date] = None
+) -> Tuple[RollupTable, List[date]]:
+    """
+    'lambda' / 'ses' 시간 버킷 집계와 그중 소스가 다 세지 못한 날짜 목록.
+    [start_date, end_date] 중 아직 안 채웠거나 오래된 날짜만 소스에서 하루씩 집계한다
+    (끝 날짜 기본 오늘, 시작 날짜 기본 그 _ROLLUP_DEFAULT_DAYS 일 전).
+    """
+    today = date.today()
+    end_date = end_date or today
+    start_date = start_date or end_date - timedelta(days=_ROLLUP_DEFAULT_DAYS - 1)
+    days = [start_date + timedelta(days=i) for i in range((min(end_date, today) - start_date).days + 1)]
+
+    # 채우는 동안 들어온 배치가 두 번 세어지지 않도록 _ingest 와 같은 잠금 안에서 채움
+    with _ROLLUPS_LOCK:
+        schema = _SCHEMAS[kind]
+        rollup = _ROLLUPS.get(kind)
+        if rollup is None:
+            rollup = _ROLLUPS[kind] = RollupTable(schema.category_cols, ts_col=schema.ts_col)
+        filled = _ROLLUP_DAYS.setdefault(kind, {})
+        source = get_log_source(kind)
+        # 최근 날짜부터 (분 / 시간 버킷 보관 기간이 최신 버킷 기준이라 과거 날짜가 먼저 들어가도 안 잘리게)
+        for day in reversed(days):
+            now = time.time()
+            if _rollup_stale(day, filled.get(day), now):
+                filled[day] = (now, _fill_day(source, rollup, day, today))
+        incomplete = [day for day in days if not filled[day][1]]
+    return rollup, incomplete
+
+
+def profile_stats() -> List[Dict[str, Any]]:
+    """단계별 누적 소요 시간 (PROFILER.to_json / to_prometheus 로 내보내기)"""
+    return PROFILER.summary()
+
+
+def cache_stats() -> Dict[str, Any]:
+    """결과 캐시 hit / miss / eviction 카운터와 사용 바이트"""
+    return RESULT_CACHE.stats()
+
+
+def index_stats() -> List[Dict[str, Any]]:
+    """소스별 행 수 / 토큰 수 / 역색인 메모리 사용량 등"""
+    return [get_log_source("lambda").stats(), get_log_source("ses").stats()]
+
+
+# ------------------------
+# 1. Lambda 로그 (목업)
+# ------------------------
+def _mock_lambda_logs() -> pd.DataFrame:
+    now = datetime.now()
+
+    data = [
+        {
+            "timestamp": now - timedelta(minutes=5),
+            "function_name": "process-orders",
+            "level": "INFO",
+            "message": "Order processing completed successfully.",
+            "request_id": "req-12345",
+        },
+        {
+            "timestamp": now - timedelta(minutes=15),
+            "function_name": "send-report-email",
+            "level": "ERROR",
+            "message": "Failed to send email: SES ThrottlingException",
+            "request_id": "req-23456",
+        },
+        {
+            "timestamp": now - timedelta(hours=1),
+            "function_name": "sync-users",
+            "level": "WARN",
+            "message": "User sync delayed due to API rate limiting.",
+            "request_id": "req-34567",
+        },
+        {
+            "timestamp": now - timedelta(hours=2),
+            "function_name": "sync-users",
+            "level": "DEBUG",
+            "message": "Sync started with batch_size=100",
+            "request_id": "req-45678",
+        },
+    ]
+
+    return pd.DataFrame(data)
+
+
+@profiled("get_lambda_logs")
+@cached_result("lambda")
+def get_lambda_logs(filters: Dict[str, Any]) -> pd.DataFrame:
+    """
+    Lambda 로그를 가져오는 목업 함수.
+    실제 환경에서는 이 부분에서 CloudWatch Logs / Insights 를 조회하면 됩니다.
+    """
+    # 날짜 / 로그 레벨 / 키워드(함수명, 메시지, request_id) 필터는 소스 쿼리로 내려보냄
+    # LogQuery 가 조건을 모아 한 번에 실행하고 결과 프레임은 마지막에 한 번만 만든다
+    query = LogQuery.from_filters(get_log_source("lambda"), filters)
+    with stage("fetch") as s:
+        df = query.collect()
+        s.output(df)
+
+    return df
+
+
+# ------------------------
+# 2. SES 로그 (목업)
+# ------------------------
+def _mock_ses_logs() -> pd.DataFrame:
+    now = datetime.now()
+
+    data = [
+        {
+            "timestamp": now - timedelta(minutes=3),
+            "mail_to": "user1@example.com",
+            "subject": "Daily Report",
+            "status": "DELIVERED",
+            "event_type": "Send",
+            "message_id": "msg-111",
+        },
+        {
+            "timestamp": now - timedelta(minutes=20),
+            "mail_to": "user2@example.com",
+            "subject": "Password Reset",
+            "status": "BOUNCE",
+            "event_type": "Bounce",
+            "message_id": "msg-222",
+        },
+        {
+            "timestamp": now - timedelta(hours=2),
+            "mail_to": "admin@example.com",
+            "subject": "Error Notification",
+            "status": "DELIVERED",
+            "event_type": "Send",
+            "message_id": "msg-333",
+        },
+        {
+            "timestamp": now - timedelta(days=1),
+            "mail_to": "user3@example.com",
+            "subject": "Weekly Summary",
+            "status": "COMPLAINT",
+            "event_type": "Complaint",
+            "message_id": "msg-444",
+        },
+    ]
+
+    return pd.DataFrame(data)
+
+
+@profiled("get_ses_logs")
+@cached_result("ses")
+def get_ses_logs(filters: Dict[str, Any]) -> pd.DataFrame:
+    """
+    SES 메일 로그 목업 함수.
+    실제 환경에서는 SES 이벤트(CloudWatch / EventBridge / S3)에 저장된 로그를 조회하면 됩니다.
+    """
+    # 날짜 / status(로그 레벨 매핑) / 키워드(메일 주소, 제목, message_id) 필터는 소스 쿼리로 내려보냄
+    # 로그 레벨 → SES status 매핑은 ses_statuses_for_levels 참고
+    # LogQuery 가 조건을 모아 한 번에 실행하고 결과 프레임은 마지막에 한 번만 만든다
+    query = LogQuery.from_filters(get_log_source("ses"), filters)
+    with stage("fetch") as s:
+        df = query.collect()
+        s.output(df)
+
+    return df
+
+
+# ------------------------
+# 페이지 보조 함수
+# ------------------------
+@cached_result("lambda", name="count")
+def count_lambda_logs(filters: Dict[str, Any]) -> int:
+    """get_lambda_logs 조건의 전체 건수 (limit / offset / cursor 무시, 정렬·행 생성 없음)"""
+    return get_log_source("lambda").count(LogQuerySpec.from_filters(LAMBDA_SCHEMA, filters))
+
+
+@cached_result("ses", name="count")
+def count_ses_logs(filters: Dict[str, Any]) -> int:
+    """get_ses_logs 조건의 전체 건수 (limit / offset / cursor 무시, 정렬·행 생성 없음)"""
+    return get_log_source("ses").count(LogQuerySpec.from_filters(SES_SCHEMA, filters))
+
+
+def next_cursor(df: pd.DataFrame, kind: str) -> Optional[Tuple[Any, Any]]:
+    """현재 페이지 마지막 행의 (timestamp, id) — 다음 페이지 filters["cursor"] 로 넘김"""
+    if df.empty:
+        return None
+    schema = _SCHEMAS[kind]
+    last = df.iloc[-1]
+    return last[schema.ts_col], last.get(schema.id_col)
+
+
+# ------------------------
+# 3. 리포트 목록
+# ------------------------
+REPORT_COLUMNS = ["report_name", "created_at", "description", "file_url"]
+
+
+def _invalidate_reports(days: List[str]) -> None:
+    # 로그 요약 리포트가 추가 / 교체 / 삭제되면 그 날짜가 걸친 get_reports 결과만 지움
+    try:
+        changed: Optional[List[date]] = [date.fromisoformat(d) for d in days]
+    except ValueError:  # 날짜 형식이 아니면 reports 항목 전체
+        changed = None
+    RESULT_CACHE.invalidate("reports", days=changed)
+
+
+LOG_REPORTS.on_change(_invalidate_reports)
+
+
+@profiled("get_reports")
+@cached_result("reports")
+def get_reports(filters: Dict[str, Any]) -> pd.DataFrame:
+    """
+    로그 요약 리포트 목록 (backend.reports.LOG_REPORTS, SQLite + FTS5).
+    키워드(리포트 이름, 설명) / 생성 날짜 / 페이지 조건은 SQL 로 처리하고 결과 행만 프레임으로 만든다.
+    한글 키워드는 띄어쓰기 / 조사와 무관하게 찾고 (backend/analyzer.py),
+    filters["order"] = "relevance" 면 관련도순 (기본 "recent" 최신순).
+    """
+    keyword: str = filters.get("keyword", "")
+    keyword_mode: str = filters.get("keyword_mode", "and")  # 여러 검색어 조합 (and / or)
+    selected_date: Optional[date] = filters.get("date")  # 생성일 기준 '같은 날짜'
+
+    # 최신순 / 관련도순 (limit / offset 이 있으면 그 페이지만 읽음)
+    with stage("search") as s:
+        reports = LOG_REPORTS.search(
+            keyword,
+            mode=keyword_mode,
+            day=selected_date,
+            limit=filters.get("limit"),
+            offset=int(filters.get("offset") or 0),
+            order=filters.get("order", "recent"),
+        )
+        df = pd.DataFrame(reports, columns=REPORT_COLUMNS)
+        df["created_at"] = pd.to_datetime(df["created_at"], format="ISO8601")
+        s.output(df)
+
+    return df
+
+
+# ------------------------
+# 4. 시간 버킷 집계 (대시보드 요약)
+# ------------------------
+def log_volume(
+    kind: str,
+    start_date: Optional[date] = None,
+    end_date: Optional[date] = None,
+    resolution: str = "auto",
+    by: Sequence[str] = (),
+    where: Optional[Dict[str, Sequence[str]]] = None,
+) -> pd.DataFrame:
+    """
+    구간의 버킷별 로그 건수 (원본이 아니라 집계 테이블을 읽음).
+    by / where 차원: lambda = function_name, level / ses = status, event_type
+    resolution: minute / hour / day / auto (구간 길이에 맞춰 선택)
+
+    소스가 다 세지 못한 날짜(CloudWatch 결과 행 수 제한 등)는 건수 없이 df.attrs["incomplete_days"] 에 담긴다.
+
+    예) log_volume("lambda", d - timedelta(days=29), d, by=("function_name",), where={"level": ["ERROR"]})
+    """
+    rollup, incomplete = get_rollup(kind, start_date, end_date)
+    df = rollup.query(start_date, end_date, resolution=resolution, by=by, where=where)
+    df.attrs["incomplete_days"] = incomplete
+    return df
+
+
+def ses_event_rates(
+    start_date: Optional[date] = None,
+    end_date: Optional[date] = None,
+    resolution: str = "auto",
+) -> pd.DataFrame:
+    """버킷별 SES 전체 건수와 BOUNCE / COMPLAINT 비율 (bucket, total, bounce_rate, complaint_rate)"""
+    counts = log_volume("ses", start_date, end_date, resolution=resolution, by=("status",))
+    wide = counts.pivot_table(index="bucket", columns="status", values="count", aggfunc="sum", fill_value=0)
+    total = wide.sum(axis=1)
+    return pd.DataFrame(
+        {
+            "total": total,
+            "bounce_rate": wide.get("BOUNCE", 0) / total,
+            "complaint_rate": wide.get("COMPLAINT", 0) / total,
+        }
+    ).reset_index()
+
+
+# ------------------------
+# 5. Lambda ↔ SES 연결 타임라인
+# ------------------------
+@profiled("correlate_logs")
+def correlate_logs(filters: Dict[str, Any], window: str = "5min", **kwargs: Any) -> pd.DataFrame:
+    """
+    같은 filters(날짜 / 레벨 / 키워드)로 Lambda, SES 로그를 동시에 가져와 연결한 타임라인.
+    레벨은 SES 쪽에서 status 로 바뀌므로 levels=["ERROR"] 면 Lambda 오류 ↔ BOUNCE / COMPLAINT.
+    나머지 인자는 backend.correlate.correlate 참고.
+    """
+    # 연결은 전체 행이 필요하므로 페이지 / 컬럼 조건은 뺀다
+    base = {k: v for k, v in filters.items() if k not in ("limit", "offset", "cursor", "columns")}
+    results = gather_logs_sync({"lambda": base, "ses": base})
+    with stage("correlate") as s:
+        timeline = correlate(results["lambda"].frame, results["ses"].frame, window=window, **kwargs)
+        s.output(timeline)
+    return timeline
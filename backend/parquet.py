@@ -0,0 +1,233 @@
+# backend/parquet.py
+"""
+날짜별로 파티션된 Parquet 로그 저장소
+
+    <root>/date=2025-11-24/function_name=send-report-email/<uuid>-0.parquet   (lambda)
+    <root>/date=2025-11-24/event_type=Bounce/<uuid>-0.parquet                 (ses)
+
+- start_date / end_date 는 date=... 디렉터리 단위로 잘라서 범위 밖 파일은 열지 않는다
+- levels / status / 키워드 조건은 Arrow dataset 필터 식으로 내려보낸다 (predicate pushdown)
+- 키워드는 메모리 검색과 같은 규칙 (한글 검색어는 공백을 뺀 값에서, NFKC). 필터 식은 NFKC 가 필요할 수 있는 행
+  (ASCII / 한글 음절 밖의 문자가 있는 행)도 통과시키므로 읽은 행을 exact_keyword_rows 로 다시 거른다
+- spec.columns 가 있으면 그 컬럼만 읽는다
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+import uuid
+from datetime import date
+from typing import Any, Dict, List, Optional
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.dataset as ds
+
+from .dtypes import arrow_strings, compact_frame, to_local_naive
+from .search import NFKC_UNSTABLE, KeywordSearcher, match_term, parse_keyword, term_regex
+from .sources import LogQuerySpec, LogSchema, LogSource
+
+DATE_PARTITION = "date"
+
+# 날짜 다음 단계 파티션 컬럼
+SUB_PARTITION: Dict[str, str] = {"lambda": "function_name", "ses": "event_type"}
+
+
+def _date_dirs(root: str, start_date: Optional[date], end_date: Optional[date]) -> List[str]:
+    """범위 안의 date=YYYY-MM-DD 디렉터리 (사전순 = 날짜순)"""
+    if not os.path.isdir(root):
+        return []
+    lo = start_date.isoformat() if start_date else None
+    hi = end_date.isoformat() if end_date else None
+    prefix = f"{DATE_PARTITION}="
+
+    dirs = []
+    for name in sorted(os.listdir(root)):
+        if not name.startswith(prefix):
+            continue
+        day = name[len(prefix):]
+        if lo and day < lo:
+            continue
+        if hi and day > hi:
+            break
+        dirs.append(os.path.join(root, name))
+    return dirs
+
+
+class ParquetLogSource(LogSource):
+    """Parquet 데이터셋 로그 소스 (append 는 배치 단위로 새 파일을 추가)"""
+
+    def __init__(self, schema: LogSchema, root: str):
+        super().__init__(schema)
+        self.root = root
+        self.sub_partition = SUB_PARTITION[schema.kind]
+        self.partitioning = ds.partitioning(
+            pa.schema([(DATE_PARTITION, pa.string()), (self.sub_partition, pa.string())]),
+            flavor="hive",
+        )
+        self._lock = threading.Lock()
+
+    # ---------- 쓰기 ----------
+    def append(self, batch: pd.DataFrame) -> None:
+        if batch.empty:
+            return
+        ts_col = self.schema.ts_col
+        batch = batch[list(self.schema.columns)].copy()
+        # tz 가 붙은 timestamp 는 tz 없는 로컬 시각으로 (파일마다 타입이 달라지면 since / cursor 비교 실패)
+        batch[ts_col] = to_local_naive(pd.to_datetime(batch[ts_col]))
+        batch = batch.sort_values(ts_col, kind="stable")
+        batch[DATE_PARTITION] = batch[ts_col].dt.strftime("%Y-%m-%d")
+
+        table = pa.Table.from_pandas(batch, preserve_index=False)
+        with self._lock:
+            ds.write_dataset(
+                table,
+                self.root,
+                format="parquet",
+                partitioning=self.partitioning,
+                basename_template=f"{uuid.uuid4().hex}-{{i}}.parquet",
+                existing_data_behavior="overwrite_or_ignore",
+            )
+
+    # ---------- 읽기 ----------
+    def dataset(self, start_date: Optional[date], end_date: Optional[date]) -> Optional[ds.Dataset]:
+        """날짜 범위의 파티션 디렉터리만 대상으로 하는 데이터셋 (없으면 None)"""
+        files = [
+            os.path.join(path, name)
+            for d in _date_dirs(self.root, start_date, end_date)
+            for path, _, names in os.walk(d)
+            for name in sorted(names)
+            if name.endswith(".parquet")
+        ]
+        if not files:
+            return None
+        return ds.dataset(
+            files,
+            format="parquet",
+            partitioning=self.partitioning,
+            partition_base_dir=self.root,
+        )
+
+    def build_filter(self, spec: LogQuerySpec) -> Optional[ds.Expression]:
+        """spec → Arrow 필터 식 (date 파티션 / level·status / 키워드)"""
+        exprs: List[ds.Expression] = []
+
+        start_date = spec.scan_start_date()
+        if start_date:
+            exprs.append(ds.field(DATE_PARTITION) >= start_date.isoformat())
+        if spec.since is not None:
+            exprs.append(ds.field(self.schema.ts_col) >= pa.scalar(spec.since, pa.timestamp("us")))
+        if spec.end_date:
+            exprs.append(ds.field(DATE_PARTITION) <= spec.end_date.isoformat())
+
+        predicate = arrow_predicate(self.schema, spec)
+        if predicate is not None:
+            exprs.append(predicate)
+
+        if not exprs:
+            return None
+        return _combine(exprs, "and")
+
+    def query(self, spec: LogQuerySpec) -> pd.DataFrame:
+        columns = spec.output_columns(self.schema)
+        dataset = self.dataset(spec.scan_start_date(), spec.end_date)
+        if dataset is None:
+            return pd.DataFrame(columns=columns)
+
+        extra = list(self.schema.search_cols) if spec.keyword else []
+        if spec.paged:
+            extra.append(self.schema.id_col)
+        read_cols = columns + [c for c in dict.fromkeys(extra) if c not in columns]
+        table = dataset.to_table(columns=read_cols, filter=self.build_filter(spec))
+        table = exact_keyword_rows(table, self.schema, spec)
+        if spec.paged:
+            table = arrow_page(table, self.schema, spec)
+        table = table.select(columns)
+        return compact_frame(table.to_pandas(types_mapper=arrow_strings), self.schema)
+
+    def count(self, spec: LogQuerySpec) -> int:
+        dataset = self.dataset(spec.scan_start_date(), spec.end_date)
+        if dataset is None:
+            return 0
+        spec = spec.unpaged()
+        if not parse_keyword(spec.keyword, mode=spec.keyword_mode).terms:
+            return dataset.count_rows(filter=self.build_filter(spec))
+        table = dataset.to_table(columns=list(self.schema.search_cols), filter=self.build_filter(spec))
+        return exact_keyword_rows(table, self.schema, spec).num_rows
+
+    def stats(self) -> Dict[str, Any]:
+        dirs = _date_dirs(self.root, None, None)
+        files = sum(len(files) for d in dirs for _, _, files in os.walk(d))
+        return {**super().stats(), "root": self.root, "days": len(dirs), "files": files}
+
+
+def arrow_predicate(schema: LogSchema, spec: LogQuerySpec) -> Optional[ds.Expression]:
+    """level·status / cursor / 키워드 조건 → Arrow 필터 식 (날짜 조건은 제외, 없으면 None)"""
+    exprs: List[ds.Expression] = []
+
+    if spec.level_values:
+        exprs.append(ds.field(schema.level_col).isin(list(spec.level_values)))
+
+    if spec.cursor is not None:
+        c_ts = pa.scalar(pd.Timestamp(spec.cursor[0]).to_pydatetime(), pa.timestamp("us"))
+        ts, ident = ds.field(schema.ts_col), ds.field(schema.id_col)
+        exprs.append((ts < c_ts) | ((ts == c_ts) & (ident < spec.cursor[1])))
+
+    query = parse_keyword(spec.keyword, mode=spec.keyword_mode)
+    if query.terms:
+        term_exprs = []
+        for term in query.terms:
+            needle, compact = match_term(term)
+            cols = [_keyword_candidate(_text_field(schema, c), needle, compact) for c in schema.search_cols]
+            term_exprs.append(_combine(cols, "or"))
+        exprs.append(_combine(term_exprs, query.mode))
+
+    if not exprs:
+        return None
+    return _combine(exprs, "and")
+
+
+def _keyword_candidate(text: ds.Expression, needle: str, compact: bool) -> ds.Expression:
+    """대소문자 무시로 needle 이 있거나(한글이면 글자 사이 공백 허용), NFKC 로 값이 바뀔 수 있는 행 (정규식 한 번)"""
+    return pc.match_substring_regex(text, f"(?i:{term_regex(needle, compact)})|{NFKC_UNSTABLE}")
+
+
+def exact_keyword_rows(table: pa.Table, schema: LogSchema, spec: LogQuerySpec) -> pa.Table:
+    """arrow_predicate 로 거른 행 중 키워드 조건을 정말 만족하는 행 (NFKC 까지 메모리 검색과 같게)"""
+    query = parse_keyword(spec.keyword, mode=spec.keyword_mode)
+    if not query.terms or table.num_rows == 0:
+        return table
+    cols = list(schema.search_cols)
+    df = table.select(cols).to_pandas(types_mapper=arrow_strings)
+    return table.filter(pa.array(KeywordSearcher(df).mask(query, cols)))
+
+
+def arrow_page(table: pa.Table, schema: LogSchema, spec: LogQuerySpec) -> pa.Table:
+    """최신순 한 페이지 (select_k_unstable 로 상위 offset + limit 행만 고른 뒤 그것만 정렬)"""
+    keys = [(schema.ts_col, "descending")]
+    if schema.id_col in table.column_names:
+        keys.append((schema.id_col, "descending"))
+
+    if spec.limit is not None:
+        k = spec.offset + spec.limit
+        if k < table.num_rows:
+            table = table.take(pc.select_k_unstable(table, k, sort_keys=keys))
+    table = table.sort_by(keys)
+    return table.slice(spec.offset, spec.limit)
+
+
+def _text_field(schema: LogSchema, col: str) -> ds.Expression:
+    """문자열 검색용 필드 (category 컬럼은 dictionary 로 저장될 수 있어 string 으로 캐스팅)"""
+    if col in schema.category_cols:
+        return ds.field(col).cast(pa.string())
+    return ds.field(col)
+
+
+def _combine(exprs: List[ds.Expression], mode: str) -> ds.Expression:
+    result = exprs[0]
+    for e in exprs[1:]:
+        result = (result & e) if mode == "and" else (result | e)
+    return result
+
@@ -0,0 +1,228 @@
+# backend/profiling.py
+"""
+조회 / 렌더링 단계별 시간 측정
+
+    @profiled("get_lambda_logs")          # 최상위 호출 = 하나의 trace
+    def get_lambda_logs(filters): ...
+
+    with stage("fetch") as s:             # trace 안의 한 단계
+        df = source.query(spec)
+        s.output(df)                      # 출력 행 수 / 바이트 기록
+
+- 기록: 단계 이름, 소요 시간, 입력 / 출력 행 수, 출력 바이트(얕은 memory_usage, 행 단위 작업 없음)
+- trace 단위로 sample_rate 만큼만 기록하고, 샘플되지 않은 trace 의 단계는 아무것도 하지 않는다
+- 최근 capacity 개 기록은 링 버퍼(deque)에, 단계별 누적 합계는 별도로 유지
+- to_json() / to_prometheus() 로 내보내기
+
+환경 변수
+    LOG_PROFILE_SAMPLE : 0 ~ 1 (기본 1.0, 0 이면 끔)
+    LOG_PROFILE_BUFFER : 링 버퍼 크기 (기본 2000)
+"""
+
+from __future__ import annotations
+
+import functools
+import itertools
+import json
+import os
+import random
+import sys
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass
+from typing import Any, Callable, Deque, Dict, Iterator, List, Optional, Tuple
+
+
+@dataclass
+class StageRecord:
+    """단계 하나의 측정 결과"""
+
+    trace_id: int
+    root: str
+    name: str
+    parent: Optional[str]
+    started_at: float
+    seconds: float = 0.0
+    rows_in: Optional[int] = None
+    rows_out: Optional[int] = None
+    bytes_out: Optional[int] = None
+
+    def output(self, value: Any) -> None:
+        """단계 결과(DataFrame / 길이가 있는 값)의 행 수와 바이트"""
+        # pandas 는 import 하지 않는다 (아직 안 불러왔으면 DataFrame 일 수도 없음)
+        pd = sys.modules.get("pandas")
+        if pd is not None and isinstance(value, pd.DataFrame):
+            self.rows_out = len(value)
+            self.bytes_out = int(value.memory_usage(index=False, deep=False).sum())
+        elif hasattr(value, "__len__"):
+            self.rows_out = len(value)
+
+
+class _NullRecord:
+    """샘플되지 않은 trace 에서 쓰는 아무것도 하지 않는 기록"""
+
+    def output(self, value: Any) -> None:
+        pass
+
+
+_NULL = _NullRecord()
+
+
+class Profiler:
+    """trace 샘플링 + 링 버퍼 + 단계별 누적 합계 (스레드 안전)"""
+
+    def __init__(self, capacity: int = 2000, sample_rate: float = 1.0):
+        self.sample_rate = sample_rate
+        self.records: Deque[StageRecord] = deque(maxlen=capacity)
+        # (최상위 호출, 단계 이름) → [횟수, 시간 합, 최대 시간, 출력 행 합]
+        self.totals: Dict[Tuple[str, str], List[float]] = {}
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._ids = itertools.count(1)
+
+    # ---------- 측정 ----------
+    def _stack(self) -> List[Any]:
+        stack = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = self._local.stack = []
+        return stack
+
+    @contextmanager
+    def stage(self, name: str, rows_in: Optional[int] = None) -> Iterator[Any]:
+        """단계 측정. 진행 중인 trace 가 없으면 새 trace 를 시작한다 (샘플링은 trace 단위)"""
+        stack = self._stack()
+        if stack:
+            parent = stack[-1]
+            if parent is _NULL:
+                yield _NULL
+                return
+            record = StageRecord(
+                parent.trace_id, parent.root, name, parent.name, time.time(), rows_in=rows_in
+            )
+        elif self.sample_rate > 0 and (self.sample_rate >= 1 or random.random() < self.sample_rate):
+            record = StageRecord(next(self._ids), name, name, None, time.time(), rows_in=rows_in)
+        else:
+            stack.append(_NULL)
+            try:
+                yield _NULL
+            finally:
+                stack.pop()
+            return
+
+        stack.append(record)
+        t0 = time.perf_counter()
+        try:
+            yield record
+        finally:
+            record.seconds = time.perf_counter() - t0
+            stack.pop()
+            self._add(record)
+
+    def _add(self, record: StageRecord) -> None:
+        with self._lock:
+            self.records.append(record)
+            key = (record.root, record.name)
+            total = self.totals.get(key)
+            if total is None:
+                total = self.totals[key] = [0, 0.0, 0.0, 0]
+            total[0] += 1
+            total[1] += record.seconds
+            total[2] = max(total[2], record.seconds)
+            total[3] += record.rows_out or 0
+
+    def profiled(self, name: Optional[str] = None) -> Callable:
+        """함수 호출 전체를 한 단계로 측정하는 데코레이터 (반환값의 행 수 / 바이트도 기록)"""
+
+        def decorator(fn: Callable) -> Callable:
+            label = name or fn.__name__
+
+            @functools.wraps(fn)
+            def wrapper(*args: Any, **kwargs: Any) -> Any:
+                with self.stage(label) as record:
+                    result = fn(*args, **kwargs)
+                    record.output(result)
+                    return result
+
+            return wrapper
+
+        return decorator
+
+    # ---------- 조회 / 내보내기 ----------
+    def recent(self, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """최근 기록 (오래된 것부터)"""
+        with self._lock:
+            records = list(self.records)
+        if limit is not None:
+            records = records[-limit:]
+        return [asdict(r) for r in records]
+
+    def summary(self) -> List[Dict[str, Any]]:
+        """(최상위 호출, 단계)별 누적 합계"""
+        with self._lock:
+            items = sorted(self.totals.items())
+        return [
+            {
+                "root": root,
+                "stage": name,
+                "count": int(count),
+                "seconds_sum": total,
+                "seconds_avg": total / count if count else 0.0,
+                "seconds_max": worst,
+                "rows_out_sum": int(rows),
+            }
+            for (root, name), (count, total, worst, rows) in items
+        ]
+
+    def to_json(self, limit: Optional[int] = None) -> str:
+        return json.dumps(
+            {"sample_rate": self.sample_rate, "summary": self.summary(), "records": self.recent(limit)},
+            ensure_ascii=False,
+        )
+
+    def to_prometheus(self) -> str:
+        """Prometheus text exposition 형식 (단계별 summary)"""
+        lines = [
+            "# HELP log_stage_seconds 단계별 소요 시간 (샘플된 호출만)",
+            "# TYPE log_stage_seconds summary",
+        ]
+        summary = self.summary()
+        for s in summary:
+            label = _labels(s)
+            lines.append(f"log_stage_seconds_count{{{label}}} {s['count']}")
+            lines.append(f"log_stage_seconds_sum{{{label}}} {s['seconds_sum']:.6f}")
+        lines += [
+            "# HELP log_stage_seconds_max 단계별 최대 소요 시간",
+            "# TYPE log_stage_seconds_max gauge",
+        ]
+        for s in summary:
+            lines.append(f"log_stage_seconds_max{{{_labels(s)}}} {s['seconds_max']:.6f}")
+        lines += [
+            "# HELP log_stage_rows_out_total 단계별 출력 행 수 합계",
+            "# TYPE log_stage_rows_out_total counter",
+        ]
+        for s in summary:
+            lines.append(f"log_stage_rows_out_total{{{_labels(s)}}} {s['rows_out_sum']}")
+        return "\n".join(lines) + "\n"
+
+    def clear(self) -> None:
+        with self._lock:
+            self.records.clear()
+            self.totals.clear()
+
+
+def _labels(row: Dict[str, Any]) -> str:
+    def quote(value: str) -> str:
+        return '"' + value.replace("\\", "\\\\").replace('"', '\\"') + '"'
+
+    return f"root={quote(row['root'])},stage={quote(row['stage'])}"
+
+
+PROFILER = Profiler(
+    capacity=int(os.environ.get("LOG_PROFILE_BUFFER", "2000")),
+    sample_rate=float(os.environ.get("LOG_PROFILE_SAMPLE", "1.0")),
+)
+
+stage = PROFILER.stage
+profiled = PROFILER.profiled
@@ -0,0 +1,131 @@
+# backend/query.py
+"""
+지연 실행 로그 쿼리
+
+    df = (
+        LogQuery(get_log_source("ses"))
+        .between(start, end)
+        .levels(["ERROR"])              # SES 는 status(BOUNCE / COMPLAINT)로 바꿔서 적용
+        .contains("invoice")
+        .order_by("timestamp", desc=True)
+        .limit(100)
+        .collect()
+    )
+
+메서드는 조건만 모으고(새 LogQuery 반환) 실행은 collect() / count() 때 한 번만 한다.
+조건은 LogQuerySpec 으로 소스에 한꺼번에 내려가서, 소스가 적용 순서를 정하고
+(메모리 소스는 예상 행 수가 적은 조건부터 행 번호만 좁혀 감) 결과 프레임은 마지막에 한 번만 만든다.
+explain() 으로 소스가 세운 계획을 볼 수 있다.
+"""
+
+from __future__ import annotations
+
+from dataclasses import replace
+from datetime import date, datetime
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import pandas as pd
+
+from .profiling import stage
+from .sources import LogQuerySpec, LogSource, ses_statuses_for_levels
+
+
+class LogQuery:
+    """LogSource 위의 불변 쿼리 빌더"""
+
+    def __init__(
+        self,
+        source: LogSource,
+        spec: Optional[LogQuerySpec] = None,
+        order: Optional[Tuple[str, bool]] = None,
+    ):
+        self.source = source
+        self.schema = source.schema
+        self.spec = spec or LogQuerySpec()
+        # (컬럼, 내림차순 여부). None 이면 timestamp 내림차순
+        self.order = order
+
+    @classmethod
+    def from_filters(cls, source: LogSource, filters: Dict[str, Any]) -> "LogQuery":
+        """UI filters dict 로 만든 쿼리 (get_lambda_logs / get_ses_logs 와 같은 해석)"""
+        return cls(source, LogQuerySpec.from_filters(source.schema, filters))
+
+    def _with(self, **changes: Any) -> "LogQuery":
+        return LogQuery(self.source, replace(self.spec, **changes), self.order)
+
+    # ---------- 조건 ----------
+    def between(self, start: Optional[date] = None, end: Optional[date] = None) -> "LogQuery":
+        """start ~ end 날짜 (양 끝 포함)"""
+        return self._with(start_date=start, end_date=end)
+
+    def since(self, ts: Optional[datetime]) -> "LogQuery":
+        """timestamp >= ts"""
+        return self._with(since=ts)
+
+    def levels(self, levels: Optional[Iterable[str]]) -> "LogQuery":
+        """로그 레벨 조건 (SES 는 ses_statuses_for_levels 로 status 조건으로 바꿈)"""
+        levels = list(levels or [])
+        if self.schema.kind == "ses":
+            levels = ses_statuses_for_levels(levels) or []
+        return self._with(level_values=tuple(levels) or None)
+
+    def statuses(self, statuses: Optional[Iterable[str]]) -> "LogQuery":
+        """schema.level_col 값을 그대로 지정 (SES status 직접 지정 등)"""
+        return self._with(level_values=tuple(statuses or ()) or None)
+
+    def contains(self, keyword: str, mode: str = "and") -> "LogQuery":
+        """검색 컬럼 중 하나에 keyword 의 검색어들이 포함 (and / or)"""
+        return self._with(keyword=keyword or "", keyword_mode=mode)
+
+    def select(self, *columns: str) -> "LogQuery":
+        """결과 컬럼 (timestamp 는 항상 포함)"""
+        return self._with(columns=tuple(columns) or None)
+
+    # ---------- 정렬 / 페이지 ----------
+    def order_by(self, column: str, desc: bool = True) -> "LogQuery":
+        return LogQuery(self.source, self.spec, (column, desc))
+
+    def limit(self, n: Optional[int]) -> "LogQuery":
+        return self._with(limit=n)
+
+    def offset(self, n: int) -> "LogQuery":
+        return self._with(offset=int(n or 0))
+
+    def after(self, cursor: Optional[Tuple[Any, Any]]) -> "LogQuery":
+        """(timestamp, id) 다음 행부터 (최신순 keyset 페이지)"""
+        return self._with(cursor=tuple(cursor) if cursor else None)
+
+    # ---------- 실행 ----------
+    def _default_order(self) -> bool:
+        return self.order is None or self.order == (self.schema.ts_col, True)
+
+    def collect(self) -> pd.DataFrame:
+        """조건을 한 번에 적용해서 결과 프레임을 만든다"""
+        spec = self.spec
+        if self._default_order():
+            # 최신순: 페이지가 있으면 소스가 top-K 로 그 페이지만 정렬해서 돌려줌
+            df = self.source.query(spec)
+            if not spec.paged:
+                with stage("sort", rows_in=len(df)):
+                    df = df.sort_values(self.schema.ts_col, ascending=False, kind="stable")
+            return df.reset_index(drop=True)
+
+        # 다른 정렬은 조건만 소스에 내려보내고 정렬 / 페이지는 여기서
+        column, desc = self.order
+        if spec.cursor is not None:
+            raise ValueError("cursor 페이지는 timestamp 내림차순 정렬에서만 쓸 수 있습니다.")
+        df = self.source.query(spec.unpaged())
+        with stage("sort", rows_in=len(df)):
+            df = df.sort_values(column, ascending=not desc, kind="stable")
+        stop = None if spec.limit is None else spec.offset + spec.limit
+        return df.iloc[spec.offset:stop].reset_index(drop=True)
+
+    def count(self) -> int:
+        """페이지 조건을 뺀 전체 건수"""
+        return self.source.count(self.spec)
+
+    def explain(self) -> List[Dict[str, Any]]:
+        return self.source.explain(self.spec)
+
+    def __repr__(self) -> str:
+        return f"LogQuery({self.schema.kind}, {self.spec}, order={self.order})"
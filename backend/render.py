@@ -0,0 +1,126 @@
+# backend/render.py
+"""
+리포트 HTML 조각 렌더링 (Jinja2 템플릿 + 캐시)
+
+    for html in report_sections(report):     # 상세 페이지: 섹션마다 완성된 HTML 하나
+        st.markdown(html, unsafe_allow_html=True)
+
+    st.markdown(report_cards(reports), unsafe_allow_html=True)   # 메인 페이지 카드 목록
+
+- 템플릿(backend/templates)은 import 할 때 한 번 컴파일해 두고 매크로만 호출한다
+- 결과는 (리포트 id, 내용 해시) 로 캐시 → 같은 리포트를 다시 보면 템플릿을 거치지 않는다.
+  내용이 바뀌면 해시가 달라지므로 따로 무효화할 필요 없음
+- 리포트 값은 HTML 이스케이프 (autoescape)
+- 섹션 안의 줄 앞 공백 / 빈 줄은 지운다 (st.markdown 이 들여쓴 줄을 코드 블록으로 보지 않도록)
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import threading
+from typing import Any, Dict, Iterable, Tuple
+
+from cachetools import LRUCache
+from jinja2 import Environment, FileSystemLoader, select_autoescape
+from markupsafe import Markup
+
+Report = Dict[str, Any]
+
+_ENV = Environment(
+    loader=FileSystemLoader(os.path.join(os.path.dirname(__file__), "templates")),
+    autoescape=select_autoescape(["html"]),
+    trim_blocks=True,
+    lstrip_blocks=True,
+)
+_CARD = _ENV.get_template("report_card.html").module
+_DETAIL = _ENV.get_template("report_detail.html").module
+
+# 리스크 단계 → (배경색, 글자색, 라벨)
+RISK_STYLES: Dict[str, Tuple[str, str, str]] = {
+    "high": ("#fee2e2", "#b91c1c", "높음"),
+    "medium": ("#ffedd5", "#c2410c", "보통"),
+    "low": ("#dcfce7", "#15803d", "낮음"),
+}
+
+DETAIL_SECTIONS = ("header", "meta", "summary", "compare", "impact", "risk", "strategy")
+
+_CACHE: LRUCache = LRUCache(maxsize=int(os.environ.get("REPORT_RENDER_CACHE", "512")))
+_LOCK = threading.Lock()
+_STATS = {"hits": 0, "misses": 0}
+
+
+def content_hash(report: Report) -> str:
+    """리포트 내용 해시 (키 순서와 무관)"""
+    raw = json.dumps(report, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.blake2b(raw.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def _compact(html: Any) -> str:
+    return "\n".join(line.strip() for line in str(html).splitlines() if line.strip())
+
+
+def _cached(key: Tuple[Any, ...], build: Any) -> Any:
+    with _LOCK:
+        value = _CACHE.get(key)
+        if value is not None:
+            _STATS["hits"] += 1
+            return value
+        _STATS["misses"] += 1
+    value = build()
+    with _LOCK:
+        _CACHE[key] = value
+    return value
+
+
+def risk_style(level: str) -> Dict[str, str]:
+    bg, text, label = RISK_STYLES.get(level, ("#f9fafb", "#4b5563", level))
+    return {"bg": bg, "text": text, "label": label}
+
+
+# ---------- 상세 페이지 ----------
+def report_sections(report: Report) -> Tuple[str, ...]:
+    """상세 페이지 섹션 HTML (DETAIL_SECTIONS 순서)"""
+    key = ("detail", report["id"], content_hash(report))
+    return _cached(key, lambda: _render_sections(report))
+
+
+def _render_sections(report: Report) -> Tuple[str, ...]:
+    risk = risk_style(report["riskAnalysis"]["level"])
+    width = min(max(report["impactScore"] * 10, 0), 100)  # 0~100%
+    return tuple(
+        _compact(html)
+        for html in (
+            _DETAIL.header(report, risk),
+            _DETAIL.meta(report, risk),
+            _DETAIL.summary(report),
+            _DETAIL.compare(report),
+            _DETAIL.impact(report, width),
+            _DETAIL.risk(report),
+            _DETAIL.strategy(report),
+        )
+    )
+
+
+# ---------- 메인 페이지 카드 ----------
+def report_card(report: Report) -> str:
+    key = ("card", report["id"], content_hash(report))
+    return _cached(key, lambda: _compact(_CARD.card(report)))
+
+
+def report_cards(reports: Iterable[Report], columns: int = 1) -> str:
+    """카드 목록을 HTML 하나로 (columns 열 그리드, 카드 사이 간격은 그리드 gap)"""
+    cards = [Markup(report_card(r)) for r in reports]
+    return _compact(_CARD.grid(cards, max(1, columns)))
+
+
+def render_stats() -> Dict[str, int]:
+    with _LOCK:
+        return {**_STATS, "size": len(_CACHE), "maxsize": int(_CACHE.maxsize)}
+
+
+def clear_render_cache() -> None:
+    with _LOCK:
+        _CACHE.clear()
+        _STATS.update(hits=0, misses=0)
@@ -0,0 +1,497 @@
+# backend/reports.py
+"""
+리포트 저장소 (SQLite + FTS5, 메인 페이지 / 상세 페이지 / get_reports 공용)
+
+    from backend.reports import REPORT_REPOSITORY, LOG_REPORTS
+
+    REPORT_REPOSITORY.get("1")                    # id → 리포트 (고유 인덱스)
+    REPORT_REPOSITORY.by_date(date(2025, 11, 24)) # 날짜 → 리포트 목록
+    REPORT_REPOSITORY.dates_in_month(2025, 11)    # 캘린더: 그 달에 리포트가 있는 날짜
+    REPORT_REPOSITORY.search("안전 공지", limit=20) # 전문 검색 (최신순, 필요한 행만 읽음)
+    REPORT_REPOSITORY.search("안전관리", order="relevance")  # 관련도순
+    REPORT_REPOSITORY.add({...})                  # 추가 / 교체 (색인도 같은 트랜잭션에서 갱신)
+
+- 법령 분석 리포트(REPORT_REPOSITORY)와 로그 요약 리포트(LOG_REPORTS, get_reports)는
+  같은 DB 의 같은 테이블을 kind 로 나눠 쓴다
+- reports 테이블: (kind, id) 고유 인덱스, (kind, date) / (kind, created_at) / (kind, risk_level) 인덱스,
+  원본 리포트는 body(JSON) 에 그대로 저장
+- reports_fts (FTS5, trigram 토크나이저): lawName / title / summary / description / beforeChange / afterChange.
+  trigram 이라 한글도 띄어쓰기와 무관하게 부분 문자열로 찾는다 (대소문자 무시).
+  3글자 미만 검색어는 trigram 색인을 못 쓰므로 FTS 테이블의 본문을 instr 로 훑는다
+  (AND 검색에서 3글자 이상 검색어가 같이 있으면 색인으로 줄인 후보에만 적용)
+- reports_ngram (FTS5): 한글 분석기(backend/analyzer.py) 토큰 — 음절 2-gram / 3-gram, 그 밖은 단어.
+  저장할 때 한 번 분석해 두고, 한글 검색어는 검색어 n-gram 이 모두 있는 리포트를 이 색인으로 찾은 뒤
+  같은 행의 compact 컬럼(필드별 공백을 뺀 본문, 색인 안 함)에 검색어가 그대로 있는지 instr 로 확인한다
+  (n-gram 이 흩어져 있기만 한 "안전관 점검과 전관리" 는 "안전관리" 로 찾히지 않음).
+  띄어쓰기("안전관리" ↔ "안전 관리"), 조사("규정을" → "규정"), 전각 문자와 무관하고 2글자 검색어도 색인을 탄다.
+  order="relevance" 면 BM25 점수순 (법령명 / 제목 가중치 HEAD_WEIGHT)
+- 검색어 문법은 로그 검색과 같다 (공백 = 여러 검색어, "따옴표" = 한 구절, mode = and / or)
+- SQL 은 고정 문자열 + ? 파라미터 → 연결별 prepared statement 캐시를 탄다 (backend/db.py 연결 풀)
+- id 는 문자열로 통일 (?id=1 쿼리 파라미터가 문자열이므로)
+- 날짜는 "date" (없으면 "publishDate", "created_at") 의 YYYY-MM-DD
+- 같은 id 로 다시 add 하면 교체 (추가 순서도 맨 뒤로)
+- on_change(callback) 으로 추가 / 교체 / 삭제를 알림 받는다 (callback(날짜 목록), 커밋 후 호출).
+  get_reports 결과 캐시는 backend.logs 가 여기에 무효화를 걸어 둔다 (이 모듈은 pandas / 결과 캐시를 모름)
+
+환경 변수
+    REPORT_DB_PATH : SQLite 파일 경로 (기본 ":memory:" = 목업 데이터만 담은 메모리 DB)
+    REPORT_DB_POOL : 연결 풀 크기 (기본 4, 메모리 DB 는 1)
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import sqlite3
+from datetime import date, datetime, timedelta
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Set, Tuple, Union
+
+from .analyzer import analyze, compact, has_hangul, normalize, query_tokens
+from .db import ConnectionPool
+
+Report = Dict[str, Any]
+DateLike = Union[date, str]
+
+# 전문 검색 대상 필드 (FTS5 컬럼 이름 = 리포트 키)
+FTS_COLUMNS = ("lawName", "title", "summary", "description", "beforeChange", "afterChange")
+
+_MIN_DATE, _MAX_DATE = "0000-00-00", "9999-99-99"
+
+_TABLE_SQL = """
+CREATE TABLE IF NOT EXISTS reports (
+    seq INTEGER PRIMARY KEY,
+    kind TEXT NOT NULL,
+    id TEXT NOT NULL,
+    date TEXT NOT NULL,
+    created_at TEXT NOT NULL,
+    risk_level TEXT,
+    body TEXT NOT NULL,
+    UNIQUE (kind, id)
+)"""
+_INDEX_SQL = (
+    "CREATE INDEX IF NOT EXISTS idx_reports_kind_date ON reports (kind, date, seq)",
+    "CREATE INDEX IF NOT EXISTS idx_reports_kind_created ON reports (kind, created_at, seq)",
+    "CREATE INDEX IF NOT EXISTS idx_reports_kind_risk ON reports (kind, risk_level, date)",
+)
+_FTS_SQL = "CREATE VIRTUAL TABLE IF NOT EXISTS reports_fts USING fts5({cols}, tokenize='{tokenizer}')"
+# 분석기(backend/analyzer.py) 토큰을 공백으로 이어 저장. head = 법령명 + 제목, body = 나머지 필드,
+# compact = 필드별 공백을 뺀 본문을 줄바꿈으로 이은 것 (색인하지 않고 한글 검색어 확인용)
+_NGRAM_SQL = (
+    "CREATE VIRTUAL TABLE IF NOT EXISTS reports_ngram"
+    " USING fts5(head, body, compact UNINDEXED, tokenize='unicode61')"
+)
+HEAD_COLUMNS = ("lawName", "title")
+HEAD_WEIGHT = 3.0
+SEARCH_ORDERS = ("recent", "relevance")
+# bm25 는 작을수록(더 음수일수록) 관련도가 높음
+_RANK_SQL = (
+    f"SELECT rowid AS rank_seq, bm25(reports_ngram, {HEAD_WEIGHT}, 1.0) AS score"
+    " FROM reports_ngram WHERE reports_ngram MATCH ?"
+)
+
+_SELECT_SEQ = "SELECT seq, date FROM reports WHERE kind = ? AND id = ?"
+_SELECT_BODY = "SELECT body FROM reports WHERE kind = ? AND id = ?"
+_INSERT = "INSERT INTO reports (kind, id, date, created_at, risk_level, body) VALUES (?, ?, ?, ?, ?, ?)"
+_INSERT_FTS = f"INSERT INTO reports_fts (rowid, {', '.join(FTS_COLUMNS)}) VALUES (?{', ?' * len(FTS_COLUMNS)})"
+_DELETE = "DELETE FROM reports WHERE seq = ?"
+_DELETE_FTS = "DELETE FROM reports_fts WHERE rowid = ?"
+_INSERT_NGRAM = "INSERT INTO reports_ngram (rowid, head, body, compact) VALUES (?, ?, ?, ?)"
+_DELETE_NGRAM = "DELETE FROM reports_ngram WHERE rowid = ?"
+_MISSING_NGRAM = "SELECT seq, body FROM reports WHERE seq NOT IN (SELECT rowid FROM reports_ngram)"
+_COUNT = "SELECT COUNT(*) FROM reports WHERE kind = ?"
+_BY_DATE = "SELECT body FROM reports WHERE kind = ? AND date = ? ORDER BY seq"
+_BETWEEN = "SELECT body FROM reports WHERE kind = ? AND date >= ? AND date <= ? ORDER BY date, seq"
+_DATES_BETWEEN = "SELECT DISTINCT date FROM reports WHERE kind = ? AND date >= ? AND date <= ? ORDER BY date"
+_LATEST_DATES = (
+    "SELECT date FROM (SELECT DISTINCT date FROM reports WHERE kind = ? ORDER BY date DESC LIMIT ?) ORDER BY date"
+)
+
+
+def _date_key(value: DateLike) -> str:
+    return str(value)[:10]
+
+
+def _text(value: Any) -> Optional[str]:
+    """FTS 에 넣는 필드 값 (검색어와 같은 normalize)"""
+    if value is None:
+        return None
+    return normalize(value if isinstance(value, str) else json.dumps(value, ensure_ascii=False))
+
+
+def _field_texts(report: Report) -> List[Optional[str]]:
+    texts = [_text(report.get(c)) for c in FTS_COLUMNS]
+    if texts[1] is None:
+        texts[1] = _text(report.get("report_name"))  # 로그 요약 리포트는 제목이 report_name
+    return texts
+
+
+def _ngram_texts(texts: Sequence[Optional[str]]) -> Tuple[str, str, str]:
+    """필드 값 → (head, body) n-gram 토큰 문자열 + compact 본문 (저장할 때 한 번만 분석)"""
+    head, body = [], []
+    for col, text in zip(FTS_COLUMNS, texts):
+        (head if col in HEAD_COLUMNS else body).extend(analyze(text))
+    # 필드 경계를 넘어 매칭되지 않도록 줄바꿈으로 구분 (compact 값에는 공백 / 줄바꿈이 없음)
+    flat = "\n".join(compact(text) for text in texts if text)
+    return " ".join(head), " ".join(body), flat
+
+
+def _fts_phrase(term: str) -> str:
+    # FTS5 MATCH 구절 ("" 로 따옴표 이스케이프) → trigram 으로 부분 문자열 매칭
+    return '"' + term.replace('"', '""') + '"'
+
+
+def _scan_clause(term: str) -> str:
+    """3글자 미만 검색어: FTS 테이블 본문을 필드마다 리터럴 매칭 (색인 없이 훑음)"""
+    # 대소문자가 없는 검색어(한글 등)는 lower() 를 건너뜀 (SQLite lower() 는 ASCII 만 바꿈)
+    col = "lower({})" if term.upper() != term else "{}"
+    return "(" + " OR ".join(f"instr({col.format(c)}, ?) > 0" for c in FTS_COLUMNS) + ")"
+
+
+class ReportRepository:
+    """SQLite 리포트 저장소 (kind 하나 = 리포트 종류 하나, 여러 저장소가 연결 풀 / 테이블을 공유)"""
+
+    def __init__(self, pool: ConnectionPool, kind: str = "law", reports: Iterable[Report] = ()):
+        self.pool = pool
+        self.kind = kind
+        self._listeners: List[Callable[[List[str]], None]] = []
+        self.trigram = self._create_tables()
+        self.add_many(reports)
+
+    def _create_tables(self) -> bool:
+        """테이블 / 색인 생성. trigram 토크나이저가 없으면(SQLite < 3.34) unicode61 + instr 매칭"""
+        with self.pool.connection() as conn, conn:
+            conn.execute(_TABLE_SQL)
+            for sql in _INDEX_SQL:
+                conn.execute(sql)
+            try:
+                conn.execute(_FTS_SQL.format(cols=", ".join(FTS_COLUMNS), tokenizer="trigram"))
+            except sqlite3.OperationalError:
+                conn.execute(_FTS_SQL.format(cols=", ".join(FTS_COLUMNS), tokenizer="unicode61"))
+            (sql,) = conn.execute("SELECT sql FROM sqlite_master WHERE name = 'reports_fts'").fetchone()
+            ngram = conn.execute("SELECT sql FROM sqlite_master WHERE name = 'reports_ngram'").fetchone()
+            if ngram is not None and "compact" not in ngram[0]:
+                # compact 컬럼이 없던 예전 테이블은 다시 만들고 아래에서 전부 다시 분석
+                conn.execute("DROP TABLE reports_ngram")
+            conn.execute(_NGRAM_SQL)
+            # n-gram 테이블이 생기기 전에 저장된 리포트는 여기서 한 번 분석해 채움
+            for seq, body in conn.execute(_MISSING_NGRAM).fetchall():
+                conn.execute(_INSERT_NGRAM, (seq, *_ngram_texts(_field_texts(json.loads(body)))))
+        return "trigram" in sql
+
+    # ---------- 변경 알림 ----------
+    def on_change(self, callback: Callable[[List[str]], None]) -> None:
+        """추가 / 교체 / 삭제가 커밋된 뒤 바뀐 리포트 날짜(YYYY-MM-DD, 교체면 이전 날짜 포함)로 callback 호출"""
+        self._listeners.append(callback)
+
+    def _notify(self, days: Set[str]) -> None:
+        if days:
+            for callback in self._listeners:
+                callback(sorted(days))
+
+    # ---------- 쓰기 ----------
+    def add(self, report: Report) -> Report:
+        """리포트 추가 (같은 id 면 교체). 색인은 이 리포트 몫만 갱신"""
+        days: Set[str] = set()
+        with self.pool.connection() as conn, conn:
+            report = self._add(conn, report, days)
+        self._notify(days)
+        return report
+
+    def add_many(self, reports: Iterable[Report]) -> None:
+        """여러 리포트를 트랜잭션 하나로 추가"""
+        days: Set[str] = set()
+        with self.pool.connection() as conn, conn:
+            for report in reports:
+                self._add(conn, report, days)
+        self._notify(days)
+
+    def _add(self, conn: sqlite3.Connection, report: Report, days: Set[str]) -> Report:
+        report_id = str(report["id"])
+        day = report.get("date") or report.get("publishDate") or report.get("created_at")
+        if not day:
+            raise ValueError(f"리포트 날짜(date / publishDate / created_at)가 없습니다: id={report_id}")
+        report = {**report, "id": report_id, "date": _date_key(day)}
+        created_at = str(report.get("created_at") or report.get("publishDate") or report["date"])
+        risk_level = (report.get("riskAnalysis") or {}).get("level")
+        body = json.dumps(report, ensure_ascii=False, default=str)
+        texts = _field_texts(report)
+
+        old = conn.execute(_SELECT_SEQ, (self.kind, report_id)).fetchone()
+        if old is not None:
+            self._delete(conn, old[0])
+            days.add(old[1])
+        days.add(report["date"])
+        seq = conn.execute(_INSERT, (self.kind, report_id, report["date"], created_at, risk_level, body)).lastrowid
+        conn.execute(_INSERT_FTS, (seq, *texts))
+        conn.execute(_INSERT_NGRAM, (seq, *_ngram_texts(texts)))
+        return report
+
+    def _delete(self, conn: sqlite3.Connection, seq: int) -> None:
+        conn.execute(_DELETE_FTS, (seq,))
+        conn.execute(_DELETE_NGRAM, (seq,))
+        conn.execute(_DELETE, (seq,))
+
+    def remove(self, report_id: Any) -> Optional[Report]:
+        with self.pool.connection() as conn, conn:
+            row = conn.execute(_SELECT_BODY, (self.kind, str(report_id))).fetchone()
+            if row is None:
+                return None
+            seq, day = conn.execute(_SELECT_SEQ, (self.kind, str(report_id))).fetchone()
+            self._delete(conn, seq)
+        self._notify({day})
+        return json.loads(row[0])
+
+    # ---------- 조회 ----------
+    def _bodies(self, sql: str, params: Sequence[Any]) -> List[Report]:
+        with self.pool.connection() as conn:
+            rows = conn.execute(sql, params).fetchall()
+        return [json.loads(body) for (body,) in rows]
+
+    def _dates(self, sql: str, params: Sequence[Any]) -> List[str]:
+        with self.pool.connection() as conn:
+            return [d for (d,) in conn.execute(sql, params)]
+
+    def get(self, report_id: Any) -> Optional[Report]:
+        found = self._bodies(_SELECT_BODY, (self.kind, str(report_id)))
+        return found[0] if found else None
+
+    def by_date(self, day: DateLike) -> List[Report]:
+        """그 날짜의 리포트 (추가한 순서)"""
+        return self._bodies(_BY_DATE, (self.kind, _date_key(day)))
+
+    def dates(self) -> List[str]:
+        """리포트가 있는 날짜 (오름차순 YYYY-MM-DD)"""
+        return self.dates_between()
+
+    def dates_between(self, start: Optional[DateLike] = None, end: Optional[DateLike] = None) -> List[str]:
+        """start ~ end (양 끝 포함) 사이 리포트가 있는 날짜"""
+        lo = _MIN_DATE if start is None else _date_key(start)
+        hi = _MAX_DATE if end is None else _date_key(end)
+        return self._dates(_DATES_BETWEEN, (self.kind, lo, hi))
+
+    def dates_in_month(self, year: int, month: int) -> Tuple[str, ...]:
+        """그 달에 리포트가 있는 날짜 ((kind, date) 인덱스 구간만 읽음)"""
+        prefix = f"{year:04d}-{month:02d}"
+        return tuple(self.dates_between(f"{prefix}-01", f"{prefix}-31"))
+
+    def latest_dates(self, n: int) -> List[str]:
+        """가장 최근 n 개 날짜 (오름차순)"""
+        return self._dates(_LATEST_DATES, (self.kind, n)) if n > 0 else []
+
+    def dates_in_year(self, year: int) -> List[str]:
+        return self.dates_between(f"{year:04d}-01-01", f"{year:04d}-12-31")
+
+    def between(self, start: Optional[DateLike] = None, end: Optional[DateLike] = None) -> List[Report]:
+        """start ~ end 사이 리포트 (날짜순, 같은 날짜는 추가한 순서)"""
+        lo = _MIN_DATE if start is None else _date_key(start)
+        hi = _MAX_DATE if end is None else _date_key(end)
+        return self._bodies(_BETWEEN, (self.kind, lo, hi))
+
+    # ---------- 검색 ----------
+    def _where(
+        self,
+        keyword: str,
+        mode: str,
+        day: Optional[DateLike],
+        risk_levels: Sequence[str],
+    ) -> Tuple[str, List[Any], Optional[str]]:
+        """검색 조건 → (WHERE 절, 파라미터, 순위 계산용 n-gram MATCH 식)"""
+        # 로그 검색과 같은 검색어 파싱 (backend.search 는 pandas 를 쓰므로 검색할 때만 import)
+        from .search import parse_keyword
+
+        where, params = ["kind = ?"], [self.kind]
+        if day is not None:
+            where.append("date = ?")
+            params.append(_date_key(day))
+        if risk_levels:
+            where.append(f"risk_level IN ({', '.join('?' for _ in risk_levels)})")
+            params.extend(risk_levels)
+
+        query = parse_keyword(keyword, mode=mode)
+        rank = None
+        if query.terms:
+            joiner = " AND " if query.mode == "and" else " OR "
+            grams = {t: query_tokens(t) for t in query.terms if has_hangul(t)}
+            ngram = [t for t in query.terms if grams.get(t)]
+            trigram = [t for t in query.terms if t not in ngram and self.trigram and len(t) >= 3]
+            scanned = [t for t in query.terms if t not in ngram and t not in trigram]
+
+            subqueries: List[Tuple[str, List[Any]]] = []
+            if ngram:
+                # 한글 검색어: 검색어의 n-gram 이 모두 들어 있는 리포트 중 공백을 뺀 본문에 검색어가 그대로 있는 것
+                match = joiner.join("(" + " AND ".join(_fts_phrase(g) for g in grams[t]) + ")" for t in ngram)
+                check = joiner.join("instr(compact, ?) > 0" for _ in ngram)
+                subqueries.append(
+                    (
+                        f"SELECT rowid FROM reports_ngram WHERE reports_ngram MATCH ? AND ({check})",
+                        [match, *(compact(t) for t in ngram)],
+                    )
+                )
+                rank = " OR ".join(_fts_phrase(g) for g in dict.fromkeys(g for t in ngram for g in grams[t]))
+            if trigram:
+                match = joiner.join(_fts_phrase(t) for t in trigram)
+                subqueries.append(("SELECT rowid FROM reports_fts WHERE reports_fts MATCH ?", [match]))
+            if scanned:
+                scan_sql = joiner.join(_scan_clause(t) for t in scanned)
+                scan_params = [p for t in scanned for p in [t] * len(FTS_COLUMNS)]
+                if subqueries and query.mode == "and":
+                    # 색인으로 후보를 먼저 줄이고 짧은 검색어는 그 후보에만 적용
+                    sql, sub_params = subqueries.pop()
+                    subqueries.append(
+                        (f"SELECT rowid FROM reports_fts WHERE rowid IN ({sql}) AND {scan_sql}", sub_params + scan_params)
+                    )
+                else:
+                    subqueries.append((f"SELECT rowid FROM reports_fts WHERE {scan_sql}", scan_params))
+
+            where.append("(" + joiner.join(f"seq IN ({sql})" for sql, _ in subqueries) + ")")
+            params.extend(p for _, sub_params in subqueries for p in sub_params)
+        return " WHERE " + " AND ".join(where), params, rank
+
+    def search(
+        self,
+        keyword: str = "",
+        mode: str = "and",
+        day: Optional[DateLike] = None,
+        risk_levels: Sequence[str] = (),
+        limit: Optional[int] = None,
+        offset: int = 0,
+        order: str = "recent",
+    ) -> List[Report]:
+        """
+        키워드 / 날짜 / 리스크 단계 조건의 리포트.
+        order: recent = 최신순 (created_at → 추가 순서)
+               relevance = 한글 검색어 n-gram 의 BM25 점수순 (제목 / 법령명 가중치 HEAD_WEIGHT), 같으면 최신순
+        limit / offset 은 SQL 로 처리하므로 페이지 하나만 읽는다.
+        """
+        if order not in SEARCH_ORDERS:
+            raise ValueError(f"지원하지 않는 정렬입니다: {order!r} (recent / relevance)")
+        where, params, rank = self._where(keyword, mode, day, risk_levels)
+        page = [-1 if limit is None else limit, offset]
+        if order == "relevance" and rank:
+            sql = (
+                f"SELECT body FROM reports LEFT JOIN ({_RANK_SQL}) ON rank_seq = seq{where}"
+                " ORDER BY coalesce(score, 0), created_at DESC, seq DESC LIMIT ? OFFSET ?"
+            )
+            return self._bodies(sql, [rank] + params + page)
+        sql = f"SELECT body FROM reports{where} ORDER BY created_at DESC, seq DESC LIMIT ? OFFSET ?"
+        return self._bodies(sql, params + page)
+
+    def count(self, keyword: str = "", mode: str = "and", day: Optional[DateLike] = None, risk_levels: Sequence[str] = ()) -> int:
+        where, params, _ = self._where(keyword, mode, day, risk_levels)
+        with self.pool.connection() as conn:
+            (total,) = conn.execute(f"SELECT COUNT(*) FROM reports{where}", params).fetchone()
+        return total
+
+    def explain(self, keyword: str = "", mode: str = "and", day: Optional[DateLike] = None) -> List[str]:
+        """SQLite EXPLAIN QUERY PLAN (어떤 인덱스를 타는지)"""
+        where, params, _ = self._where(keyword, mode, day, ())
+        with self.pool.connection() as conn:
+            rows = conn.execute(f"EXPLAIN QUERY PLAN SELECT body FROM reports{where} ORDER BY created_at DESC", params)
+            return [detail for *_, detail in rows]
+
+    def __len__(self) -> int:
+        with self.pool.connection() as conn:
+            (total,) = conn.execute(_COUNT, (self.kind,)).fetchone()
+        return total
+
+    def __contains__(self, report_id: Any) -> bool:
+        with self.pool.connection() as conn:
+            return conn.execute(_SELECT_SEQ, (self.kind, str(report_id))).fetchone() is not None
+
+
+# ---------- 목업 데이터 ----------
+# 목록용 필드(title / summary / date / link)는 모든 리포트에,
+# 상세 분석 필드(lawName, beforeChange, keyChanges, riskAnalysis ...)는 분석이 끝난 리포트에만 있다.
+_MOCK_REPORTS: List[Report] = [
+    {
+        "id": "1",
+        "lawName": "산업안전보건법 시행령",
+        "title": "산업안전보건법 시행령 개정에 따른 안전관리 규정 강화",
+        "publishDate": "2025-11-24",
+        "link": "https://example.com/report/1",
+        "summary": "홈페이지 첫 화면 공개 의무화 및 사전 공지 의무가 신설되며, 근로자 알권리 보장이 강화됩니다.",
+        "beforeChange": "기존에는 사업장 내 게시판 비치 또는 홈페이지 공지 중 하나만으로도 충분했습니다.",
+        "afterChange": "개정 후에는 사업장 홈페이지 첫 화면에 안전관리 규정 변경사항을 의무적으로 공개해야 하며, 변경 7일 전 사전 공지 의무가 신설되었습니다.",
+        "keyChanges": [
+            {"before": "홈페이지 또는 사업장 비치", "after": "홈페이지 첫 화면 공개 의무화"},
+            {"added": "변경 시 7일 전 사전 공지 의무"},
+            {"added": "간편 열람 요청 온라인 시스템 제공 의무"},
+        ],
+        "impactScore": 8.5,
+        "impactReason": "안전 규정 공개와 사전 공지 의무가 강화됨에 따라, 내부 커뮤니케이션 및 시스템 개편이 필요하며, 이를 소홀히 할 경우 과태료 위험이 높습니다.",
+        "riskAnalysis": {
+            "level": "high",
+            "description": "공지 미이행 시 제재 및 근로자 민원 발생 가능성이 높습니다.",
+            "concerns": [
+                "홈페이지 개편 지연 시 법 위반 소지",
+                "사전 공지 누락으로 인한 민원/분쟁 발생",
+                "지점/사업장별 공지 수준 편차로 인한 리스크"
+            ]
+        },
+        "responseStrategy": {
+            "shortTerm": [
+                "홈페이지 메인 화면에 안전규정 공지 영역 신설",
+                "변경 시 7일 전 자동 안내 메일/문자 발송 플로우 설계",
+                "법무/안전부서와 협업하여 공지 템플릿 표준화"
+            ],
+            "longTerm": [
+                "안전 규정 변경 관리 시스템 구축",
+                "지점/사업장별 공지 이행 현황 모니터링 대시보드 운영",
+                "정기 교육 커리큘럼에 관련 내용 반영"
+            ]
+        }
+    },
+    {
+        "id": "2",
+        "title": "화학물질관리법 시행규칙 개정",
+        "summary": "특정 유해 화학물질 취급시설의 정기 점검 주기 변경.",
+        "date": "2025-11-24",
+        "link": "https://example.com/report/2",
+    },
+    {
+        "id": "3",
+        "title": "고압가스안전관리법 일부 개정",
+        "summary": "저장탱크 설치 기준 및 점검 항목이 구체화되었습니다.",
+        "date": "2025-11-20",
+        "link": "https://example.com/report/3",
+    },
+]
+
+# 로그 요약 리포트 (get_reports 목록)
+_NOW = datetime.now()
+_MOCK_LOG_REPORTS: List[Report] = [
+    {
+        "id": "lambda-error-today",
+        "report_name": "Lambda Error Summary (오늘)",
+        "created_at": _NOW - timedelta(minutes=10),
+        "description": "오늘 발생한 Lambda ERROR 로그를 요약한 리포트입니다.",
+        "file_url": "https://example.com/reports/lambda-error-today.pdf",
+    },
+    {
+        "id": "ses-bounce-week",
+        "report_name": "SES Bounce Report (이번 주)",
+        "created_at": _NOW - timedelta(hours=3),
+        "description": "이번 주동안 BOUNCE 된 메일을 정리한 리포트입니다.",
+        "file_url": "https://example.com/reports/ses-bounce-week.xlsx",
+    },
+    {
+        "id": "system-weekly",
+        "report_name": "주간 시스템 리포트",
+        "created_at": _NOW - timedelta(days=2),
+        "description": "주요 Lambda/SES 활동을 종합한 주간 리포트입니다.",
+        "file_url": "https://example.com/reports/system-weekly.html",
+    },
+]
+
+REPORT_POOL = ConnectionPool(
+    os.environ.get("REPORT_DB_PATH", ":memory:"),
+    size=int(os.environ.get("REPORT_DB_POOL", "4")),
+)
+REPORT_REPOSITORY = ReportRepository(REPORT_POOL, kind="law")
+LOG_REPORTS = ReportRepository(REPORT_POOL, kind="log")
+
+# 빈 DB 일 때만 목업 데이터를 넣는다 (파일 DB 는 처음 한 번)
+if not len(REPORT_REPOSITORY):
+    REPORT_REPOSITORY.add_many(_MOCK_REPORTS)
+if not len(LOG_REPORTS):
+    LOG_REPORTS.add_many(_MOCK_LOG_REPORTS)
@@ -0,0 +1,238 @@
+# backend/result_cache.py
+"""
+get_lambda_logs / get_ses_logs / get_reports 결과 캐시 (TTL + 바이트 기준 LRU)
+
+- 키: (소스, 결과 종류, 정규화된 filters) — 날짜는 ISO 문자열, 리스트는 정렬된 tuple,
+  keyword 는 소문자 + 공백 정리. 위젯 순서나 대소문자만 다른 재실행은 같은 키가 된다.
+- 소스별 TTL, 전체 용량은 DataFrame 메모리 바이트 합으로 제한 (넘치면 LRU 부터 제거)
+- hit / miss / eviction / expiration 카운터
+- st.cache_data 와 무관한 순수 파이썬 캐시라 CLI / 벤치마크에서도 그대로 동작한다
+- 새 로그가 들어오면 invalidate(source, days) 로 해당 소스·날짜가 걸친 항목만 지운다
+"""
+
+from __future__ import annotations
+
+import functools
+import threading
+from datetime import date, datetime, timedelta
+from typing import Any, Callable, Dict, Iterable, Optional, Tuple
+
+import pandas as pd
+from cachetools import TLRUCache
+
+# 소스별 결과 유효 시간 (초)
+DEFAULT_TTLS: Dict[str, float] = {
+    "lambda": 30.0,
+    "ses": 60.0,
+    "reports": 300.0,
+}
+
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+CacheKey = Tuple[str, str, Tuple[Tuple[str, Any], ...]]
+
+# 날짜 범위를 나타내는 filters 키 (invalidate 시 사용)
+_RANGE_KEYS = ("start_date", "end_date")
+_DAY_KEY = "date"
+
+
+def _normalize_value(key: str, value: Any) -> Any:
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if key == "keyword":
+        return " ".join(str(value or "").lower().split())
+    if key == "cursor":
+        return tuple(v.isoformat() if isinstance(v, (datetime, date)) else v for v in value)
+    if isinstance(value, (list, tuple, set, frozenset)):
+        return tuple(sorted(str(v) for v in value))
+    if isinstance(value, str):
+        return value.lower()
+    return value
+
+
+def normalize_filters(filters: Dict[str, Any]) -> Tuple[Tuple[str, Any], ...]:
+    """filters dict → 해시 가능한 정규형 (값이 비어 있는 키는 생략)"""
+    items = []
+    for key in sorted(filters):
+        value = _normalize_value(key, filters[key])
+        if value in (None, "", ()):
+            continue
+        items.append((key, value))
+    return tuple(items)
+
+
+def _shallow(value: Any) -> Any:
+    """호출한 쪽이 컬럼을 바꿔도 캐시 원본이 변하지 않도록 DataFrame 은 얕은 복사"""
+    if isinstance(value, pd.DataFrame):
+        return value.copy(deep=False)
+    return value
+
+
+def _frame_bytes(value: Any) -> int:
+    if isinstance(value, pd.DataFrame):
+        return int(value.memory_usage(index=True, deep=True).sum())
+    return 1
+
+
+class _CountingCache(TLRUCache):
+    """eviction(용량 초과) / expiration(TTL 만료) 횟수를 세는 TLRUCache"""
+
+    def __init__(self, *args: Any, **kwargs: Any):
+        super().__init__(*args, **kwargs)
+        self.evictions = 0
+        self.expirations = 0
+
+    def popitem(self):
+        item = super().popitem()
+        self.evictions += 1
+        return item
+
+    def expire(self, time=None):
+        expired = super().expire(time)
+        self.expirations += len(expired)
+        return expired
+
+
+class ResultCache:
+    """소스별 TTL 을 가진 바이트 제한 LRU 결과 캐시 (스레드 안전)"""
+
+    def __init__(
+        self,
+        ttls: Optional[Dict[str, float]] = None,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        default_ttl: float = 60.0,
+    ):
+        self.ttls = dict(DEFAULT_TTLS if ttls is None else ttls)
+        self.default_ttl = default_ttl
+        self._cache = _CountingCache(
+            maxsize=max_bytes,
+            ttu=self._ttu,
+            getsizeof=_frame_bytes,
+        )
+        self._lock = threading.Lock()
+        # invalidate 가 호출될 때마다 늘어나는 세대 (소스별 + source=None 전체).
+        # compute 중에 무효화가 있었으면 그 결과는 이미 낡았을 수 있으므로 저장하지 않는다
+        self._generations: Dict[str, int] = {}
+        self._generation = 0
+        self.hits = 0
+        self.misses = 0
+
+    def _ttu(self, key: CacheKey, value: Any, now: float) -> float:
+        return now + self.ttls.get(key[0], self.default_ttl)
+
+    def _generation_of(self, source: str) -> Tuple[int, int]:
+        return self._generation, self._generations.get(source, 0)
+
+    @staticmethod
+    def make_key(source: str, filters: Dict[str, Any], name: str = "rows") -> CacheKey:
+        return source, name, normalize_filters(filters)
+
+    def get_or_compute(
+        self,
+        source: str,
+        filters: Dict[str, Any],
+        compute: Callable[[], Any],
+        name: str = "rows",
+    ) -> Any:
+        """
+        캐시에 있으면 돌려주고, 없으면 compute() 결과를 저장 후 반환.
+        compute() 도중 source 가 무효화됐으면 결과는 돌려주기만 하고 저장하지 않는다
+        """
+        key = self.make_key(source, filters, name)
+        with self._lock:
+            value = self._cache.get(key)
+            if value is not None:
+                self.hits += 1
+                return _shallow(value)
+            self.misses += 1
+            generation = self._generation_of(source)
+
+        value = compute()
+        with self._lock:
+            if self._generation_of(source) == generation:
+                try:
+                    self._cache[key] = value
+                except ValueError:
+                    pass  # 단일 결과가 전체 용량보다 큼 → 캐시하지 않음
+        return _shallow(value)
+
+    def invalidate(self, source: Optional[str] = None, days: Optional[Iterable[date]] = None) -> int:
+        """
+        source 의 항목 중 days 와 날짜 범위가 겹치는 것만 삭제 (days 가 없으면 소스 전체).
+        source 도 없으면 전부 비운다. 지운 항목 수를 돌려준다.
+        """
+        day_set = {d.isoformat() for d in days} if days is not None else None
+        with self._lock:
+            if source is None:
+                self._generation += 1
+            else:
+                self._generations[source] = self._generations.get(source, 0) + 1
+            if source is None and day_set is None:
+                count = len(self._cache)
+                self._cache.clear()
+                return count
+
+            targets = [
+                key
+                for key in list(self._cache.keys())
+                if (source is None or key[0] == source)
+                and (day_set is None or _overlaps(dict(key[2]), day_set))
+            ]
+            for key in targets:
+                self._cache.pop(key, None)
+            return len(targets)
+
+    def clear(self) -> None:
+        self.invalidate()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "entries": len(self._cache),
+                "bytes": self._cache.currsize,
+                "max_bytes": self._cache.maxsize,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self._cache.evictions,
+                "expirations": self._cache.expirations,
+            }
+
+
+def _overlaps(filters: Dict[str, Any], days: set) -> bool:
+    """정규화된 filters 의 날짜 조건이 days 중 하나라도 포함하는지 (조건 없으면 True)"""
+    if _DAY_KEY in filters:
+        return filters[_DAY_KEY] in days
+    lo = filters.get(_RANGE_KEYS[0])
+    hi = filters.get(_RANGE_KEYS[1])
+    return any((lo is None or d >= lo) and (hi is None or d <= hi) for d in days)
+
+
+def batch_days(batch: pd.DataFrame, ts_col: str = "timestamp") -> Iterable[date]:
+    """새 로그 배치가 걸친 날짜들"""
+    if batch.empty or ts_col not in batch.columns:
+        return []
+    ts = pd.to_datetime(batch[ts_col])
+    lo, hi = ts.min().date(), ts.max().date()
+    return [lo + timedelta(days=i) for i in range((hi - lo).days + 1)]
+
+
+RESULT_CACHE = ResultCache()
+
+
+def cached_result(source: str, cache: Optional[ResultCache] = None, name: str = "rows"):
+    """
+    filters 를 첫 인자로 받는 조회 함수에 결과 캐시를 씌우는 데코레이터.
+    같은 소스의 다른 결과(건수 등)는 name 으로 키를 구분한다.
+    """
+
+    def decorator(fn: Callable[[Dict[str, Any]], Any]):
+        @functools.wraps(fn)
+        def wrapper(filters: Dict[str, Any]) -> Any:
+            return (cache or RESULT_CACHE).get_or_compute(
+                source, filters, lambda: fn(filters), name=name
+            )
+
+        wrapper.uncached = fn
+        return wrapper
+
+    return decorator
@@ -0,0 +1,232 @@
+# backend/rollup.py
+"""
+시간 버킷 집계 (분 → 시간 → 일)
+
+원본 로그를 다시 읽지 않고 대시보드 요약을 만들기 위한 건수 테이블.
+버킷마다 (차원 값 조합) → 건수 dict 를 들고, 버킷 시각은 정렬된 리스트로 관리해서
+구간 조회는 bisect 로 범위만 잘라 읽는다.
+
+    rollup = RollupTable(("level", "function_name"))
+    rollup.add(batch)                                   # ingest 때마다 증분 갱신
+    rollup.replace(day, day + 1일, source.volume(spec))  # 소스 집계로 구간을 통째로 다시 채움
+    rollup.query(start, end, resolution="day", by=("level",))
+
+- add(batch) 는 배치를 분 단위로 groupby 한 결과만 각 해상도에 더한다 (원본 재집계 없음)
+- replace 는 구간의 기존 버킷을 지우고 소스가 센 건수(bucket_counts 형태)로 바꾼다
+- 분 버킷은 최근 3일, 시간 버킷은 90일만 유지하고 일 버킷은 계속 유지
+"""
+
+from __future__ import annotations
+
+import threading
+from bisect import bisect_left, insort
+from datetime import date, datetime, timedelta
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+import pandas as pd
+
+from .dtypes import to_local_naive
+
+RESOLUTIONS: Dict[str, str] = {"minute": "min", "hour": "h", "day": "D"}
+
+DEFAULT_RETENTION: Dict[str, Optional[timedelta]] = {
+    "minute": timedelta(days=3),
+    "hour": timedelta(days=90),
+    "day": None,
+}
+
+TimeLike = Union[date, datetime, pd.Timestamp, None]
+
+
+def _bound_ns(value: TimeLike, end: bool = False) -> Optional[int]:
+    """구간 경계 → epoch ns (date 인 end 는 다음 날 0시, 배타적)"""
+    if value is None:
+        return None
+    if isinstance(value, date) and not isinstance(value, datetime):
+        value = datetime.combine(value + timedelta(days=1) if end else value, datetime.min.time())
+    return pd.Timestamp(value).value
+
+
+def bucket_counts(
+    df: pd.DataFrame, ts_col: str, dims: Sequence[str], resolution: str = "minute"
+) -> pd.Series:
+    """로그 프레임 → (bucket, *dims) 별 건수 (RollupTable.add_counts / replace 입력)"""
+    ts = to_local_naive(pd.to_datetime(df[ts_col]))
+    keys = [ts.dt.floor(RESOLUTIONS[resolution]).rename("bucket")]
+    keys += [df[d].astype(object).fillna("") for d in dims]
+    return df.groupby(keys, observed=True, sort=False).size()
+
+
+def auto_resolution(start: TimeLike, end: TimeLike) -> str:
+    """구간 길이로 해상도 선택 (하루 이하 분, 31일 이하 시간, 그 이상 일)"""
+    lo, hi = _bound_ns(start), _bound_ns(end, end=True)
+    if lo is None or hi is None:
+        return "day"
+    span = pd.Timedelta(hi - lo, unit="ns")
+    if span <= timedelta(days=1):
+        return "minute"
+    if span <= timedelta(days=31):
+        return "hour"
+    return "day"
+
+
+class RollupTable:
+    """해상도별 버킷 → {차원 값 tuple: 건수} (스레드 안전)"""
+
+    def __init__(
+        self,
+        dims: Sequence[str],
+        ts_col: str = "timestamp",
+        retention: Optional[Dict[str, Optional[timedelta]]] = None,
+    ):
+        self.dims = tuple(dims)
+        self.ts_col = ts_col
+        self.retention = dict(DEFAULT_RETENTION if retention is None else retention)
+        self._buckets: Dict[str, Dict[int, Dict[Tuple[Any, ...], int]]] = {r: {} for r in RESOLUTIONS}
+        self._keys: Dict[str, List[int]] = {r: [] for r in RESOLUTIONS}
+        self.rows = 0
+        self._lock = threading.Lock()
+
+    # ---------- 갱신 ----------
+    def add(self, batch: pd.DataFrame) -> None:
+        """새 로그 배치를 각 해상도 버킷에 더한다"""
+        if batch.empty:
+            return
+        self.add_counts(bucket_counts(batch, self.ts_col, self.dims))
+
+    def add_counts(self, counts: pd.Series, resolution: str = "minute") -> None:
+        """(bucket, *dims) 별 건수를 resolution 과 그보다 거친 해상도 버킷에 더한다"""
+        with self._lock:
+            self._add_counts(counts, resolution)
+
+    def replace(self, start: TimeLike, end: TimeLike, counts: pd.Series, resolution: str = "minute") -> None:
+        """
+        [start, end) 구간 버킷을 모두 지우고 counts 로 바꾼다 (소스에서 다시 센 구간).
+        start / end 는 resolution 보다 거친 버킷 경계(보통 하루)여야 한다
+        """
+        lo, hi = _bound_ns(start), _bound_ns(end)
+        with self._lock:
+            for res in RESOLUTIONS:
+                buckets, keys = self._buckets[res], self._keys[res]
+                a, b = bisect_left(keys, lo), bisect_left(keys, hi)
+                for bucket in keys[a:b]:
+                    removed = buckets.pop(bucket)
+                    if res == "day":
+                        self.rows -= sum(removed.values())
+                del keys[a:b]
+            self._add_counts(counts, resolution)
+
+    def _add_counts(self, counts: pd.Series, resolution: str) -> None:
+        if counts.empty:
+            return
+        names = list(RESOLUTIONS)
+        for res in names[names.index(resolution):]:
+            if res == resolution:
+                grouped = counts
+            else:
+                levels = [counts.index.get_level_values(0).floor(RESOLUTIONS[res])]
+                levels += [counts.index.get_level_values(i + 1) for i in range(len(self.dims))]
+                grouped = counts.groupby(levels, sort=False).sum()
+            self._merge(res, grouped)
+            self._prune(res)
+        self.rows += int(counts.sum())
+
+    def _merge(self, res: str, grouped: pd.Series) -> None:
+        buckets, keys = self._buckets[res], self._keys[res]
+        keep = self.retention.get(res)
+        if keep is not None:
+            # 어차피 보관 기간 밖으로 잘릴 버킷은 더하지 않음 (과거 데이터 일괄 적재 시)
+            times = grouped.index.get_level_values(0)
+            newest = max(times.max().value, keys[-1] if keys else times.max().value)
+            grouped = grouped[times.asi8 >= newest - pd.Timedelta(keep).value]
+        for key, n in grouped.items():
+            bucket = pd.Timestamp(key[0]).value
+            counts = buckets.get(bucket)
+            if counts is None:
+                counts = buckets[bucket] = {}
+                insort(keys, bucket)
+            dim_key = tuple(key[1:])
+            counts[dim_key] = counts.get(dim_key, 0) + int(n)
+
+    def _prune(self, res: str) -> None:
+        keep = self.retention.get(res)
+        keys = self._keys[res]
+        if keep is None or not keys:
+            return
+        cut = bisect_left(keys, keys[-1] - pd.Timedelta(keep).value)
+        for bucket in keys[:cut]:
+            del self._buckets[res][bucket]
+        del keys[:cut]
+
+    # ---------- 조회 ----------
+    def covers(self, res: str, start: TimeLike) -> bool:
+        """start 이후 구간을 res 해상도 버킷으로 답할 수 있는지 (보관 기간 확인)"""
+        keep = self.retention.get(res)
+        keys = self._keys[res]
+        if keep is None or not keys:
+            return True
+        lo = _bound_ns(start)
+        return lo is not None and lo >= keys[-1] - pd.Timedelta(keep).value
+
+    def query(
+        self,
+        start: TimeLike = None,
+        end: TimeLike = None,
+        resolution: str = "auto",
+        by: Sequence[str] = (),
+        where: Optional[Dict[str, Iterable[Any]]] = None,
+    ) -> pd.DataFrame:
+        """
+        [start, end] 구간 버킷별 건수. by 차원별로 나누고, where 로 차원 값을 거른다.
+        반환 컬럼: bucket, *by, count (bucket 오름차순)
+        """
+        if resolution == "auto":
+            resolution = auto_resolution(start, end)
+            # 보관 기간을 넘는 구간이면 더 거친 해상도로
+            for res in ("minute", "hour", "day")[list(RESOLUTIONS).index(resolution):]:
+                if self.covers(res, start):
+                    resolution = res
+                    break
+        if resolution not in RESOLUTIONS:
+            raise ValueError(f"지원하지 않는 해상도입니다: {resolution!r} ({', '.join(RESOLUTIONS)})")
+
+        by = tuple(by)
+        unknown = [d for d in (*by, *(where or {})) if d not in self.dims]
+        if unknown:
+            raise ValueError(f"집계 차원이 아닙니다: {unknown} (가능: {list(self.dims)})")
+        by_pos = [self.dims.index(d) for d in by]
+        allowed = [
+            (self.dims.index(d), {str(v) for v in values}) for d, values in (where or {}).items()
+        ]
+
+        lo_ns, hi_ns = _bound_ns(start), _bound_ns(end, end=True)
+        result: Dict[Tuple[Any, ...], int] = {}
+        with self._lock:
+            keys = self._keys[resolution]
+            lo = 0 if lo_ns is None else bisect_left(keys, lo_ns)
+            hi = len(keys) if hi_ns is None else bisect_left(keys, hi_ns)
+            buckets = self._buckets[resolution]
+            for bucket in keys[lo:hi]:
+                for dim_key, n in buckets[bucket].items():
+                    if any(str(dim_key[i]) not in values for i, values in allowed):
+                        continue
+                    out = (bucket, *(dim_key[i] for i in by_pos))
+                    result[out] = result.get(out, 0) + n
+
+        df = pd.DataFrame(
+            [(*k, n) for k, n in result.items()],
+            columns=["bucket", *by, "count"],
+        )
+        df["bucket"] = pd.to_datetime(df["bucket"].astype("int64"), unit="ns")
+        return df.sort_values(["bucket", *by], kind="stable").reset_index(drop=True)
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "rows": self.rows,
+                **{f"{res}_buckets": len(keys) for res, keys in self._keys.items()},
+                **{
+                    f"{res}_cells": sum(len(c) for c in self._buckets[res].values())
+                    for res in RESOLUTIONS
+                },
+            }
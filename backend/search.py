@@ -0,0 +1,298 @@
+# backend/search.py
+"""
+여러 컬럼 키워드 검색 엔진
+
+- 검색 대상 컬럼은 프레임당 한 번만 정규화(NFKC + 소문자) Arrow 문자열 버퍼로 만들어 캐시한다
+- 기본은 정규식이 아닌 리터럴 부분 문자열 매칭 (pyarrow.compute.match_substring)
+- 한글 검색어는 공백을 뺀 버퍼에서 찾는다 ("안전관리" ↔ "안전 관리"), 끝의 조사는 뗀다 (backend/analyzer.py)
+- 여러 검색어를 AND / OR 로 조합할 수 있다
+- 어떤 컬럼에서 이미 매칭된 행은 나머지 컬럼을 더 이상 검사하지 않는다
+
+SQLite / Parquet / CloudWatch 소스도 같은 규칙으로 찾는다 (match_term, search_text, NFKC_UNSTABLE).
+ASCII 와 한글 음절만 있는 값은 NFKC 를 해도 그대로이므로 소스 안에서 바로 비교하고,
+그 밖의 문자가 있는 값만 파이썬 NFKC 로 확인한다.
+"""
+
+from __future__ import annotations
+
+import re
+import unicodedata
+import weakref
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+
+from .analyzer import has_hangul, normalize, strip_particle
+
+# "따옴표 구절" 또는 공백으로 구분된 단어
+_TERM_RE = re.compile(r'"([^"]+)"|(\S+)')
+
+SEARCH_MODES = ("and", "or")
+
+# NFKC 를 해도 바뀌지 않는 문자(ASCII, 한글 음절) 밖의 문자 하나 (RE2 / 파이썬 정규식)
+NFKC_UNSTABLE = "[^\\x00-\\x7f가-힣]"
+
+# 한글 검색어를 찾을 때 버퍼에서 빼는 공백
+COMPACT_SPACES = (" ", "\t", "\n", "\r")
+
+
+@dataclass(frozen=True)
+class SearchQuery:
+    """파싱된 키워드 검색 조건 (terms 는 이미 소문자)"""
+
+    terms: Tuple[str, ...]
+    mode: str = "and"
+    regex: bool = False
+
+
+def parse_keyword(keyword: str, mode: str = "and", regex: bool = False) -> SearchQuery:
+    """
+    키워드 문자열을 검색어 목록으로 분리.
+    공백으로 나누되 "큰따옴표" 로 묶인 구절은 하나의 검색어로 취급한다.
+    검색어는 normalize (NFKC + 소문자) 하고, 정규식이 아니면 끝의 한글 조사를 뗀다.
+    """
+    mode = (mode or "and").lower()
+    if mode not in SEARCH_MODES:
+        raise ValueError(f"지원하지 않는 검색 모드입니다: {mode!r} (and / or)")
+
+    text = normalize(keyword or "")
+    terms = []
+    for phrase, word in _TERM_RE.findall(text):
+        term = (phrase or word).strip()
+        if not regex:
+            term = strip_particle(term)
+        if term and term not in terms:
+            terms.append(term)
+
+    return SearchQuery(terms=tuple(terms), mode=mode, regex=regex)
+
+
+def match_term(term: str, regex: bool = False) -> Tuple[str, bool]:
+    """검색어 → (찾을 문자열, 공백을 뺀 버퍼에서 찾는지). 한글 검색어는 띄어쓰기와 무관하게 매칭"""
+    if not regex and has_hangul(term):
+        return term.replace(" ", ""), True
+    return term, False
+
+
+def term_regex(needle: str, compact: bool = False) -> str:
+    """match_term 결과 → 정규식 (compact 면 글자 사이 공백 허용, 원래 값에서 공백을 빼지 않고 찾을 때)"""
+    if not compact:
+        return re.escape(needle)
+    return "[ \\t\\n\\r]*".join(re.escape(ch) for ch in needle)
+
+
+def search_text(value: str, compact: bool = False) -> str:
+    """값 하나를 검색 버퍼와 같게 정규화 (NFKC + 소문자, compact 면 공백 제거)"""
+    text = unicodedata.normalize("NFKC", value).lower()
+    if compact:
+        for space in COMPACT_SPACES:
+            text = text.replace(space, "")
+    return text
+
+
+def _lower_buffer(values: pd.Series) -> pa.Array:
+    """컬럼을 정규화(NFKC + 소문자)한 Arrow 문자열 배열로 변환 (ASCII 만 있으면 astype(str).str.lower() 와 같은 값)"""
+    if isinstance(values.dtype, pd.CategoricalDtype):
+        # 카테고리만 정규화한 뒤 코드로 펼침 (행마다 문자열 변환하지 않음)
+        categories = _lower_buffer(values.cat.categories.to_series())
+        codes = values.cat.codes.to_numpy()
+        lowered = categories.take(pa.array(codes, mask=codes < 0))
+        return pc.fill_null(lowered, "nan")
+    if isinstance(values.dtype, (pd.StringDtype, pd.ArrowDtype)):
+        arr = pa.array(values, from_pandas=True)
+        if not pa.types.is_string(arr.type) and not pa.types.is_large_string(arr.type):
+            arr = pc.cast(arr, pa.large_string())
+    else:
+        arr = pa.array(values.astype(str).to_numpy(dtype=object), type=pa.large_string())
+    return pc.utf8_lower(_nfkc(arr))
+
+
+def _nfkc(arr: pa.Array) -> pa.Array:
+    """
+    NFKC 정규화 (전각 → 반각 등). ASCII / 한글 음절 밖의 문자가 있고 아직 정규형이 아닌 값만 파이썬에서 바꾼다.
+    pyarrow utf8_normalize 는 한글 음절을 자모로 풀어 버려서 쓰지 않음
+    """
+    non_ascii = np.flatnonzero(~pc.string_is_ascii(arr).fill_null(True).to_numpy(zero_copy_only=False))
+    if len(non_ascii) == 0:
+        return arr
+    subset = arr.take(pa.array(non_ascii))
+    unstable = pc.match_substring_regex(subset, NFKC_UNSTABLE).fill_null(False).to_numpy(zero_copy_only=False)
+    if not unstable.any():
+        return arr
+    non_ascii = non_ascii[unstable]
+    values = subset.filter(pa.array(unstable)).to_pylist()
+    changed = [(i, unicodedata.normalize("NFKC", v)) for i, v in zip(non_ascii, values) if not unicodedata.is_normalized("NFKC", v)]
+    if not changed:
+        return arr
+    mask = np.zeros(len(arr), dtype=bool)
+    mask[[i for i, _ in changed]] = True
+    return pc.replace_with_mask(arr, pa.array(mask), pa.array([v for _, v in changed], type=arr.type))
+
+
+def _compact_buffer(lowered: pa.Array) -> pa.Array:
+    """정규화 버퍼에서 공백 제거 (한글 검색어 매칭용, 정규식 치환보다 빠른 리터럴 치환)"""
+    for space in COMPACT_SPACES:
+        lowered = pc.replace_substring(lowered, space, "")
+    return lowered
+
+
+def _append_chunk(buf: Optional[pa.ChunkedArray], new: pa.Array) -> pa.ChunkedArray:
+    """버퍼 뒤에 새 행의 버퍼를 붙임. 크기가 비슷한 끝 청크끼리 합쳐서 청크 수를 log(행 수) 로 유지"""
+    chunks = [] if buf is None else list(buf.chunks)
+    new_chunks = new.chunks if isinstance(new, pa.ChunkedArray) else [new]
+    if buf is not None:
+        new_chunks = [c.cast(buf.type) if c.type != buf.type else c for c in new_chunks]
+    chunks.extend(c for c in new_chunks if len(c))
+    while len(chunks) > 1 and len(chunks[-2]) <= len(chunks[-1]):
+        tail = chunks.pop()
+        chunks[-1] = pa.concat_arrays([chunks[-1], tail])
+    return pa.chunked_array(chunks, type=new.type if buf is None else buf.type)
+
+
+class KeywordSearcher:
+    """
+    한 DataFrame 에 대한 키워드 검색기.
+    소문자 버퍼는 컬럼을 처음 검색할 때 만들어지고 이후 재사용된다.
+    (프레임은 생성 후 변경되지 않는다고 가정. 뒤에 행만 이어 붙인 프레임이면 extend 로 넘겨받아
+    새 행만 정규화한다)
+    """
+
+    # 버퍼가 아직 없는 컬럼을 rows 로 좁혀 찾을 때, rows 가 전체의 이 비율보다 적으면 그 행만 정규화 (캐시 안 함)
+    PARTIAL_RATIO = 0.1
+
+    def __init__(self, df: pd.DataFrame):
+        self._df_ref = weakref.ref(df)
+        self._nrows = len(df)
+        self._lowered: Dict[str, pa.ChunkedArray] = {}
+        self._compacted: Dict[str, pa.ChunkedArray] = {}
+
+    def __len__(self) -> int:
+        return self._nrows
+
+    def extend(self, df: pd.DataFrame) -> None:
+        """df = 지금 프레임 뒤에 행을 이어 붙인 프레임. 만든 버퍼는 두고, 새 행은 다음 검색 때 정규화해서 붙인다"""
+        self._df_ref = weakref.ref(df)
+        self._nrows = len(df)
+
+    def _frame(self) -> pd.DataFrame:
+        df = self._df_ref()
+        if df is None:
+            raise RuntimeError("검색 대상 DataFrame 이 이미 해제되었습니다.")
+        return df
+
+    def lowered(self, col: str) -> pa.ChunkedArray:
+        buf = self._lowered.get(col)
+        built = 0 if buf is None else len(buf)
+        if built < self._nrows:
+            buf = _append_chunk(buf, _lower_buffer(self._frame()[col].iloc[built:]))
+            self._lowered[col] = buf
+        return buf
+
+    def compacted(self, col: str) -> pa.ChunkedArray:
+        """공백을 뺀 정규화 버퍼 (한글 검색어를 처음 찾을 때 만들고 재사용)"""
+        buf = self._compacted.get(col)
+        built = 0 if buf is None else len(buf)
+        if built < self._nrows:
+            buf = _append_chunk(buf, _compact_buffer(self.lowered(col).slice(built)))
+            self._compacted[col] = buf
+        return buf
+
+    def _buffer(self, col: str, compact: bool, rows: np.ndarray) -> pa.Array:
+        """rows 행의 (공백을 뺀) 정규화 버퍼"""
+        cache = self._compacted if compact else self._lowered
+        if col not in cache and len(rows) < self._nrows * self.PARTIAL_RATIO:
+            # since 조회처럼 최근 몇 행만 볼 때는 전체 컬럼 버퍼를 만들지 않음
+            if col in self._lowered:
+                buf = self.lowered(col).take(pa.array(rows))
+            else:
+                buf = _lower_buffer(self._frame()[col].iloc[rows])
+            return _compact_buffer(buf) if compact else buf
+        buf = self.compacted(col) if compact else self.lowered(col)
+        if len(rows) < self._nrows:
+            buf = buf.take(pa.array(rows))
+        return buf
+
+    def _match(self, col: str, term: str, rows: np.ndarray, regex: bool) -> np.ndarray:
+        term, compact = match_term(term, regex)
+        buf = self._buffer(col, compact, rows)
+        if regex:
+            hit = pc.match_substring_regex(buf, term)
+        else:
+            hit = pc.match_substring(buf, term)
+        return hit.fill_null(False).to_numpy(zero_copy_only=False)
+
+    def _any_column(
+        self, term: str, rows: np.ndarray, cols: Sequence[str], regex: bool
+    ) -> np.ndarray:
+        """rows 중 한 컬럼이라도 term 을 포함하는 행 (매칭된 행은 다음 컬럼에서 제외)"""
+        found = np.zeros(len(rows), dtype=bool)
+        for col in cols:
+            remaining = np.flatnonzero(~found)
+            if len(remaining) == 0:
+                break
+            found[remaining] = self._match(col, term, rows[remaining], regex)
+        return found
+
+    def mask(
+        self,
+        query: SearchQuery,
+        cols: Sequence[str],
+        rows: Optional[np.ndarray] = None,
+    ) -> np.ndarray:
+        """검색 조건을 만족하는 행의 boolean 마스크 (rows 를 주면 그 행들에 대해서만)"""
+        if rows is None:
+            rows = np.arange(self._nrows)
+        n = len(rows)
+        if not query.terms or not cols:
+            return np.ones(n, dtype=bool)
+
+        if query.mode == "and":
+            # 앞선 검색어를 통과한 후보 행에만 다음 검색어를 적용
+            result = np.ones(n, dtype=bool)
+            for term in query.terms:
+                pos = np.flatnonzero(result)
+                if len(pos) == 0:
+                    break
+                result[pos] = self._any_column(term, rows[pos], cols, query.regex)
+        else:
+            # 이미 다른 검색어로 매칭된 행은 다시 검사하지 않음
+            result = np.zeros(n, dtype=bool)
+            for term in query.terms:
+                pos = np.flatnonzero(~result)
+                if len(pos) == 0:
+                    break
+                result[pos] = self._any_column(term, rows[pos], cols, query.regex)
+        return result
+
+
+# 프레임 id → 검색기. 프레임이 GC 되면 finalizer 가 항목을 지운다.
+_SEARCHERS: Dict[int, KeywordSearcher] = {}
+
+
+def get_searcher(df: pd.DataFrame) -> KeywordSearcher:
+    """df 에 대한 (캐시된) 검색기"""
+    key = id(df)
+    searcher = _SEARCHERS.get(key)
+    if searcher is None or searcher._df_ref() is not df:
+        searcher = KeywordSearcher(df)
+        _SEARCHERS[key] = searcher
+        weakref.finalize(df, _SEARCHERS.pop, key, None)
+    return searcher
+
+
+def search(
+    df: pd.DataFrame,
+    keyword: str,
+    cols: Optional[List[str]] = None,
+    mode: str = "and",
+    regex: bool = False,
+) -> np.ndarray:
+    """df 에서 keyword 조건을 만족하는 행 마스크 (cols 가 없으면 object 컬럼 전체)"""
+    query = parse_keyword(keyword, mode=mode, regex=regex)
+    if cols is None:
+        cols = [c for c in df.columns if df[c].dtype == "object"]
+    return get_searcher(df).mask(query, cols)
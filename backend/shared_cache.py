@@ -0,0 +1,188 @@
+# backend/shared_cache.py
+"""
+최근 N 시간 로그를 Arrow IPC(Feather v2, 비압축) 파일로 공유하는 캐시
+
+- 한 번 만든 창(window) 파일을 모든 세션이 memory map 으로 연다
+  (같은 프로세스의 세션은 같은 Table 객체를, 다른 프로세스/파드는 OS 페이지 캐시를 공유)
+- 조회는 timestamp 로 정렬된 Table 을 searchsorted 로 잘라낸 slice(복사 없음) 위에서
+  level / 키워드 조건만 걸러낸다. 필터 / 페이지 결과와 pandas 변환은 남은 행만 복사한다
+  (문자열 컬럼은 Arrow 버퍼를 그대로 쓰는 string[pyarrow])
+- 시작 날짜가 없거나 창보다 이른 조회도 limit 이 있으면(대시보드 기본 최신 N 행) 창 안에서 offset + limit 행이
+  채워질 때 창으로 답한다 (창 밖 행은 창 안의 어떤 행보다 오래됐으므로)
+- 그 밖에 창 범위를 벗어난 조회(오래된 날짜의 전체 목록 / 건수 등)는 원래 소스로 넘긴다
+- 파일은 tmp 에 쓴 뒤 os.replace 로 바꿔치기하므로 읽는 쪽은 항상 완성된 파일을 본다
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+import time
+import uuid
+from datetime import datetime, timedelta
+from typing import Any, Dict, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+
+from .dtypes import arrow_strings, compact_frame
+from .parquet import arrow_page, arrow_predicate, exact_keyword_rows
+from .sources import LogQuerySpec, LogSource
+
+# 경로 → (mtime_ns, 창 시작 시각, Table, timestamp 배열). 프로세스 안의 모든 세션이 공유한다.
+_OPEN_WINDOWS: Dict[str, Tuple[int, datetime, pa.Table, np.ndarray]] = {}
+_OPEN_LOCK = threading.Lock()
+
+_WINDOW_START_KEY = b"window_start"
+
+
+def open_window(path: str, ts_col: str = "timestamp") -> Optional[Tuple[datetime, pa.Table, np.ndarray]]:
+    """창 파일을 memory map 으로 열기 (파일이 바뀌지 않았으면 이미 연 Table 재사용)"""
+    try:
+        mtime = os.stat(path).st_mtime_ns
+    except FileNotFoundError:
+        return None
+
+    with _OPEN_LOCK:
+        cached = _OPEN_WINDOWS.get(path)
+        if cached and cached[0] == mtime:
+            return cached[1:]
+
+        source = pa.memory_map(path, "r")
+        table = pa.ipc.open_file(source).read_all()
+        meta = table.schema.metadata or {}
+        window_start = datetime.fromisoformat(meta[_WINDOW_START_KEY].decode())
+        ts = table.column(ts_col).to_numpy()
+        _OPEN_WINDOWS[path] = (mtime, window_start, table, ts)
+        return window_start, table, ts
+
+
+class SharedWindowCache(LogSource):
+    """
+    inner 소스 앞에 두는 최근 hours 시간 창 캐시.
+    창 파일이 max_age 초보다 오래됐거나 append 가 있었으면 다음 조회 때 다시 만든다.
+    """
+
+    def __init__(
+        self,
+        inner: LogSource,
+        root: str,
+        hours: int = 24,
+        max_age: float = 60.0,
+    ):
+        super().__init__(inner.schema)
+        self.inner = inner
+        self.root = root
+        self.hours = hours
+        self.max_age = max_age
+        self.path = os.path.join(root, f"{inner.schema.kind}-window.arrow")
+        self._dirty = False
+        self._refresh_lock = threading.Lock()
+        os.makedirs(root, exist_ok=True)
+
+    # ---------- 창 파일 관리 ----------
+    def _stale(self) -> bool:
+        if self._dirty:
+            return True
+        try:
+            age = time.time() - os.stat(self.path).st_mtime
+        except FileNotFoundError:
+            return True
+        return age > self.max_age
+
+    def refresh(self) -> None:
+        """inner 소스에서 최근 hours 시간 로그를 읽어 창 파일을 다시 쓴다"""
+        ts_col = self.schema.ts_col
+        window_start = datetime.now() - timedelta(hours=self.hours)
+
+        df = self.inner.query(LogQuerySpec(start_date=window_start.date()))
+        df = df[pd.to_datetime(df[ts_col]) >= window_start]
+        df = df[list(self.schema.columns)].sort_values(ts_col, kind="stable")
+
+        table = pa.Table.from_pandas(df, preserve_index=False)
+        table = table.replace_schema_metadata(
+            {_WINDOW_START_KEY: window_start.isoformat().encode()}
+        )
+
+        tmp = f"{self.path}.{uuid.uuid4().hex}.tmp"
+        with pa.OSFile(tmp, "wb") as sink:
+            with pa.ipc.new_file(sink, table.schema) as writer:
+                writer.write_table(table)
+        os.replace(tmp, self.path)
+        self._dirty = False
+
+    def window(self) -> Optional[Tuple[datetime, pa.Table, np.ndarray]]:
+        """현재 창 (오래됐으면 한 세션만 다시 만들고 나머지는 기존 파일을 계속 씀)"""
+        if self._stale() and self._refresh_lock.acquire(blocking=False):
+            try:
+                if self._stale():
+                    self.refresh()
+            finally:
+                self._refresh_lock.release()
+        return open_window(self.path, self.schema.ts_col)
+
+    # ---------- LogSource ----------
+    def _view(self, spec: LogQuerySpec) -> Optional[pa.Table]:
+        """창 안에서 spec 조건을 만족하는 행 (창으로 답할 수 없으면 None)"""
+        opened = self.window()
+        if opened is None:
+            return None
+
+        window_start, table, ts = opened
+        start = spec.scan_start_date()
+        lower = datetime.combine(start, datetime.min.time()) if start else None
+        if spec.since is not None:
+            lower = max(lower, spec.since) if lower else spec.since
+        covered = lower is not None and lower >= window_start
+        if not covered and spec.limit is None:
+            # 창보다 오래된 구간의 행까지 전부 필요하면 원래 소스에서
+            return None
+
+        lo = ts.searchsorted(np.datetime64(lower), side="left") if covered else 0
+        hi = len(ts)
+        if spec.end_date:
+            hi = ts.searchsorted(np.datetime64(spec.end_date + timedelta(days=1)), side="left")
+
+        view = table.slice(lo, hi - lo)
+        predicate = arrow_predicate(self.schema, spec)
+        if predicate is not None:
+            view = exact_keyword_rows(view.filter(predicate), self.schema, spec)
+        if not covered and view.num_rows < spec.offset + spec.limit:
+            # 창 안의 행만으로 한 페이지가 안 차면 창 밖(더 오래된 행)도 봐야 함
+            return None
+        return view
+
+    def query(self, spec: LogQuerySpec) -> pd.DataFrame:
+        view = self._view(spec)
+        if view is None:
+            return self.inner.query(spec)
+        if spec.paged:
+            view = arrow_page(view, self.schema, spec)
+        view = view.select(spec.output_columns(self.schema))
+        return compact_frame(view.to_pandas(types_mapper=arrow_strings), self.schema)
+
+    def count(self, spec: LogQuerySpec) -> int:
+        view = self._view(spec.unpaged())
+        if view is None:
+            return self.inner.count(spec)
+        return view.num_rows
+
+    def volume(self, spec: LogQuerySpec, resolution: str = "minute") -> Optional[pd.Series]:
+        # 집계는 창 밖 날짜도 많아서 원래 소스의 집계 쿼리를 그대로 씀
+        return self.inner.volume(spec, resolution)
+
+    def append(self, batch: pd.DataFrame) -> None:
+        self.inner.append(batch)
+        self._dirty = True
+
+    def stats(self) -> Dict[str, Any]:
+        opened = open_window(self.path, self.schema.ts_col)
+        rows = opened[1].num_rows if opened else 0
+        nbytes = opened[1].nbytes if opened else 0
+        return {
+            **self.inner.stats(),
+            "shared_window_hours": self.hours,
+            "shared_window_rows": rows,
+            "shared_window_bytes": nbytes,
+        }
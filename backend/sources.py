@@ -0,0 +1,494 @@
+# backend/sources.py
+"""
+로그 소스 추상화
+
+get_lambda_logs / get_ses_logs 는 LogSource.query(spec) 하나만 호출한다.
+날짜 / 레벨(status) / 키워드 필터는 LogQuerySpec 으로 소스에 그대로 내려가고,
+각 소스가 자기 쿼리 언어로 처리한다 (pandas 로 전부 가져온 뒤 거르지 않음).
+
+- TableLogSource  : 메모리 LogTable (목업 / 테스트, 키워드는 역색인)
+- SQLiteLogSource : 로컬 파일(SQLite) 소스. 오프라인 부하 테스트용
+- ParquetLogSource (backend/parquet.py) : 날짜별로 파티션된 Parquet 데이터셋
+- FileLogSource (backend/files.py) : 시간별 / 일별 로그 파일 묶음 (프로세스 풀로 병렬 로드)
+- CloudWatchLogSource (backend/cloudwatch.py) : CloudWatch Logs Insights
+"""
+
+from __future__ import annotations
+
+import sqlite3
+import threading
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, replace
+from datetime import date, datetime, timedelta
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+from pandas.api.types import is_datetime64_any_dtype
+
+from .dtypes import category_mask, compact_frame, to_local_naive
+from .filters import _apply_top_k, _date_bounds
+from .profiling import stage
+from .rollup import bucket_counts
+from .search import match_term, parse_keyword, search_text
+from .store import LogTable
+
+
+# ------------------------
+# 스키마 / 쿼리 조건
+# ------------------------
+@dataclass(frozen=True)
+class LogSchema:
+    """로그 종류별 컬럼 구성"""
+
+    kind: str
+    columns: Tuple[str, ...]
+    search_cols: Tuple[str, ...]
+    level_col: str
+    id_col: str
+    ts_col: str = "timestamp"
+    category_cols: Tuple[str, ...] = ()  # 값 종류가 적은 컬럼 → category
+    text_cols: Tuple[str, ...] = ()  # 나머지 문자열(본문, 주소, id) → Arrow 문자열
+
+
+LAMBDA_SCHEMA = LogSchema(
+    kind="lambda",
+    columns=("timestamp", "function_name", "level", "message", "request_id"),
+    search_cols=("function_name", "message", "request_id"),
+    level_col="level",
+    id_col="request_id",
+    category_cols=("function_name", "level"),
+    text_cols=("message", "request_id"),
+)
+
+SES_SCHEMA = LogSchema(
+    kind="ses",
+    columns=("timestamp", "mail_to", "subject", "status", "event_type", "message_id"),
+    search_cols=("mail_to", "subject", "message_id"),
+    level_col="status",
+    id_col="message_id",
+    category_cols=("status", "event_type"),
+    text_cols=("mail_to", "subject", "message_id"),
+)
+
+
+def ses_statuses_for_levels(levels: Optional[Sequence[str]]) -> Optional[List[str]]:
+    """
+    로그 레벨을 SES status 에 대충 매핑해보는 예시 (원하는 대로 바꾸면 됨)
+    ERROR 만 선택하면 BOUNCE/COMPLAINT, 그 외에는 status 필터 없음(None)
+    """
+    if levels and "ERROR" in levels and not any(l in ["WARN", "INFO", "DEBUG"] for l in levels):
+        return ["BOUNCE", "COMPLAINT"]
+    return None
+
+
+@dataclass(frozen=True)
+class LogQuerySpec:
+    """소스로 내려보내는 필터 조건 (level_values 는 schema.level_col 기준)"""
+
+    start_date: Optional[date] = None
+    end_date: Optional[date] = None
+    level_values: Optional[Tuple[str, ...]] = None
+    keyword: str = ""
+    keyword_mode: str = "and"
+    columns: Optional[Tuple[str, ...]] = None  # 화면에 보여줄 컬럼만 (None 이면 전체)
+    since: Optional[datetime] = None  # tail 모드: timestamp >= since 인 행만
+    # 페이지: 최신순으로 offset 부터 limit 행 (cursor=(timestamp, id) 면 그 행 다음부터)
+    limit: Optional[int] = None
+    offset: int = 0
+    cursor: Optional[Tuple[datetime, Any]] = None
+
+    @classmethod
+    def from_filters(cls, schema: LogSchema, filters: Dict[str, Any]) -> "LogQuerySpec":
+        """UI filters dict → 조건 (SES 는 levels 를 status 로 바꿔서 담음)"""
+        levels: Optional[List[str]] = filters.get("levels")
+        if schema.kind == "ses":
+            levels = ses_statuses_for_levels(levels)
+
+        return cls(
+            start_date=filters.get("start_date"),
+            end_date=filters.get("end_date"),
+            level_values=tuple(levels) if levels else None,
+            keyword=filters.get("keyword", "") or "",
+            keyword_mode=filters.get("keyword_mode", "and"),
+            columns=tuple(filters["columns"]) if filters.get("columns") else None,
+            limit=filters.get("limit"),
+            offset=int(filters.get("offset") or 0),
+            cursor=tuple(filters["cursor"]) if filters.get("cursor") else None,
+        )
+
+    @property
+    def paged(self) -> bool:
+        return self.limit is not None or self.offset > 0 or self.cursor is not None
+
+    def unpaged(self) -> "LogQuerySpec":
+        """페이지 조건을 뺀 같은 조건 (전체 건수 계산용)"""
+        return replace(self, limit=None, offset=0, cursor=None)
+
+    def scan_start_date(self) -> Optional[date]:
+        """실제로 읽어야 하는 가장 이른 날짜 (start_date 와 since 중 늦은 쪽)"""
+        if self.since is None:
+            return self.start_date
+        since_day = self.since.date()
+        return max(self.start_date, since_day) if self.start_date else since_day
+
+    def output_columns(self, schema: LogSchema) -> List[str]:
+        """결과 컬럼 (정렬에 쓰는 timestamp 는 항상 포함, 스키마 순서 유지)"""
+        if not self.columns:
+            return list(schema.columns)
+        wanted = set(self.columns) | {schema.ts_col}
+        return [c for c in schema.columns if c in wanted]
+
+
+# ------------------------
+# 소스 인터페이스
+# ------------------------
+class LogSource(ABC):
+    """
+    로그 소스. query() 는 spec 조건이 이미 적용된 프레임을 돌려준다.
+    페이지 조건(limit / offset / cursor)이 있으면 그 페이지만 최신순으로, 없으면 정렬은 보장 안 함.
+    """
+
+    def __init__(self, schema: LogSchema):
+        self.schema = schema
+
+    @abstractmethod
+    def query(self, spec: LogQuerySpec) -> pd.DataFrame:
+        ...
+
+    def count(self, spec: LogQuerySpec) -> int:
+        """페이지 조건을 무시한 전체 매칭 건수 (소스별로 더 싼 방법이 있으면 재정의)"""
+        return len(self.query(replace(spec.unpaged(), columns=(self.schema.ts_col,))))
+
+    def volume(self, spec: LogQuerySpec, resolution: str = "minute") -> Optional[pd.Series]:
+        """
+        spec 구간의 (bucket, *category_cols) 별 건수 (RollupTable.replace 입력).
+        소스가 구간 전체를 셀 수 없으면(행 수 제한 등) None. 기본은 필요한 컬럼만 읽어서 집계
+        """
+        cols = (self.schema.ts_col, *self.schema.category_cols)
+        df = self.query(replace(spec.unpaged(), columns=cols))
+        return bucket_counts(df, self.schema.ts_col, self.schema.category_cols, resolution)
+
+    def _page(self, df: pd.DataFrame, spec: LogQuerySpec) -> pd.DataFrame:
+        """페이지 조건을 top-K 선택으로 적용 (전체 정렬 없음)"""
+        if not spec.paged:
+            return df
+        return _apply_top_k(
+            df,
+            spec.limit,
+            offset=spec.offset,
+            ts_col=self.schema.ts_col,
+            id_col=self.schema.id_col,
+            cursor=spec.cursor,
+        )
+
+    def explain(self, spec: LogQuerySpec) -> List[Dict[str, Any]]:
+        """조건을 어떤 순서로 적용할지 (소스가 직접 계획을 세우지 않으면 빈 목록)"""
+        return []
+
+    def append(self, batch: pd.DataFrame) -> None:
+        """새 로그 배치 추가 (쓰기를 지원하지 않는 소스는 예외)"""
+        raise NotImplementedError(f"{type(self).__name__} 는 로그 추가를 지원하지 않습니다.")
+
+    def stats(self) -> Dict[str, Any]:
+        return {"source": type(self).__name__, "kind": self.schema.kind}
+
+
+def _intersect(rows: Optional[np.ndarray], other: np.ndarray) -> np.ndarray:
+    return other if rows is None else np.intersect1d(rows, other, assume_unique=True)
+
+
+class TableLogSource(LogSource):
+    """메모리 LogTable 소스 (키워드는 역색인, 나머지는 벡터 연산)"""
+
+    def __init__(self, schema: LogSchema, table: Optional[LogTable] = None):
+        super().__init__(schema)
+        self.table = table or LogTable(
+            schema.kind,
+            list(schema.search_cols),
+            ts_col=schema.ts_col,
+            count_cols=[schema.level_col],
+            scan_cols=[schema.id_col],
+        )
+
+    def _steps(self, spec: LogQuerySpec, frame: pd.DataFrame) -> List[Tuple[str, float, Callable]]:
+        """
+        조건별 (이름, 예상 행 수, 적용 함수). 적용 함수는 행 번호(None 이면 전체)를 받아
+        그중 조건을 만족하는 행 번호만 돌려준다.
+        """
+        table, schema = self.table, self.schema
+        n = len(frame)
+        steps: List[Tuple[str, float, Callable]] = []
+
+        if spec.since is not None:
+            since_rows = table.rows_since(spec.since)
+            steps.append(("since", len(since_rows), lambda rows: _intersect(rows, since_rows)))
+
+        if spec.keyword:
+            candidates = table.keyword_candidates(spec.keyword, mode=spec.keyword_mode)
+            # 색인으로 못 좁히는 검색어는 문자열 스캔이라 가장 비쌈 → 마지막에 남은 행만 검사
+            estimate = float("inf") if candidates is None else len(candidates)
+            steps.append(
+                (
+                    "keyword",
+                    estimate,
+                    lambda rows: table.keyword_rows(
+                        spec.keyword, mode=spec.keyword_mode, rows=rows, candidates=candidates
+                    ),
+                )
+            )
+
+        if spec.start_date or spec.end_date:
+            ts = frame[schema.ts_col]
+            if not is_datetime64_any_dtype(ts):
+                ts = pd.to_datetime(ts)
+            lo, hi = _date_bounds(spec.start_date, spec.end_date, getattr(ts.dt, "tz", None))
+            estimate = table.estimate_days(
+                None if lo is None else pd.Timestamp(lo).value,
+                None if hi is None else pd.Timestamp(hi).value,
+            )
+
+            def date_rows(rows: Optional[np.ndarray]) -> np.ndarray:
+                values = ts.values if rows is None else ts.values[rows]
+                mask = np.ones(len(values), dtype=bool)
+                if lo is not None:
+                    mask &= values >= lo
+                if hi is not None:
+                    mask &= values < hi
+                return np.flatnonzero(mask) if rows is None else rows[mask]
+
+            steps.append(("date", estimate, date_rows))
+
+        if spec.level_values:
+            levels = frame[schema.level_col]
+            estimate = table.estimate_values(schema.level_col, spec.level_values)
+
+            def level_rows(rows: Optional[np.ndarray]) -> np.ndarray:
+                subset = levels if rows is None else levels.iloc[rows]
+                mask = category_mask(subset, spec.level_values)
+                return np.flatnonzero(mask) if rows is None else rows[mask]
+
+            steps.append(("level", n if estimate is None else estimate, level_rows))
+
+        # 예상 행 수가 적은 조건부터 (뒤 조건은 앞에서 남은 행만 검사)
+        return sorted(steps, key=lambda step: step[1])
+
+    def explain(self, spec: LogQuerySpec) -> List[Dict[str, Any]]:
+        frame = self.table.frame
+        if frame.empty:
+            return []
+        return [{"step": name, "estimated_rows": est} for name, est, _ in self._steps(spec, frame)]
+
+    def _select(self, spec: LogQuerySpec) -> Tuple[pd.DataFrame, np.ndarray]:
+        """조건을 만족하는 행 번호 (프레임을 중간에 새로 만들지 않고 행 번호만 좁혀 감)"""
+        frame = self.table.frame
+        if frame.empty:
+            return frame, np.empty(0, dtype=np.int64)
+
+        rows: Optional[np.ndarray] = None
+        for name, _, apply in self._steps(spec, frame):
+            with stage(name, rows_in=len(frame) if rows is None else len(rows)) as s:
+                rows = apply(rows)
+                s.output(rows)
+            if len(rows) == 0:
+                break
+
+        positions = np.arange(len(frame)) if rows is None else rows
+        return frame, positions
+
+    def query(self, spec: LogQuerySpec) -> pd.DataFrame:
+        frame, positions = self._select(spec)
+        if frame.empty:
+            return frame
+
+        if spec.paged:
+            # 페이지 후보는 timestamp / id 두 컬럼만으로 고른 뒤 해당 행만 꺼냄
+            keys = frame[[self.schema.ts_col, self.schema.id_col]].iloc[positions]
+            keys = self._page(keys.set_axis(positions), spec)
+            positions = keys.index.to_numpy()
+
+        df = frame.iloc[positions]
+        if spec.columns:
+            df = df[spec.output_columns(self.schema)]
+        return df
+
+    def count(self, spec: LogQuerySpec) -> int:
+        return len(self._select(spec.unpaged())[1])
+
+    def append(self, batch: pd.DataFrame) -> None:
+        ts_col = self.schema.ts_col
+        if ts_col in batch.columns:
+            # tz 가 붙은 timestamp 는 tz 없는 로컬 시각으로 (since / cursor 비교 기준)
+            batch = batch.assign(**{ts_col: to_local_naive(pd.to_datetime(batch[ts_col]))})
+        self.table.append(compact_frame(batch, self.schema))
+
+    def stats(self) -> Dict[str, Any]:
+        return {**super().stats(), **self.table.stats()}
+
+
+_SQL_TS_FORMAT = "%Y-%m-%d %H:%M:%S.%f"
+
+# 해상도 → 저장된 timestamp 문자열에서 버킷으로 쓸 앞부분 (길이, 형식)
+_SQL_BUCKETS: Dict[str, Tuple[int, str]] = {
+    "minute": (16, "%Y-%m-%d %H:%M"),
+    "hour": (13, "%Y-%m-%d %H"),
+    "day": (10, "%Y-%m-%d"),
+}
+
+# 키워드 검색 대상 값: ASCII 만 있으면 SQL lower() (NFKC / 공백 제거와 무관, 한글 검색어는 어차피 없음),
+# 그 밖의 값은 파이썬 search_text (NFKC + 소문자, 한글 검색어면 공백 제거)
+_SQL_SEARCH_TEXT = "CASE WHEN length({c}) = length(CAST({c} AS BLOB)) THEN lower({c}) ELSE search_text({c}, {compact}) END"
+
+
+def _sql_search_text(value: Any, compact: int) -> Optional[str]:
+    return None if value is None else search_text(str(value), bool(compact))
+
+
+def _sql_ts(value: Any) -> str:
+    return pd.Timestamp(value).strftime(_SQL_TS_FORMAT)
+
+
+class SQLiteLogSource(LogSource):
+    """
+    SQLite 파일 소스. TableLogSource 와 같은 조건 의미를 SQL WHERE 로 처리한다.
+    - timestamp 는 'YYYY-MM-DD HH:MM:SS.ffffff' 문자열로 저장 (사전순 = 시간순)
+    - 키워드는 instr 리터럴 매칭. 메모리 검색과 같은 규칙 (한글 검색어는 공백을 뺀 값에서, NFKC)
+      ASCII 만 있는 값은 SQL lower() 로, 그 밖의 값만 파이썬 search_text 로 정규화
+    """
+
+    def __init__(self, schema: LogSchema, path: str = ":memory:"):
+        super().__init__(schema)
+        self.path = path
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.create_function("search_text", 2, _sql_search_text, deterministic=True)
+        self._lock = threading.Lock()
+        self._create_table()
+
+    @property
+    def table_name(self) -> str:
+        return f"{self.schema.kind}_logs"
+
+    def _create_table(self) -> None:
+        cols = ", ".join(f"{c} TEXT" for c in self.schema.columns)
+        ts, lv, idc = self.schema.ts_col, self.schema.level_col, self.schema.id_col
+        with self._lock, self._conn:
+            self._conn.execute(f"CREATE TABLE IF NOT EXISTS {self.table_name} ({cols})")
+            self._conn.execute(
+                f"CREATE INDEX IF NOT EXISTS idx_{self.table_name}_{lv}_{ts} "
+                f"ON {self.table_name} ({lv}, {ts})"
+            )
+            self._conn.execute(
+                f"CREATE INDEX IF NOT EXISTS idx_{self.table_name}_{ts}_{idc} "
+                f"ON {self.table_name} ({ts} DESC, {idc} DESC)"
+            )
+
+    def append(self, batch: pd.DataFrame) -> None:
+        if batch.empty:
+            return
+        batch = batch[list(self.schema.columns)].copy()
+        ts = pd.to_datetime(batch[self.schema.ts_col])
+        ts = to_local_naive(ts)
+        batch[self.schema.ts_col] = ts.dt.strftime(_SQL_TS_FORMAT)
+
+        placeholders = ", ".join("?" for _ in self.schema.columns)
+        rows = batch.astype(object).where(batch.notna(), None).itertuples(index=False, name=None)
+        with self._lock, self._conn:
+            self._conn.executemany(
+                f"INSERT INTO {self.table_name} VALUES ({placeholders})", rows
+            )
+
+    def _where(self, spec: LogQuerySpec) -> Tuple[str, List[Any]]:
+        """spec → (WHERE 절, 파라미터). 조건이 없으면 빈 문자열"""
+        where: List[str] = []
+        params: List[Any] = []
+        ts = self.schema.ts_col
+
+        if spec.start_date:
+            where.append(f"{ts} >= ?")
+            params.append(spec.start_date.isoformat())
+        if spec.end_date:
+            where.append(f"{ts} < ?")
+            params.append((spec.end_date + timedelta(days=1)).isoformat())
+        if spec.since is not None:
+            where.append(f"{ts} >= ?")
+            params.append(_sql_ts(spec.since))
+        if spec.cursor is not None:
+            c_ts, c_id = _sql_ts(spec.cursor[0]), spec.cursor[1]
+            where.append(f"({ts} < ? OR ({ts} = ? AND {self.schema.id_col} < ?))")
+            params.extend([c_ts, c_ts, c_id])
+
+        if spec.level_values:
+            where.append(
+                f"{self.schema.level_col} IN ({', '.join('?' for _ in spec.level_values)})"
+            )
+            params.extend(spec.level_values)
+
+        query = parse_keyword(spec.keyword, mode=spec.keyword_mode)
+        if query.terms:
+            term_clauses = []
+            for term in query.terms:
+                needle, compact = match_term(term)
+                cols = " OR ".join(
+                    f"instr({_SQL_SEARCH_TEXT.format(c=c, compact=int(compact))}, ?) > 0"
+                    for c in self.schema.search_cols
+                )
+                term_clauses.append(f"({cols})")
+                params.extend([needle] * len(self.schema.search_cols))
+            joiner = " AND " if query.mode == "and" else " OR "
+            where.append(f"({joiner.join(term_clauses)})")
+
+        return (" WHERE " + " AND ".join(where)) if where else "", params
+
+    def build_sql(self, spec: LogQuerySpec) -> Tuple[str, List[Any]]:
+        """spec → (SELECT 문, 파라미터). 페이지 조건은 (timestamp, id) 인덱스 순 LIMIT / OFFSET"""
+        where, params = self._where(spec)
+        sql = f"SELECT {', '.join(spec.output_columns(self.schema))} FROM {self.table_name}{where}"
+        if spec.paged:
+            sql += f" ORDER BY {self.schema.ts_col} DESC, {self.schema.id_col} DESC"
+            sql += " LIMIT ? OFFSET ?"
+            params = params + [-1 if spec.limit is None else spec.limit, spec.offset]
+        return sql, params
+
+    def count(self, spec: LogQuerySpec) -> int:
+        where, params = self._where(spec.unpaged())
+        with self._lock:
+            (total,) = self._conn.execute(
+                f"SELECT COUNT(*) FROM {self.table_name}{where}", params
+            ).fetchone()
+        return total
+
+    def volume(self, spec: LogQuerySpec, resolution: str = "minute") -> Optional[pd.Series]:
+        """GROUP BY 로 버킷별 건수만 읽음 (행을 가져오지 않음)"""
+        width, fmt = _SQL_BUCKETS[resolution]
+        dims = list(self.schema.category_cols)
+        where, params = self._where(spec.unpaged())
+        group = ", ".join(["bucket", *dims])
+        sql = (
+            f"SELECT substr({self.schema.ts_col}, 1, {width}) AS bucket, {', '.join([*dims, 'COUNT(*) AS count'])}"
+            f" FROM {self.table_name}{where} GROUP BY {group}"
+        )
+        with self._lock:
+            df = pd.read_sql_query(sql, self._conn, params=params)
+        df["bucket"] = pd.to_datetime(df["bucket"], format=fmt)
+        for d in dims:
+            df[d] = df[d].astype(object).fillna("")
+        return df.set_index(["bucket", *dims])["count"]
+
+    def explain(self, spec: LogQuerySpec) -> List[Dict[str, Any]]:
+        """SQLite EXPLAIN QUERY PLAN (어떤 인덱스를 타는지)"""
+        sql, params = self.build_sql(spec)
+        with self._lock:
+            rows = self._conn.execute(f"EXPLAIN QUERY PLAN {sql}", params).fetchall()
+        return [{"step": detail} for *_, detail in rows]
+
+    def query(self, spec: LogQuerySpec) -> pd.DataFrame:
+        sql, params = self.build_sql(spec)
+        with self._lock:
+            df = pd.read_sql_query(sql, self._conn, params=params)
+        df[self.schema.ts_col] = pd.to_datetime(df[self.schema.ts_col])
+        return compact_frame(df, self.schema)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            (rows,) = self._conn.execute(f"SELECT COUNT(*) FROM {self.table_name}").fetchone()
+        return {**super().stats(), "path": self.path, "rows": rows}
@@ -0,0 +1,104 @@
+# backend/startup.py
+"""
+cold start 측정 (경로별 페이지 모듈 import 시간 / 첫 렌더링 시간)
+
+    with first_route("report") as route:
+        with route.phase("import"):
+            from pages.report import render_report_by_id
+        with route.phase("render"):
+            render_report_by_id(report_id)
+
+    startup_stats()   # 경로별 첫 요청 기록 (디버그 패널에 표시)
+
+- 프로세스마다 경로별 첫 요청 한 번만 기록 (그 뒤 rerun 은 아무것도 안 함)
+- since_start: 프로세스 시작부터 그 경로의 첫 렌더링이 끝날 때까지 (오토스케일로 새로 뜬 pod 의 cold start)
+  프로세스 시작 시각은 /proc/self/stat 에서 읽고, 없으면 이 모듈을 처음 import 한 시각으로 대신한다
+- pandas 를 import 하지 않는다
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List
+
+_IMPORTED_AT = time.time()
+
+
+def _process_started_at() -> float:
+    """프로세스 시작 시각 (epoch 초). Linux 가 아니면 이 모듈 import 시각"""
+    try:
+        with open("/proc/self/stat") as f:
+            # comm 에 공백이 있을 수 있으므로 마지막 ')' 뒤에서 자른다 (starttime = 22번째 필드)
+            fields = f.read().rsplit(")", 1)[1].split()
+        with open("/proc/uptime") as f:
+            uptime = float(f.read().split()[0])
+        ticks = os.sysconf("SC_CLK_TCK")
+        return time.time() - uptime + int(fields[19]) / ticks
+    except (OSError, ValueError, IndexError, AttributeError):
+        return _IMPORTED_AT
+
+
+PROCESS_STARTED_AT = _process_started_at()
+
+_ROUTES: Dict[str, Dict[str, Any]] = {}
+_LOCK = threading.Lock()
+
+
+class _RouteTimer:
+    """경로 하나의 첫 요청 단계별 시간"""
+
+    def __init__(self, route: str):
+        self.record: Dict[str, Any] = {"route": route}
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record[f"{name}_seconds"] = time.perf_counter() - started
+
+
+class _NullTimer:
+    """이미 기록한 경로에서 쓰는 아무것도 하지 않는 타이머"""
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        yield
+
+
+_NULL = _NullTimer()
+
+
+@contextmanager
+def first_route(route: str) -> Iterator[Any]:
+    """이 프로세스에서 route 의 첫 요청이면 단계별 시간을 기록"""
+    with _LOCK:
+        first = route not in _ROUTES
+        if first:
+            _ROUTES[route] = {}  # 같은 경로를 동시에 처음 여는 세션이 있어도 한 번만 기록
+    if not first:
+        yield _NULL
+        return
+
+    timer = _RouteTimer(route)
+    try:
+        yield timer
+    finally:
+        timer.record["since_start_seconds"] = time.time() - PROCESS_STARTED_AT
+        with _LOCK:
+            _ROUTES[route] = timer.record
+
+
+def startup_stats() -> List[Dict[str, Any]]:
+    """경로별 첫 요청 기록 (route, import_seconds, render_seconds, since_start_seconds)"""
+    with _LOCK:
+        return [dict(r) for r in _ROUTES.values() if r]
+
+
+def process_uptime() -> float:
+    """프로세스 시작부터 지금까지 (초)"""
+    return time.time() - PROCESS_STARTED_AT
@@ -0,0 +1,199 @@
+# backend/store.py
+"""
+ingest 된 로그를 메모리에 들고 있는 테이블
+
+배치 단위로 append 되고, append 시점에 키워드 역색인도 함께 갱신된다.
+조회 쪽(get_lambda_logs / get_ses_logs)은 frame 과 keyword_rows 만 사용한다.
+id 컬럼(scan_cols)은 n-gram 색인 대신 검색어마다 정규화 버퍼를 직접 찾아 후보에 더한다.
+키워드 검증용 정규화 버퍼는 테이블이 가진 검색기 하나를 계속 늘려 쓴다 (append 후에는 새 행만 정규화).
+"""
+
+from __future__ import annotations
+
+import threading
+from datetime import datetime
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+from .dtypes import concat_frames
+from .index import InvertedIndex
+from .search import KeywordSearcher, SearchQuery, parse_keyword
+
+
+class LogTable:
+    """로그 프레임 + n-gram 역색인 (행 번호 = frame 의 위치)"""
+
+    def __init__(
+        self,
+        name: str,
+        search_cols: Sequence[str],
+        ngram: int = 2,
+        ts_col: str = "timestamp",
+        count_cols: Sequence[str] = (),
+        scan_cols: Sequence[str] = (),
+    ):
+        self.name = name
+        self.search_cols = list(search_cols)
+        # 행마다 값이 다른 id 컬럼은 bigram posting 이 행 수만큼 생기므로 색인하지 않고 스캔
+        self.scan_cols = [c for c in scan_cols if c in self.search_cols]
+        self.ts_col = ts_col
+        # 조회 계획(선택도 추정)용 통계: 일별 행 수, count_cols 값별 행 수
+        self.count_cols = list(count_cols)
+        self.day_counts: Dict[int, int] = {}
+        self.value_counts: Dict[str, Dict[object, int]] = {c: {} for c in self.count_cols}
+        self.index = InvertedIndex(
+            [c for c in self.search_cols if c not in self.scan_cols], n=ngram
+        )
+        self._chunks: List[pd.DataFrame] = []
+        # 배치별 (시작 행, 끝 행, 최신 timestamp) — since 조회 시 새 배치만 보기 위함
+        self._spans: List[Tuple[int, int, pd.Timestamp]] = []
+        self._frame: Optional[pd.DataFrame] = None
+        self._searcher: Optional[KeywordSearcher] = None
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self.index)
+
+    def append(self, batch: pd.DataFrame) -> None:
+        """새 로그 배치 추가 (색인은 이 배치만 증분 갱신)"""
+        if batch.empty:
+            return
+        batch = batch.reset_index(drop=True)
+        latest = pd.NaT
+        days = None
+        if self.ts_col in batch:
+            ts = pd.to_datetime(batch[self.ts_col])
+            latest = ts.max()
+            days = ts.dt.floor("D").value_counts()
+        values = {
+            c: batch[c].value_counts(sort=False) for c in self.count_cols if c in batch.columns
+        }
+        with self._lock:
+            start = len(self.index)
+            self._spans.append((start, start + len(batch), latest))
+            self.index.add(batch)
+            self._chunks.append(batch)
+            self._frame = None
+            if days is not None:
+                for day, n in days.items():
+                    self.day_counts[day.value] = self.day_counts.get(day.value, 0) + int(n)
+            for c, counts in values.items():
+                target = self.value_counts[c]
+                for value, n in counts.items():
+                    target[value] = target.get(value, 0) + int(n)
+
+    @property
+    def frame(self) -> pd.DataFrame:
+        """지금까지 들어온 전체 로그 (append 전까지는 같은 객체를 돌려줌)"""
+        with self._lock:
+            if self._frame is None:
+                if not self._chunks:
+                    self._frame = pd.DataFrame()
+                else:
+                    self._frame = concat_frames(self._chunks)
+                    self._chunks = [self._frame]
+                    # 새 프레임은 이전 프레임 뒤에 행을 이어 붙인 것 → 만들어 둔 검색 버퍼를 그대로 이어 씀
+                    if self._searcher is None:
+                        self._searcher = KeywordSearcher(self._frame)
+                    else:
+                        self._searcher.extend(self._frame)
+            return self._frame
+
+    @property
+    def searcher(self) -> KeywordSearcher:
+        """frame 에 대한 키워드 검색기 (append 뒤에도 같은 객체)"""
+        frame = self.frame
+        with self._lock:
+            if self._searcher is None:
+                self._searcher = KeywordSearcher(frame)
+            return self._searcher
+
+    def rows_since(self, since: datetime) -> np.ndarray:
+        """timestamp >= since 인 행 번호 (최신 timestamp 가 since 이전인 배치는 보지 않음)"""
+        frame = self.frame
+        with self._lock:
+            spans = [(lo, hi) for lo, hi, latest in self._spans if not (latest < since)]
+        if not spans:
+            return np.empty(0, dtype=np.int64)
+
+        ts = frame[self.ts_col]
+        parts = []
+        for lo, hi in spans:
+            values = pd.to_datetime(ts.iloc[lo:hi]).to_numpy()
+            parts.append(np.flatnonzero(values >= np.datetime64(since)) + lo)
+        return np.concatenate(parts)
+
+    def _scan(self, searcher: KeywordSearcher, nrows: int) -> Optional[Callable[[str], np.ndarray]]:
+        """색인하지 않은 scan_cols 에서 검색어를 포함하는 행 번호를 찾는 함수"""
+        if not self.scan_cols:
+            return None
+        rows = np.arange(nrows)
+        return lambda term: np.flatnonzero(searcher._any_column(term, rows, self.scan_cols, False))
+
+    def _candidates(self, query: SearchQuery) -> Optional[np.ndarray]:
+        scan = self._scan(self.searcher, len(self.frame)) if self.scan_cols else None
+        with self._lock:
+            return self.index.candidates(query, scan)
+
+    def keyword_candidates(self, keyword: str, mode: str = "and") -> Optional[np.ndarray]:
+        """역색인 후보 행 번호 (검증 전, 색인으로 좁힐 수 없는 검색어면 None)"""
+        return self._candidates(parse_keyword(keyword, mode=mode))
+
+    def keyword_rows(
+        self,
+        keyword: str,
+        mode: str = "and",
+        rows: Optional[np.ndarray] = None,
+        candidates: Optional[np.ndarray] = None,
+    ) -> np.ndarray:
+        """
+        keyword 조건을 만족하는 행 번호 (역색인 후보 → 후보 행만 문자열 검증).
+        rows 를 주면 그 행들 안에서만 찾는다. candidates 는 keyword_candidates 결과 재사용용.
+        """
+        frame = self.frame
+        query = parse_keyword(keyword, mode=mode)
+        searcher = self.searcher
+
+        if candidates is None:
+            candidates = self._candidates(query)
+
+        if candidates is None:
+            # 색인으로 좁힐 수 없는 검색어(1글자 등)는 스캔 (rows 가 있으면 그 행만)
+            if rows is None:
+                return np.flatnonzero(searcher.mask(query, self.search_cols))
+            if len(rows) == 0:
+                return rows
+            return rows[searcher.mask(query, self.search_cols, rows=rows)]
+
+        candidates = candidates[candidates < len(frame)]
+        if rows is not None:
+            candidates = np.intersect1d(candidates, rows, assume_unique=True)
+        if len(candidates) == 0:
+            return candidates
+
+        verified = searcher.mask(query, self.search_cols, rows=candidates)
+        return candidates[verified]
+
+    def estimate_days(self, lo: Optional[int], hi: Optional[int]) -> int:
+        """[lo, hi) ns 구간에 걸친 날짜들의 행 수 합 (일 단위라 약간 넉넉한 추정치)"""
+        with self._lock:
+            return sum(
+                n
+                for day, n in self.day_counts.items()
+                if (lo is None or day + 86_400 * 10**9 > lo) and (hi is None or day < hi)
+            )
+
+    def estimate_values(self, col: str, values) -> Optional[int]:
+        """col 값이 values 중 하나인 행 수 (통계가 없는 컬럼이면 None)"""
+        with self._lock:
+            counts = self.value_counts.get(col)
+            if counts is None:
+                return None
+            return sum(counts.get(v, 0) for v in values)
+
+    def stats(self) -> Dict[str, int]:
+        """행 수 / 토큰 수 / 색인 메모리 사용량"""
+        with self._lock:
+            return {"table": self.name, **self.index.stats()}
@@ -0,0 +1,90 @@
+# backend/styles.py
+"""
+페이지 스타일시트 관리 (세션마다 한 번만 주입)
+
+    inject_styles("main")        # static/main.css
+
+- 스타일시트는 static/<id>.css 파일. 프로세스에서 한 번 읽고 내용 해시를 버전으로 쓴다
+- 브라우저 문서 <head> 에 넣어 두므로 rerun 때는 아무것도 보내지 않는다
+  (st.markdown("<style>") 는 rerun 마다 다시 보내지 않으면 화면에서 사라짐)
+- 이미 넣은 스타일시트 목록(id, 버전)은 session_state 에 두고, 목록이 바뀔 때만 다시 넣는다
+  (다른 페이지로 바뀌거나 CSS 파일이 수정된 경우)
+- server.enableStaticServing 이 켜져 있으면 CSS 본문 대신 app/static/<id>.css?v=<버전> 링크만 넣어서
+  브라우저 캐시를 쓴다 (.streamlit/config.toml)
+"""
+
+from __future__ import annotations
+
+import functools
+import hashlib
+import json
+import os
+from dataclasses import dataclass
+from typing import List, Tuple
+
+import streamlit as st
+import streamlit.components.v1 as components
+
+STATIC_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "static")
+
+_SESSION_KEY = "_injected_styles"
+
+
+@dataclass(frozen=True)
+class Stylesheet:
+    id: str
+    css: str
+    version: str
+
+    @property
+    def url(self) -> str:
+        # 페이지 경로 기준 상대 주소 (baseUrlPath 를 써도 맞도록)
+        return f"app/static/{self.id}.css?v={self.version}"
+
+
+@functools.lru_cache(maxsize=None)
+def stylesheet(style_id: str) -> Stylesheet:
+    """static/<style_id>.css (프로세스에서 한 번만 읽음)"""
+    path = os.path.join(STATIC_DIR, f"{style_id}.css")
+    with open(path, encoding="utf-8") as f:
+        css = f.read()
+    version = hashlib.blake2b(css.encode("utf-8"), digest_size=6).hexdigest()
+    return Stylesheet(style_id, css, version)
+
+
+def _static_serving() -> bool:
+    try:
+        return bool(st.get_option("server.enableStaticServing"))
+    except Exception:
+        return False
+
+
+def _head_script(sheets: List[Stylesheet], linked: bool) -> str:
+    """부모 문서 <head> 의 관리 대상 스타일을 이 목록으로 교체하는 스크립트"""
+    items = [
+        {"id": f"style-{s.id}", "href": s.url} if linked else {"id": f"style-{s.id}", "css": s.css}
+        for s in sheets
+    ]
+    # </script> 로 스크립트가 끊기지 않도록
+    payload = json.dumps(items, ensure_ascii=False).replace("</", "<\\/")
+    return f"""<script>
+const doc = window.parent.document;
+doc.querySelectorAll("[data-managed-style]").forEach((el) => el.remove());
+for (const item of {payload}) {{
+  const el = doc.createElement(item.href ? "link" : "style");
+  el.id = item.id;
+  el.setAttribute("data-managed-style", "");
+  if (item.href) {{ el.rel = "stylesheet"; el.href = item.href; }} else {{ el.textContent = item.css; }}
+  doc.head.appendChild(el);
+}}
+</script>"""
+
+
+def inject_styles(*style_ids: str) -> None:
+    """style_ids 스타일시트를 문서에 넣음 (이 세션에 이미 같은 목록이 들어가 있으면 아무것도 안 함)"""
+    sheets = [stylesheet(i) for i in style_ids]
+    wanted: Tuple[Tuple[str, str], ...] = tuple((s.id, s.version) for s in sheets)
+    if st.session_state.get(_SESSION_KEY) == wanted:
+        return
+    components.html(_head_script(sheets, linked=_static_serving()), height=0)
+    st.session_state[_SESSION_KEY] = wanted
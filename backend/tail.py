@@ -0,0 +1,161 @@
+# backend/tail.py
+"""
+로그 tail(follow) 모드
+
+세션마다 LogTail 하나를 두고 high-water mark(가장 최신 timestamp 와 그 시각의 id 들)를 기억한다.
+새로고침 때는 소스에 since=high-water mark 로 새 행만 요청하고,
+이미 최신순 정렬된 기존 결과 앞에 붙인다. 비용은 창 크기가 아니라 새로 들어온 행 수에 비례한다.
+
+    state = st.session_state
+    df = tail_logs(state, "lambda", filters)     # 첫 호출은 전체, 이후는 증분 (최신 rows 행만 반환)
+"""
+
+from __future__ import annotations
+
+import threading
+from dataclasses import replace
+from typing import Any, Callable, Dict, FrozenSet, List, MutableMapping, Optional
+
+import pandas as pd
+
+from .dtypes import concat_frames
+from .result_cache import normalize_filters
+from .sources import LogQuerySpec, LogSchema, LogSource
+
+_STATE_KEY = "_log_tail_{kind}"
+
+# tail_logs 가 돌려주는 최신 행 수 기본값 (rows / filters["limit"] / max_rows 가 모두 없을 때)
+DEFAULT_TAIL_ROWS = 1000
+
+
+class LogTail:
+    """한 세션 / 한 필터 조합의 증분 조회 상태"""
+
+    def __init__(
+        self,
+        source: LogSource,
+        filters: Dict[str, Any],
+        max_rows: Optional[int] = None,
+    ):
+        self.source = source
+        self.schema: LogSchema = source.schema
+        self.spec = LogQuerySpec.from_filters(self.schema, filters)
+        self.filters_key = normalize_filters(filters)
+        self.max_rows = max_rows
+
+        # 최신순으로 정렬된 조각들 (앞쪽이 최신). frame 을 읽을 때만 합친다.
+        self._chunks: List[pd.DataFrame] = []
+        self._frame: Optional[pd.DataFrame] = None
+        self.high_water: Optional[pd.Timestamp] = None
+        self.high_water_ids: FrozenSet[Any] = frozenset()
+        self.last_new_rows = 0
+        self._lock = threading.Lock()
+
+    def _advance(self, new: pd.DataFrame) -> None:
+        """새 행(최신순 정렬)으로 high-water mark 갱신"""
+        ts_col, id_col = self.schema.ts_col, self.schema.id_col
+        latest = new[ts_col].iloc[0]
+        if self.high_water is None or latest > self.high_water:
+            ids = new.loc[new[ts_col] == latest, id_col] if id_col in new else []
+            self.high_water = latest
+            self.high_water_ids = frozenset(ids)
+        elif latest == self.high_water and id_col in new:
+            ids = new.loc[new[ts_col] == latest, id_col]
+            self.high_water_ids = self.high_water_ids | frozenset(ids)
+
+    def _only_new(self, df: pd.DataFrame) -> pd.DataFrame:
+        """high-water mark 이후 행만 (같은 시각이면 이미 본 id 제외)"""
+        if self.high_water is None or df.empty:
+            return df
+        ts = df[self.schema.ts_col]
+        newer = ts > self.high_water
+        same = ts == self.high_water
+        if self.high_water_ids and self.schema.id_col in df:
+            same &= ~df[self.schema.id_col].isin(self.high_water_ids)
+        return df[newer | same]
+
+    def refresh(self) -> int:
+        """새 행을 가져와 앞에 붙이고, 가져온 행 수를 돌려준다"""
+        with self._lock:
+            ts_col = self.schema.ts_col
+            if self.high_water is None:
+                spec = self.spec
+            else:
+                since = self.high_water.to_pydatetime()
+                spec = replace(self.spec, since=since)
+
+            new = self._only_new(self.source.query(spec))
+            if not new.empty:
+                new = new.assign(**{ts_col: pd.to_datetime(new[ts_col])})
+                new = new.sort_values(ts_col, ascending=False, kind="stable")
+                self._advance(new)
+                self._chunks.insert(0, new)
+                self._frame = None
+                self._trim()
+
+            self.last_new_rows = len(new)
+            return len(new)
+
+    def _trim(self) -> None:
+        """max_rows 를 넘는 오래된 조각 정리"""
+        if self.max_rows is None:
+            return
+        total = 0
+        for i, chunk in enumerate(self._chunks):
+            total += len(chunk)
+            if total >= self.max_rows:
+                keep = len(chunk) - (total - self.max_rows)
+                self._chunks = self._chunks[:i] + [chunk.iloc[:keep]]
+                return
+
+    def head(self, n: int) -> pd.DataFrame:
+        """최신 n 행 (전체를 합치지 않고 앞쪽 조각만 사용)"""
+        parts, total = [], 0
+        with self._lock:
+            for chunk in self._chunks:
+                parts.append(chunk.iloc[: n - total])
+                total += len(parts[-1])
+                if total >= n:
+                    break
+        if not parts:
+            return pd.DataFrame(columns=self.spec.output_columns(self.schema))
+        return concat_frames(parts)
+
+    @property
+    def frame(self) -> pd.DataFrame:
+        """지금까지 모은 전체 결과 (최신순)"""
+        with self._lock:
+            if self._frame is None:
+                if not self._chunks:
+                    self._frame = pd.DataFrame(columns=self.spec.output_columns(self.schema))
+                else:
+                    self._frame = concat_frames(self._chunks)
+                    self._chunks = [self._frame]
+            return self._frame
+
+
+def tail_logs(
+    state: MutableMapping[str, Any],
+    kind: str,
+    filters: Dict[str, Any],
+    source_getter: Optional[Callable[[str], LogSource]] = None,
+    max_rows: Optional[int] = None,
+    rows: Optional[int] = None,
+) -> pd.DataFrame:
+    """
+    세션 상태(st.session_state 등)에 LogTail 을 두고 증분 새로고침한 뒤 최신 rows 행을 돌려준다
+    (rows 가 없으면 filters["limit"], max_rows, DEFAULT_TAIL_ROWS 순).
+    모은 창 전체를 합치지 않고 앞쪽 조각만 읽으므로 새로고침 비용이 창 크기와 무관하다.
+    filters 가 바뀌면 tail 을 새로 만든다.
+    """
+    if source_getter is None:
+        from .logs import get_log_source as source_getter
+
+    key = _STATE_KEY.format(kind=kind)
+    tail: Optional[LogTail] = state.get(key)
+    if tail is None or tail.filters_key != normalize_filters(filters):
+        tail = LogTail(source_getter(kind), filters, max_rows=max_rows)
+        state[key] = tail
+
+    tail.refresh()
+    return tail.head(rows or filters.get("limit") or max_rows or DEFAULT_TAIL_ROWS)
@@ -0,0 +1,13 @@
+# benchmarks/__init__.py
+"""
+백엔드 조회 경로 벤치마크
+
+- generators     : 시드 고정 Lambda / SES 로그 생성기 (크기, 레벨·status 비율, 키워드 선택도, 한글 문장)
+- bench_query    : 단계별(date / level·status / keyword / sort) + get_*_logs 전체 시간 측정, JSON 저장·비교
+- bench_memory   : object 컬럼 대비 category + Arrow 문자열 메모리, level·status 필터 시간
+- bench_files    : 시간별 로그 파일 병렬 로드 (FileLogSource) 워커 수별 시간
+- bench_date_filter : _apply_date_filter 기존 방식 대비 비교
+- bench_startup  : 경로별 cold start (새 프로세스에서 페이지 모듈 import 시간, pandas 로드 여부)
+- bench_reports  : 리포트 저장소 (SQLite + FTS5) 적재 / 한글 전문 검색 / id·월 조회 시간
+- bench_keyword_sources : 소스별(메모리 / SQLite / Parquet / 공유 창) 한글·전각 키워드 검색 결과 일치 확인 + 시간
+"""
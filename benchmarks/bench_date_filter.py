@@ -0,0 +1,103 @@
+# benchmarks/bench_date_filter.py
+"""
+_apply_date_filter 벤치마크 (기존 .dt.date 방식 vs datetime64 비교 방식)
+
+실행:
+    python -m benchmarks.bench_date_filter
+    python -m benchmarks.bench_date_filter --sizes 100000 1000000
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+from datetime import date
+from typing import Callable, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from backend import _apply_date_filter
+
+
+def _legacy_apply_date_filter(
+    df: pd.DataFrame,
+    start_date: Optional[date],
+    end_date: Optional[date],
+    ts_col: str = "timestamp",
+) -> pd.DataFrame:
+    """비교용: 변경 전 구현 그대로"""
+    if df.empty:
+        return df
+    if ts_col not in df.columns:
+        return df
+
+    df = df.copy()
+    df[ts_col] = pd.to_datetime(df[ts_col])
+
+    if start_date:
+        df = df[df[ts_col].dt.date >= start_date]
+    if end_date:
+        df = df[df[ts_col].dt.date <= end_date]
+
+    return df
+
+
+def make_frame(n: int, days: int = 30, ordered: str = "desc", seed: int = 0) -> pd.DataFrame:
+    """n 행짜리 Lambda 로그 모양 프레임 (timestamp 는 최근 days 일에 분포)"""
+    rng = np.random.default_rng(seed)
+    end = pd.Timestamp("2025-11-24")
+    offsets = rng.integers(0, days * 86_400, size=n)
+    ts = end - pd.to_timedelta(offsets, unit="s")
+    if ordered == "desc":
+        ts = ts.sort_values(ascending=False)
+    elif ordered == "asc":
+        ts = ts.sort_values()
+
+    return pd.DataFrame(
+        {
+            "timestamp": ts,
+            "level": rng.choice(["DEBUG", "INFO", "WARN", "ERROR"], size=n),
+            "request_id": np.arange(n),
+        }
+    )
+
+
+def _best_of(fn: Callable[[], pd.DataFrame], repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - t0)
+    return best
+
+
+def run(sizes: List[int], repeat: int = 3) -> None:
+    start_date = date(2025, 11, 10)
+    end_date = date(2025, 11, 17)
+
+    print(f"{'rows':>10} {'order':>8} {'legacy(s)':>10} {'new(s)':>10} {'speedup':>8}")
+    for n in sizes:
+        for ordered in ("desc", "random"):
+            df = make_frame(n, ordered=ordered)
+
+            # 결과가 같은지 먼저 확인
+            expected = _legacy_apply_date_filter(df, start_date, end_date)
+            actual = _apply_date_filter(df, start_date, end_date)
+            assert expected.index.equals(actual.index), "결과 불일치"
+
+            legacy = _best_of(lambda: _legacy_apply_date_filter(df, start_date, end_date), repeat)
+            new = _best_of(lambda: _apply_date_filter(df, start_date, end_date), repeat)
+            print(f"{n:>10} {ordered:>8} {legacy:>10.4f} {new:>10.4f} {legacy / new:>7.1f}x")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10**5, 10**6, 10**7])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+    run(args.sizes, repeat=args.repeat)
+
+
+if __name__ == "__main__":
+    main()
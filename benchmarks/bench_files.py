@@ -0,0 +1,92 @@
+# benchmarks/bench_files.py
+"""
+여러 로그 파일 병렬 로드 (FileLogSource) 워커 수별 시간
+
+시간별 Lambda 로그 파일을 임시 디렉터리에 만든 뒤 워커 수를 바꿔 가며
+전체 로드 / 레벨 필터 / 한 페이지 조회 시간을 잰다.
+
+실행:
+    python -m benchmarks.bench_files
+    python -m benchmarks.bench_files --rows 2000000 --days 7 --workers 1 2 4 8 16 --format parquet
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import shutil
+import tempfile
+from typing import List
+
+import pandas as pd
+
+from backend import LAMBDA_SCHEMA
+from backend.files import FileLogSource
+from backend.sources import LogQuerySpec
+
+from .bench_query import _best_of
+from .generators import make_lambda_logs
+
+
+def write_hourly_files(root: str, rows: int, days: int, fmt: str, seed: int = 0) -> int:
+    """<root>/YYYY-MM-DD/HH.<fmt> 시간별 파일 생성, 파일 수 반환"""
+    df = make_lambda_logs(rows, days=days, seed=seed)
+    df["timestamp"] = pd.to_datetime(df["timestamp"])
+    n = 0
+    for (day, hour), g in df.groupby([df["timestamp"].dt.date, df["timestamp"].dt.hour]):
+        os.makedirs(os.path.join(root, str(day)), exist_ok=True)
+        path = os.path.join(root, str(day), f"{hour:02d}.{fmt}")
+        if fmt == "parquet":
+            g.to_parquet(path, index=False)
+        elif fmt == "csv":
+            g.to_csv(path, index=False)
+        else:
+            g.to_json(path, orient="records", lines=True, date_format="iso")
+        n += 1
+    return n
+
+
+def run(rows: int, days: int, workers: List[int], fmt: str, chunk_size: int, executor: str, repeat: int) -> None:
+    root = tempfile.mkdtemp(prefix="bench_files_")
+    try:
+        files = write_hourly_files(root, rows, days, fmt)
+        print(f"{files} files, {rows} rows ({fmt}, executor={executor}, chunk_size={chunk_size})")
+        print(f"{'workers':>8} {'full(s)':>9} {'level(s)':>9} {'page(s)':>9} {'speedup':>8}")
+
+        specs = {
+            "full": LogQuerySpec(),
+            "level": LogQuerySpec(level_values=("ERROR",)),
+            "page": LogQuerySpec(level_values=("ERROR", "WARN"), limit=100),
+        }
+        base = None
+        for w in workers:
+            source = FileLogSource(LAMBDA_SCHEMA, root, workers=w, chunk_size=chunk_size, executor=executor)
+            try:
+                source.query(specs["page"])  # 풀 기동은 측정에서 제외
+                times = {name: _best_of(lambda s=spec: source.query(s), repeat) for name, spec in specs.items()}
+            finally:
+                source.close()
+            base = base or times["full"]
+            print(
+                f"{w:>8} {times['full']:>9.3f} {times['level']:>9.3f} {times['page']:>9.3f}"
+                f" {base / times['full']:>7.1f}x"
+            )
+    finally:
+        shutil.rmtree(root, ignore_errors=True)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rows", type=int, default=500_000)
+    parser.add_argument("--days", type=int, default=7)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4, os.cpu_count() or 1])
+    parser.add_argument("--format", choices=["parquet", "jsonl", "csv"], default="parquet")
+    parser.add_argument("--chunk-size", type=int, default=4)
+    parser.add_argument("--executor", choices=["process", "thread"], default="process")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+    run(args.rows, args.days, sorted(set(args.workers)), args.format, args.chunk_size, args.executor, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
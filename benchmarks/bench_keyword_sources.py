@@ -0,0 +1,104 @@
+# benchmarks/bench_keyword_sources.py
+"""
+소스별 키워드 검색 결과 일치 확인 + 시간 (메모리 / SQLite / Parquet / 공유 창 캐시)
+
+같은 로그를 각 소스에 넣고 한글(띄어쓰기 다름, 조사), 영문, 전각(NFKC) 검색어의 건수와
+첫 페이지가 메모리 소스(TableLogSource)와 같은지 확인한다. 다르면 AssertionError.
+
+실행:
+    python -m benchmarks.bench_keyword_sources
+    python -m benchmarks.bench_keyword_sources --rows 300000 --repeat 3
+"""
+
+from __future__ import annotations
+
+import argparse
+import tempfile
+from typing import Dict, List
+
+import numpy as np
+import pandas as pd
+
+from backend import LAMBDA_SCHEMA
+from backend.parquet import ParquetLogSource
+from backend.shared_cache import SharedWindowCache
+from backend.sources import LogQuerySpec, LogSource, SQLiteLogSource, TableLogSource
+
+from .bench_query import _best_of
+from .generators import make_lambda_logs
+
+KEYWORDS: List[str] = [
+    "사용자동기화",
+    "사용자 동기화가",
+    "동기화 지연",
+    "ＡＰＩ 호출",
+    "api",
+    "timeout",
+    "발송 실패 수신자",
+]
+
+# NFKC / 공백이 달라야 찾히는 행 (전각 영문, 전각 공백, 줄바꿈)
+VARIANTS = [
+    "사용자　동기화 요청 (ＡＰＩ 호출 제한)",
+    "사용자\n동기화 재시도: Ｔｉｍｅｏｕｔ",
+    "이메일 발송\t실패 — 수신자 주소 오류",
+]
+
+
+def make_logs(rows: int, seed: int = 0) -> pd.DataFrame:
+    """지금부터 하루 전까지의 로그 (공유 창 캐시 범위 안) + 일부 행은 VARIANTS 문장"""
+    end = pd.Timestamp.now().floor("s") - pd.Timedelta(seconds=1)
+    df = make_lambda_logs(rows, days=1, end=end, seed=seed)
+    rng = np.random.default_rng(seed)
+    picked = rng.choice(rows, size=max(len(VARIANTS), rows // 1000), replace=False)
+    df.loc[picked, "message"] = np.resize(np.asarray(VARIANTS, dtype=object), len(picked))
+    return df
+
+
+def sources(df: pd.DataFrame, root: str) -> Dict[str, LogSource]:
+    memory = TableLogSource(LAMBDA_SCHEMA)
+    sqlite = SQLiteLogSource(LAMBDA_SCHEMA)
+    parquet = ParquetLogSource(LAMBDA_SCHEMA, f"{root}/parquet")
+    for source in (memory, sqlite, parquet):
+        source.append(df)
+    return {
+        "memory": memory,
+        "sqlite": sqlite,
+        "parquet": parquet,
+        "window": SharedWindowCache(TableLogSource(LAMBDA_SCHEMA, memory.table), f"{root}/window", hours=48),
+    }
+
+
+def run(rows: int, repeat: int = 3) -> None:
+    df = make_logs(rows)
+    start = df["timestamp"].min().date()
+    with tempfile.TemporaryDirectory() as root:
+        by_name = sources(df, root)
+        print(f"{'keyword':<16} " + " ".join(f"{name:>14}" for name in by_name))
+        for keyword in KEYWORDS:
+            spec = LogQuerySpec(start_date=start, keyword=keyword)
+            page = LogQuerySpec(start_date=start, keyword=keyword, limit=50)
+
+            expected = by_name["memory"].count(spec)
+            expected_ids = list(by_name["memory"].query(page)["request_id"].astype(str))
+            cells = []
+            for name, source in by_name.items():
+                n = source.count(spec)
+                ids = list(source.query(page)["request_id"].astype(str))
+                assert n == expected, f"{keyword!r}: {name} {n}건, memory {expected}건"
+                assert ids == expected_ids, f"{keyword!r}: {name} 첫 페이지가 memory 와 다름"
+                seconds = _best_of(lambda: source.count(spec), repeat)
+                cells.append(f"{n:>6} {seconds * 1e3:>5.0f}ms")
+            print(f"{keyword:<16} " + " ".join(f"{c:>14}" for c in cells))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+    run(args.rows, repeat=args.repeat)
+
+
+if __name__ == "__main__":
+    main()
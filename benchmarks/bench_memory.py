@@ -0,0 +1,63 @@
+# benchmarks/bench_memory.py
+"""
+로그 프레임 메모리 / level·status 필터 비교 (object 컬럼 vs category + Arrow 문자열)
+
+실행:
+    python -m benchmarks.bench_memory
+    python -m benchmarks.bench_memory --sizes 1000000 --days 1
+"""
+
+from __future__ import annotations
+
+import argparse
+from typing import List
+
+import pandas as pd
+
+from backend import LAMBDA_SCHEMA, SES_SCHEMA
+from backend.dtypes import category_mask, compact_frame
+
+from .bench_query import _best_of
+from .generators import make_lambda_logs, make_ses_logs
+
+
+def _mb(df: pd.DataFrame) -> float:
+    return df.memory_usage(index=True, deep=True).sum() / 1024**2
+
+
+def run(sizes: List[int], days: int = 1, repeat: int = 5) -> None:
+    print(
+        f"{'kind':>6} {'rows':>9} {'object(MB)':>11} {'compact(MB)':>12} {'ratio':>6}"
+        f" {'isin(ms)':>9} {'codes(ms)':>10}"
+    )
+    for n in sizes:
+        for schema, make, wanted in (
+            (LAMBDA_SCHEMA, make_lambda_logs, ["ERROR", "WARN"]),
+            (SES_SCHEMA, make_ses_logs, ["BOUNCE", "COMPLAINT"]),
+        ):
+            before = make(n, days=days)
+            after = compact_frame(before, schema)
+            col = schema.level_col
+
+            assert (before[col].isin(wanted).to_numpy() == category_mask(after[col], wanted)).all()
+            isin = _best_of(lambda: before[col].isin(wanted).to_numpy(), repeat)
+            codes = _best_of(lambda: category_mask(after[col], wanted), repeat)
+
+            mb_before, mb_after = _mb(before), _mb(after)
+            print(
+                f"{schema.kind:>6} {n:>9} {mb_before:>11.1f} {mb_after:>12.1f} {mb_before / mb_after:>5.1f}x"
+                f" {isin * 1e3:>9.2f} {codes * 1e3:>10.2f}"
+            )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10**5, 10**6])
+    parser.add_argument("--days", type=int, default=1)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    run(args.sizes, days=args.days, repeat=args.repeat)
+
+
+if __name__ == "__main__":
+    main()
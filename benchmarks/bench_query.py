@@ -0,0 +1,193 @@
+# benchmarks/bench_query.py
+"""
+조회 경로 벤치마크 (단계별 + get_lambda_logs / get_ses_logs 전체)
+
+단계: ingest(소스 적재·색인) / date / level(status) / keyword / sort / end_to_end
+결과는 JSON 으로 저장하고, --baseline 을 주면 이전 결과와 비교해 threshold 배 이상 느려진 항목을 표시한다.
+
+실행:
+    python -m benchmarks.bench_query
+    python -m benchmarks.bench_query --sizes 100000 1000000 --out bench.json
+    python -m benchmarks.bench_query --baseline bench.json --threshold 1.2
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import platform
+import sys
+import time
+from datetime import date, datetime
+from typing import Any, Callable, Dict, List, Optional
+
+import pandas as pd
+
+import backend
+from backend import (
+    LAMBDA_SCHEMA,
+    SES_SCHEMA,
+    TableLogSource,
+    _apply_date_filter,
+    _apply_keyword_filter,
+    ses_statuses_for_levels,
+)
+
+from .generators import make_lambda_logs, make_ses_logs
+
+# 생성기 기본 구간(2025-11-18 ~ 2025-11-24) 중 사흘
+START_DATE = date(2025, 11, 20)
+END_DATE = date(2025, 11, 22)
+
+# (kind, 생성기, 레벨 필터, 키워드)
+CASES = [
+    ("lambda", make_lambda_logs, ["ERROR", "WARN"], "timeout"),
+    ("lambda", make_lambda_logs, ["ERROR"], "타임아웃"),
+    ("ses", make_ses_logs, ["ERROR"], "invoice"),
+    ("ses", make_ses_logs, ["ERROR"], "청구서"),
+]
+
+
+def _best_of(fn: Callable[[], Any], repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - t0)
+    return best
+
+
+def _stages(df: pd.DataFrame, kind: str, levels: List[str], keyword: str, repeat: int) -> Dict[str, float]:
+    """pandas 프레임 위에서 단계별로 따로 잰 시간 (앞 단계 결과를 다음 단계 입력으로)"""
+    schema = LAMBDA_SCHEMA if kind == "lambda" else SES_SCHEMA
+    values = levels if kind == "lambda" else ses_statuses_for_levels(levels)
+
+    timings: Dict[str, float] = {}
+    timings["date"] = _best_of(lambda: _apply_date_filter(df, START_DATE, END_DATE), repeat)
+    dated = _apply_date_filter(df, START_DATE, END_DATE)
+
+    level_filter = lambda: dated[dated[schema.level_col].isin(values)] if values else dated
+    timings["level"] = _best_of(level_filter, repeat)
+    leveled = level_filter()
+
+    # 키워드는 레벨 필터 전 프레임 기준 (선택도가 낮은 경우를 보기 위해)
+    # 검색기 캐시가 프레임 단위라 첫 호출(버퍼 생성)과 반복 호출을 나눠 기록
+    t0 = time.perf_counter()
+    _apply_keyword_filter(dated, keyword, cols=list(schema.search_cols))
+    timings["keyword_cold"] = time.perf_counter() - t0
+    timings["keyword"] = _best_of(
+        lambda: _apply_keyword_filter(dated, keyword, cols=list(schema.search_cols)), repeat
+    )
+
+    timings["sort"] = _best_of(lambda: leveled.sort_values(schema.ts_col, ascending=False), repeat)
+    return timings
+
+
+def _end_to_end(df: pd.DataFrame, kind: str, levels: List[str], keyword: str, repeat: int) -> Dict[str, float]:
+    """메모리 소스에 적재한 뒤 get_*_logs(캐시 우회) 전체 시간"""
+    schema = LAMBDA_SCHEMA if kind == "lambda" else SES_SCHEMA
+    source = TableLogSource(schema)
+
+    t0 = time.perf_counter()
+    source.append(df)
+    ingest = time.perf_counter() - t0
+
+    backend.set_log_source(kind, source)
+    fetch = backend.get_lambda_logs if kind == "lambda" else backend.get_ses_logs
+    count = backend.count_lambda_logs if kind == "lambda" else backend.count_ses_logs
+    filters = {
+        "start_date": START_DATE,
+        "end_date": END_DATE,
+        "levels": levels,
+        "keyword": keyword,
+    }
+    return {
+        "ingest": ingest,
+        "end_to_end": _best_of(lambda: fetch.uncached(filters), repeat),
+        "end_to_end_page": _best_of(lambda: fetch.uncached({**filters, "limit": 100}), repeat),
+        "count": _best_of(lambda: count.uncached(filters), repeat),
+    }
+
+
+def run(sizes: List[int], repeat: int = 3, keyword_rate: float = 0.01, seed: int = 0) -> Dict[str, Any]:
+    results = []
+    for n in sizes:
+        for kind, make, levels, keyword in CASES:
+            df = make(n, keyword=keyword, keyword_rate=keyword_rate, seed=seed)
+            timings = {
+                **_stages(df, kind, levels, keyword, repeat),
+                **_end_to_end(df, kind, levels, keyword, repeat),
+            }
+            for stage, seconds in timings.items():
+                results.append(
+                    {
+                        "kind": kind,
+                        "rows": n,
+                        "keyword": keyword,
+                        "stage": stage,
+                        "seconds": round(seconds, 6),
+                    }
+                )
+                print(f"{kind:>6} {n:>9} {keyword:>8} {stage:>16} {seconds:>10.4f}s")
+
+    return {
+        "created_at": datetime.now().isoformat(timespec="seconds"),
+        "python": sys.version.split()[0],
+        "pandas": pd.__version__,
+        "platform": platform.platform(),
+        "params": {"sizes": sizes, "repeat": repeat, "keyword_rate": keyword_rate, "seed": seed},
+        "results": results,
+    }
+
+
+def _key(row: Dict[str, Any]) -> tuple:
+    return row["kind"], row["rows"], row["keyword"], row["stage"]
+
+
+def compare(current: Dict[str, Any], baseline: Dict[str, Any], threshold: float = 1.2) -> List[Dict[str, Any]]:
+    """baseline 대비 threshold 배 이상 느려진 항목 목록"""
+    before = {_key(r): r["seconds"] for r in baseline.get("results", [])}
+    regressions = []
+    for row in current["results"]:
+        old = before.get(_key(row))
+        if not old:
+            continue
+        ratio = row["seconds"] / old
+        if ratio >= threshold:
+            regressions.append({**row, "baseline": old, "ratio": round(ratio, 2)})
+    return regressions
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10**5, 10**6])
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--keyword-rate", type=float, default=0.01)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--out", help="결과 JSON 경로")
+    parser.add_argument("--baseline", help="비교할 이전 결과 JSON")
+    parser.add_argument("--threshold", type=float, default=1.2, help="이 배수 이상 느려지면 회귀로 표시")
+    args = parser.parse_args(argv)
+
+    report = run(args.sizes, repeat=args.repeat, keyword_rate=args.keyword_rate, seed=args.seed)
+    if args.out:
+        with open(args.out, "w", encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)
+        regressions = compare(report, baseline, args.threshold)
+        for r in regressions:
+            print(
+                f"느려짐: {r['kind']} {r['rows']} {r['keyword']} {r['stage']} "
+                f"{r['baseline']:.4f}s → {r['seconds']:.4f}s ({r['ratio']}x)"
+            )
+        if regressions:
+            return 1
+        print(f"회귀 없음 (threshold {args.threshold}x)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,82 @@
+# benchmarks/bench_reports.py
+"""
+리포트 저장소 (SQLite + FTS5) 적재 / 검색 / 조회 시간
+
+한글 법령 리포트를 임시 SQLite 파일에 넣고 검색어별 전문 검색(최신순 한 페이지 / 관련도순 한 페이지 / 전체 건수),
+id 조회, 캘린더 월 조회 시간을 잰다. baseline 은 같은 리포트 목록을 파이썬에서 전부 훑는 부분 문자열 검색.
+
+실행:
+    python -m benchmarks.bench_reports
+    python -m benchmarks.bench_reports --sizes 10000 50000 --keywords 안전관리 "점검 주기" 과태료 법
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import shutil
+import tempfile
+import time
+from typing import List
+
+from backend.db import ConnectionPool
+from backend.reports import FTS_COLUMNS, ReportRepository
+
+from .bench_query import _best_of
+from .generators import make_reports
+
+
+def _scan(reports: List[dict], keyword: str, limit: int) -> List[dict]:
+    """baseline: 전부 메모리에 올려 두고 필드마다 부분 문자열 검색 (AND)"""
+    terms = keyword.lower().split()
+    hits = [
+        r for r in reports
+        if all(any(t in str(r.get(c, "")).lower() for c in FTS_COLUMNS) for t in terms)
+    ]
+    hits.sort(key=lambda r: r["publishDate"], reverse=True)
+    return hits[:limit]
+
+
+def run(sizes: List[int], keywords: List[str], limit: int, repeat: int) -> None:
+    print(f"{'reports':>8} {'keyword':>10} {'hits':>7} {'page(ms)':>9} {'rank(ms)':>9} {'count(ms)':>10} {'scan(ms)':>9}")
+    for n in sizes:
+        reports = make_reports(n)
+        root = tempfile.mkdtemp(prefix="bench_reports_")
+        try:
+            pool = ConnectionPool(os.path.join(root, "reports.sqlite3"))
+            repo = ReportRepository(pool)
+            t0 = time.perf_counter()
+            repo.add_many(reports)
+            print(f"{n:>8} {'(load)':>10} {n:>7} {(time.perf_counter() - t0) * 1e3:>9.0f}")
+
+            for keyword in keywords:
+                page = _best_of(lambda: repo.search(keyword, limit=limit), repeat)
+                rank = _best_of(lambda: repo.search(keyword, limit=limit, order="relevance"), repeat)
+                count = _best_of(lambda: repo.count(keyword), repeat)
+                scan = _best_of(lambda: _scan(reports, keyword, limit), max(1, repeat // 2))
+                print(
+                    f"{n:>8} {keyword:>10} {repo.count(keyword):>7} {page * 1e3:>9.2f} {rank * 1e3:>9.2f}"
+                    f" {count * 1e3:>10.2f} {scan * 1e3:>9.1f}"
+                )
+
+            get = _best_of(lambda: repo.get(str(n // 2)), repeat)
+            month = _best_of(lambda: repo.dates_in_month(2025, 6), repeat)
+            print(f"{n:>8} {'get(id)':>10} {'':>7} {get * 1e3:>9.3f}")
+            print(f"{n:>8} {'month':>10} {'':>7} {month * 1e3:>9.3f}")
+            pool.close()
+        finally:
+            shutil.rmtree(root, ignore_errors=True)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 50_000])
+    parser.add_argument("--keywords", nargs="+", default=["안전관리", "안전 관리", "점검 주기를", "과태료", "개인정보", "법"])
+    parser.add_argument("--limit", type=int, default=20)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    run(args.sizes, args.keywords, limit=args.limit, repeat=args.repeat)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+# benchmarks/bench_startup.py
+"""
+경로별 cold start (새 인터프리터에서 streamlit + 페이지 모듈 import 시간)
+
+경로마다 새 파이썬 프로세스를 띄워 app.py 가 그 경로에서 import 하는 모듈만 불러오고,
+import 시간과 pandas / pyarrow 를 불러왔는지 출력한다. (오토스케일로 새로 뜬 pod 의 첫 요청 기준)
+실제 서버의 경로별 첫 렌더링 시간은 디버그 패널(?debug=1)의 cold start 표에서 본다.
+
+실행:
+    python -m benchmarks.bench_startup
+    python -m benchmarks.bench_startup --repeat 10
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+from typing import Dict
+
+# app.py 가 경로별로 import 하는 모듈
+ROUTES: Dict[str, str] = {
+    "main": "pages.main",
+    "report": "pages.report",
+}
+
+_PROBE = """
+import json, sys, time
+t0 = time.perf_counter()
+import streamlit
+t1 = time.perf_counter()
+import backend.startup, {module}
+t2 = time.perf_counter()
+print(json.dumps({{
+    "streamlit": t1 - t0,
+    "route": t2 - t1,
+    "pandas": "pandas" in sys.modules,
+    "pyarrow": "pyarrow" in sys.modules,
+}}))
+"""
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def probe(module: str) -> Dict[str, float]:
+    out = subprocess.run(
+        [sys.executable, "-c", _PROBE.format(module=module)],
+        cwd=ROOT,
+        env={**os.environ, "PYTHONPATH": ROOT},
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return json.loads(out.stdout.strip().splitlines()[-1])
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    print(f"{'route':<8} {'streamlit':>10} {'route import':>13}  pandas  pyarrow")
+    for route, module in ROUTES.items():
+        runs = [probe(module) for _ in range(args.repeat)]
+        best = min(runs, key=lambda r: r["route"])
+        print(
+            f"{route:<8} {best['streamlit'] * 1000:>8.0f}ms {best['route'] * 1000:>11.0f}ms"
+            f"  {str(best['pandas']):<6}  {best['pyarrow']}"
+        )
+
+
+if __name__ == "__main__":
+    main()
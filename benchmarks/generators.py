@@ -0,0 +1,224 @@
+# benchmarks/generators.py
+"""
+벤치마크용 합성 로그 생성기 (seed 가 같으면 항상 같은 프레임)
+
+    df = make_lambda_logs(1_000_000, keyword="timeout", keyword_rate=0.01, seed=1)
+    df = make_ses_logs(200_000, status_mix={"DELIVERED": 0.9, "BOUNCE": 0.07, "COMPLAINT": 0.03})
+
+keyword 를 주면 대략 keyword_rate 비율의 행 message(subject) 에 그 단어가 들어간다.
+korean_rate 비율의 행은 한글 문장을 쓴다.
+"""
+
+from __future__ import annotations
+
+from typing import Dict, Optional
+
+import numpy as np
+import pandas as pd
+
+DEFAULT_END = pd.Timestamp("2025-11-24 23:59:59")
+
+LEVEL_MIX: Dict[str, float] = {"DEBUG": 0.25, "INFO": 0.55, "WARN": 0.12, "ERROR": 0.08}
+
+# status → SES eventType
+STATUS_MIX: Dict[str, float] = {
+    "DELIVERED": 0.9,
+    "BOUNCE": 0.05,
+    "COMPLAINT": 0.02,
+    "REJECT": 0.01,
+    "DELAYED": 0.02,
+}
+EVENT_BY_STATUS: Dict[str, str] = {
+    "DELIVERED": "Delivery",
+    "BOUNCE": "Bounce",
+    "COMPLAINT": "Complaint",
+    "REJECT": "Reject",
+    "DELAYED": "DeliveryDelay",
+}
+
+FUNCTION_NAMES = [
+    "process-orders",
+    "send-report-email",
+    "sync-users",
+    "resize-images",
+    "billing-webhook",
+    "daily-digest",
+]
+
+EN_MESSAGES = [
+    "Order processing completed successfully.",
+    "Failed to send email: SES ThrottlingException",
+    "User sync delayed due to API rate limiting.",
+    "Sync started with batch_size=100",
+    "Task timed out after 30.00 seconds",
+    "Retrying request (attempt 2/3)",
+    "Connection reset by peer",
+    "Cache miss for key user:{n}",
+]
+
+KO_MESSAGES = [
+    "주문 처리가 정상적으로 완료되었습니다.",
+    "이메일 발송 실패: 수신자 주소를 확인하세요",
+    "사용자 동기화가 지연되고 있습니다 (API 호출 제한)",
+    "배치 작업 시작 - 대상 {n}건",
+    "결제 웹훅 응답 시간 초과",
+    "리포트 생성 중 오류가 발생했습니다",
+    "재시도 중입니다 (2/3)",
+]
+
+EN_SUBJECTS = ["Daily Report", "Password Reset", "Error Notification", "Weekly Summary", "Invoice #{n}"]
+KO_SUBJECTS = ["일일 리포트", "비밀번호 재설정 안내", "오류 알림", "주간 요약", "청구서 안내 #{n}"]
+
+DOMAINS = ["example.com", "example.co.kr", "mail.test", "corp.example"]
+
+
+def _mix(rng: np.random.Generator, mix: Dict[str, float], n: int) -> np.ndarray:
+    names = list(mix)
+    p = np.asarray([mix[k] for k in names], dtype=float)
+    return rng.choice(names, size=n, p=p / p.sum())
+
+
+def _timestamps(rng: np.random.Generator, n: int, days: int, end: pd.Timestamp, ordered: str) -> pd.DatetimeIndex:
+    """end 이전 days 일 구간에 고르게 퍼진 timestamp (ordered: desc / asc / random)"""
+    offsets = rng.integers(0, days * 86_400_000, size=n)
+    ts = end - pd.to_timedelta(offsets, unit="ms")
+    if ordered == "desc":
+        ts = ts.sort_values(ascending=False)
+    elif ordered == "asc":
+        ts = ts.sort_values()
+    return ts
+
+
+def _texts(
+    rng: np.random.Generator,
+    n: int,
+    en: list,
+    ko: list,
+    korean_rate: float,
+    keyword: Optional[str],
+    keyword_rate: float,
+) -> np.ndarray:
+    """템플릿 문장 + 숫자로 만든 문장 배열 (keyword_rate 비율 행에는 keyword 를 덧붙임)"""
+    # 템플릿 × 숫자 조합을 미리 만들어 두고 인덱스로 뽑는다 (n 이 커도 문자열 포맷은 몇 천 번만)
+    variants = 64
+    en_pool = [t.format(n=i) for t in en for i in range(variants)]
+    ko_pool = [t.format(n=i) for t in ko for i in range(variants)]
+    if keyword:
+        # keyword 선택도를 정확히 맞추기 위해 템플릿에는 keyword 가 들어간 문장을 뺀다
+        low = keyword.lower()
+        en_pool = [t for t in en_pool if low not in t.lower()] or ["-"]
+        ko_pool = [t for t in ko_pool if low not in t.lower()] or ["-"]
+    pool = np.asarray(en_pool + ko_pool, dtype=object)
+
+    is_ko = rng.random(n) < korean_rate
+    idx = np.where(
+        is_ko,
+        len(en_pool) + rng.integers(0, len(ko_pool), size=n),
+        rng.integers(0, len(en_pool), size=n),
+    )
+    texts = pool[idx]
+
+    if keyword:
+        hit = rng.random(n) < keyword_rate
+        texts[hit] = texts[hit] + f" [{keyword}]"
+    return texts
+
+
+def make_lambda_logs(
+    n: int,
+    days: int = 7,
+    end: pd.Timestamp = DEFAULT_END,
+    level_mix: Optional[Dict[str, float]] = None,
+    keyword: Optional[str] = None,
+    keyword_rate: float = 0.01,
+    korean_rate: float = 0.3,
+    ordered: str = "desc",
+    seed: int = 0,
+) -> pd.DataFrame:
+    """LAMBDA_SCHEMA 컬럼의 n 행 로그"""
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame(
+        {
+            "timestamp": _timestamps(rng, n, days, end, ordered),
+            "function_name": rng.choice(FUNCTION_NAMES, size=n),
+            "level": _mix(rng, level_mix or LEVEL_MIX, n),
+            "message": _texts(rng, n, EN_MESSAGES, KO_MESSAGES, korean_rate, keyword, keyword_rate),
+            "request_id": np.char.add("req-", np.arange(n).astype(str)).astype(object),
+        }
+    )
+
+
+def make_ses_logs(
+    n: int,
+    days: int = 7,
+    end: pd.Timestamp = DEFAULT_END,
+    status_mix: Optional[Dict[str, float]] = None,
+    keyword: Optional[str] = None,
+    keyword_rate: float = 0.01,
+    korean_rate: float = 0.3,
+    ordered: str = "desc",
+    seed: int = 0,
+) -> pd.DataFrame:
+    """SES_SCHEMA 컬럼의 n 행 로그 (event_type 은 status 에 맞춰 채움)"""
+    rng = np.random.default_rng(seed)
+    status = _mix(rng, status_mix or STATUS_MIX, n)
+    users = np.char.add("user", rng.integers(0, 50_000, size=n).astype(str))
+    domains = rng.choice(DOMAINS, size=n)
+    return pd.DataFrame(
+        {
+            "timestamp": _timestamps(rng, n, days, end, ordered),
+            "mail_to": np.char.add(np.char.add(users, "@"), domains).astype(object),
+            "subject": _texts(rng, n, EN_SUBJECTS, KO_SUBJECTS, korean_rate, keyword, keyword_rate),
+            "status": status,
+            "event_type": pd.Series(status).map(EVENT_BY_STATUS).to_numpy(),
+            "message_id": np.char.add("msg-", np.arange(n).astype(str)).astype(object),
+        }
+    )
+
+
+LAW_NAMES = [
+    "산업안전보건법 시행령", "화학물질관리법 시행규칙", "고압가스안전관리법", "개인정보 보호법",
+    "전자상거래법 시행령", "근로기준법", "중대재해처벌법 시행령", "정보통신망법", "소방시설법 시행규칙",
+]
+LAW_ACTIONS = ["일부 개정", "전부 개정", "시행령 개정", "고시 개정", "신설"]
+LAW_TOPICS = [
+    "안전관리 규정 강화", "정기 점검 주기 변경", "저장탱크 설치 기준 구체화", "개인정보 파기 절차 변경",
+    "사전 공지 의무 신설", "보고 기한 단축", "과태료 부과 기준 상향", "교육 이수 의무 확대",
+]
+LAW_SENTENCES = [
+    "홈페이지 첫 화면 공개 의무가 신설됩니다.",
+    "변경 시 {n}일 전 사전 공지 의무가 생깁니다.",
+    "취급시설의 정기 점검 주기가 {n}개월로 바뀝니다.",
+    "위반 시 과태료가 최대 {n}천만 원으로 상향됩니다.",
+    "관리 책임자 지정과 교육 이수가 의무화됩니다.",
+    "보고 기한이 {n}일 이내로 단축됩니다.",
+]
+RISK_MIX: Dict[str, float] = {"high": 0.2, "medium": 0.5, "low": 0.3}
+
+
+def make_reports(n: int, days: int = 365, end: pd.Timestamp = DEFAULT_END, seed: int = 0) -> list:
+    """법령 분석 리포트 dict n 개 (backend.reports 저장소 형식, 한글 본문)"""
+    rng = np.random.default_rng(seed)
+    dates = _timestamps(rng, n, days, end, "asc").strftime("%Y-%m-%d")
+    laws = rng.choice(LAW_NAMES, size=n)
+    actions = rng.choice(LAW_ACTIONS, size=n)
+    topics = rng.choice(LAW_TOPICS, size=n)
+    risks = _mix(rng, RISK_MIX, n)
+    sentences = rng.integers(0, len(LAW_SENTENCES), size=(n, 3))
+    numbers = rng.integers(1, 30, size=(n, 3))
+    reports = []
+    for i in range(n):
+        before, after, summary = (LAW_SENTENCES[s].format(n=k) for s, k in zip(sentences[i], numbers[i]))
+        reports.append(
+            {
+                "id": str(i + 1),
+                "lawName": laws[i],
+                "title": f"{laws[i]} {actions[i]}에 따른 {topics[i]}",
+                "publishDate": dates[i],
+                "summary": summary,
+                "beforeChange": before,
+                "afterChange": after,
+                "riskAnalysis": {"level": risks[i], "description": "", "concerns": []},
+            }
+        )
+    return reports